@@ -52,6 +52,9 @@ class DaapServer(object):
                 "Cannot start server because the provider has no databases to "
                 "publish.")
 
+        # Start loading lazy collections in the background.
+        self.provider.prefetch()
+
         # Create WSGI server and run it.
         self.server = WSGIServer((self.ip, self.port), application=self.app)
 
@@ -0,0 +1,333 @@
+from daapserver.utils import CacheDirectory
+
+import hashlib
+import cStringIO
+import collections
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+__all__ = ("ArtworkCache", "read_data", "guess_mimetype", "resize")
+
+# Magic bytes of common image formats.
+SIGNATURES = [
+    ("\xff\xd8\xff", "image/jpeg"),
+    ("\x89PNG\r\n\x1a\n", "image/png"),
+    ("GIF87a", "image/gif"),
+    ("GIF89a", "image/gif"),
+]
+
+
+class ArtworkCache(object):
+    """
+    Cache of artwork, resized to the requested dimensions. Artwork is
+    deduplicated by the hash of its content, so a cover that is shared by all
+    items of an album is resized and stored once.
+
+    Artwork is kept in memory, and optionally on disk, both bounded by the
+    number of bytes. Resizing requires Pillow. Without it, artwork is cached
+    as is.
+
+    If a thread pool is given, artwork is hashed, resized, read from disk and
+    written to disk by its threads, so the event loop is not blocked.
+    """
+
+    def __init__(self, max_size=16 * 1024 * 1024, directory=None,
+                 max_disk_size=256 * 1024 * 1024, max_sources=65536,
+                 threadpool=None):
+        """
+        Construct a new, empty artwork cache.
+
+        :param int max_size: Maximum number of bytes to keep in memory.
+        :param str directory: Directory to store artwork in. If not set,
+                              artwork is not stored on disk.
+        :param int max_disk_size: Maximum number of bytes to store on disk.
+        :param int max_sources: Maximum number of sources to remember the
+                                content hash of.
+        :param ThreadPool threadpool: Optional gevent thread pool to perform
+                                      blocking calls in.
+        """
+
+        self.max_size = max_size
+        self.max_sources = max_sources
+        self.threadpool = threadpool
+        self.size = 0
+
+        self.variants = collections.OrderedDict()
+        self.sources = collections.OrderedDict()
+
+        if directory is not None:
+            self.disk = CacheDirectory(directory, max_disk_size)
+        else:
+            self.disk = None
+
+    def __len__(self):
+        """
+        Return the number of variants in memory.
+        """
+
+        return len(self.variants)
+
+    def get(self, source_key, load, width=None, height=None):
+        """
+        Return artwork, resized to fit the given dimensions. The source
+        artwork is only loaded if the content hash of `source_key' is unknown,
+        or if the variant is not cached.
+
+        :param object source_key: Identifies the source artwork, e.g. the file
+                                  name and its modification time. The key
+                                  should change when the artwork changes.
+        :param callable load: Returns the source artwork as a tuple of the
+                              form (data, mimetype, size).
+        :param int width: Maximum width, or None for any width.
+        :param int height: Maximum height, or None for any height.
+        :return: Tuple of (data, mimetype, size).
+        :rtype tuple:
+        """
+
+        digest = self.sources.pop(source_key, None)
+
+        if digest is not None:
+            self.sources[source_key] = digest
+            variant = self.lookup(variant_key(digest, width, height))
+
+            if variant is not None:
+                return variant[0], variant[1], len(variant[0])
+
+        data, mimetype, _ = load()
+
+        # Files are read in the thread pool, iterators read themselves.
+        if hasattr(data, "read"):
+            data = self.call(read_data, data)
+        else:
+            data = read_data(data)
+
+        # Remember the content hash of the source.
+        digest = self.call(content_hash, data)
+
+        self.sources[source_key] = digest
+
+        while len(self.sources) > self.max_sources:
+            self.sources.popitem(last=False)
+
+        # Another source may have the same content.
+        key = variant_key(digest, width, height)
+        variant = self.lookup(key)
+
+        if variant is None:
+            if width or height:
+                data, mimetype = self.call(
+                    resize, data, mimetype, width, height)
+
+            variant = data, mimetype or guess_mimetype(data)
+            self.store(key, variant)
+
+        return variant[0], variant[1], len(variant[0])
+
+    def etag(self, source_key, width=None, height=None):
+        """
+        Return an entity tag for a variant, if the content hash of the source
+        is known. The entity tag is the key of the variant.
+
+        :param object source_key: Identifies the source artwork.
+        :param int width: Maximum width, or None for any width.
+        :param int height: Maximum height, or None for any height.
+        :return: The entity tag, or None if the content hash is unknown.
+        :rtype str:
+        """
+
+        digest = self.sources.get(source_key)
+
+        if digest is not None:
+            return variant_key(digest, width, height)
+
+    def lookup(self, key):
+        """
+        Return a variant from memory, or from disk. Variants that are loaded
+        from disk are kept in memory.
+
+        :param str key: Key of the variant.
+        :return: Tuple of (data, mimetype), or None if not cached.
+        :rtype tuple:
+        """
+
+        variant = self.variants.pop(key, None)
+
+        if variant is not None:
+            self.variants[key] = variant
+            return variant
+
+        if self.disk is None or key not in self.disk.entries:
+            return
+
+        entry = self.disk.get(key)
+        data = self.call(read_file, entry.file_name)
+
+        variant = data, guess_mimetype(data)
+        self.store(key, variant, disk=False)
+
+        return variant
+
+    def store(self, key, variant, disk=True):
+        """
+        Store a variant in memory and on disk. The least recently used
+        variants in memory are dropped, to keep at most `max_size' bytes.
+
+        :param str key: Key of the variant.
+        :param tuple variant: Tuple of (data, mimetype).
+        :param bool disk: Whether to store the variant on disk.
+        """
+
+        data, _ = variant
+
+        if len(data) <= self.max_size:
+            self.variants[key] = variant
+            self.size += len(data)
+
+            while self.size > self.max_size:
+                _, (old, _) = self.variants.popitem(last=False)
+                self.size -= len(old)
+
+        if disk and self.disk is not None:
+            entry = self.disk.get(key)
+            entry.writing = True
+
+            try:
+                self.call(write_file, entry.file_name, data)
+
+                self.disk.grow(entry, len(data))
+                self.disk.finish(entry)
+            finally:
+                entry.writing = False
+
+    def call(self, function, *args):
+        """
+        Invoke a blocking function, in the thread pool if there is one.
+        """
+
+        if self.threadpool is None:
+            return function(*args)
+
+        return self.threadpool.apply(function, args)
+
+
+def variant_key(digest, width, height):
+    """
+    Return the key of a variant of artwork. The key is a valid file name.
+    """
+
+    return "%s-%dx%d" % (digest, width or 0, height or 0)
+
+
+def content_hash(data):
+    """
+    Return the hexadecimal SHA1 hash of artwork.
+    """
+
+    return hashlib.sha1(data).hexdigest()
+
+
+def read_file(file_name):
+    """
+    Return the contents of a file.
+    """
+
+    with open(file_name, "rb") as fp:
+        return fp.read()
+
+
+def write_file(file_name, data):
+    """
+    Write data to a file, replacing its contents.
+    """
+
+    with open(file_name, "wb") as fp:
+        fp.write(data)
+
+
+def read_data(data):
+    """
+    Read all bytes of the data of an item or artwork, which can be an
+    iterator, file descriptor or raw bytes. Files and iterators are closed
+    afterwards.
+
+    :param object data: Data to read.
+    :return: The bytes read.
+    :rtype str:
+    """
+
+    if isinstance(data, basestring):
+        return data
+
+    try:
+        if hasattr(data, "read"):
+            return data.read()
+
+        return "".join(data)
+    finally:
+        if hasattr(data, "close"):
+            data.close()
+
+
+def guess_mimetype(data):
+    """
+    Guess the mimetype of an image, based on its first bytes.
+
+    :param str data: Image data.
+    :return: The mimetype, or None if unknown.
+    :rtype str:
+    """
+
+    for signature, mimetype in SIGNATURES:
+        if data.startswith(signature):
+            return mimetype
+
+
+def resize(data, mimetype, width=None, height=None, quality=85):
+    """
+    Resize an image to fit within the given dimensions, keeping the aspect
+    ratio. Images are never enlarged. Images with transparency are encoded as
+    PNG, other images as JPEG.
+
+    If Pillow is not installed, or if the image cannot be read, the image is
+    returned as is.
+
+    :param str data: Image data.
+    :param str mimetype: Mimetype of the image.
+    :param int width: Maximum width, or None for any width.
+    :param int height: Maximum height, or None for any height.
+    :param int quality: JPEG quality.
+    :return: Tuple of (data, mimetype).
+    :rtype tuple:
+    """
+
+    if Image is None:
+        return data, mimetype
+
+    try:
+        image = Image.open(cStringIO.StringIO(data))
+        image.load()
+    except IOError:
+        return data, mimetype
+
+    size = (width or image.size[0], height or image.size[1])
+
+    if image.size[0] <= size[0] and image.size[1] <= size[1]:
+        return data, mimetype
+
+    image.thumbnail(size, Image.ANTIALIAS)
+    output = cStringIO.StringIO()
+
+    if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+        image.save(output, "PNG", optimize=True)
+
+        return output.getvalue(), "image/png"
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    image.save(output, "JPEG", quality=quality, optimize=True)
+
+    return output.getvalue(), "image/jpeg"
@@ -1,4 +1,9 @@
-from daapserver.revision cimport RevisionStore
+from daapserver.revision cimport RevisionStore, Entry
+
+
+cdef class Patch(object):
+    cdef readonly object value
+    cdef readonly dict fields
 
 
 cdef class ImmutableCollection(object):
@@ -11,9 +16,19 @@ cdef class MutableCollection(ImmutableCollection):
     pass
 
 
+cdef class LazyCollectionRevision(ImmutableCollection):
+    cdef readonly object collection
+
+
 cdef class LazyMutableCollection(MutableCollection):
     cdef public bint busy
     cdef public bint ready
     cdef readonly bint modified
+    cdef readonly bint evicted
     cdef public pending_commit
     cdef public object iter_item
+    cdef readonly object resident
+    cdef readonly set pinned
+    cdef public double last_access
+    cdef readonly object prefetcher
+    cdef readonly object idle_timer
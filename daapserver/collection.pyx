@@ -1,3 +1,46 @@
+import collections
+import gevent
+import time
+import copy
+
+
+cdef class Patch(object):
+    """
+    Fields of an older revision of a value that was updated in place. Only the
+    fields that changed are stored, instead of a full copy of the value.
+    """
+
+    def __init__(self, object value, dict fields):
+        """
+        Construct a new patch.
+
+        :param object value: The current value.
+        :param dict fields: Values of the fields for this revision.
+        """
+
+        self.value = value
+        self.fields = fields
+
+    property id:
+        def __get__(self):
+            return self.value.id
+
+    def resolve(self):
+        """
+        Return a copy of the current value, with the fields of this patch
+        applied.
+
+        :return: Value of this revision.
+        """
+
+        result = copy.copy(self.value)
+
+        for key, value in self.fields.iteritems():
+            setattr(result, key, value)
+
+        return result
+
+
 cdef class ImmutableCollection(object):
 
     __slots__ = ()
@@ -32,7 +75,7 @@ cdef class ImmutableCollection(object):
         """
 
         try:
-            return self.store.get(key, revision=self.revision)
+            return self.store.get(key, revision=self.revision) is not None
         except KeyError:
             return False
 
@@ -40,7 +83,12 @@ cdef class ImmutableCollection(object):
         """
         """
 
-        return self.store.get(key, revision=self.revision)
+        item = self.store.get(key, revision=self.revision)
+
+        if type(item) is Patch:
+            return (<Patch> item).resolve()
+
+        return item
 
     def __len__(self):
         """
@@ -102,8 +150,16 @@ cdef class ImmutableCollection(object):
         """
         """
 
-        for item in self.store.iterate(revision=self.revision):
-            yield item
+        # Patches only exist in the history of a value.
+        if self.revision == -1:
+            for item in self.store.iterate():
+                yield item
+        else:
+            for item in self.store.iterate(revision=self.revision):
+                if type(item) is Patch:
+                    yield (<Patch> item).resolve()
+                else:
+                    yield item
 
     def keys(self):
         """
@@ -117,6 +173,34 @@ cdef class ImmutableCollection(object):
 
         return list(self.itervalues())
 
+    def find(self, field, value):
+        """
+        Yield the items with `value' for `field', using the index created by
+        `create_index(field)'.
+
+        :param str field: Indexed field.
+        :param object value: Value to look up.
+        """
+
+        for key in self.store.find(field, value, revision=self.revision):
+            yield self[key]
+
+    def find_one(self, field, value):
+        """
+        Return the first item with `value' for `field', using the index
+        created by `create_index(field)'.
+
+        :param str field: Indexed field.
+        :param object value: Value to look up.
+        :return: The item.
+        :raises KeyError: If no item has the value.
+        """
+
+        for item in self.find(field, value):
+            return item
+
+        raise KeyError("No item with %s '%s'." % (field, value))
+
     def updated(self, other):
         """
         """
@@ -162,6 +246,123 @@ cdef class MutableCollection(ImmutableCollection):
 
         self.store.remove(item.id)
 
+    def create_index(self, field, bint unique=False):
+        """
+        Create an index on a field of the items, to look up items with
+        `find()' and `find_one()'. The index is maintained on add, remove and
+        update, and can be used for all revisions that are kept.
+
+        :param str field: Field to index.
+        :param bool unique: If True, at most one item can have a value in the
+                            latest revision.
+        """
+
+        self.store.create_index(field, self.index_function(field), unique)
+
+    def index_function(self, field):
+        """
+        Return the function that returns the value of `field' of a stored
+        value.
+
+        :param str field: Field to index.
+        :return: Function that accepts a stored value.
+        :rtype callable:
+        """
+
+        def function(value):
+            if type(value) is Patch:
+                try:
+                    return (<Patch> value).fields[field]
+                except KeyError:
+                    value = (<Patch> value).value
+
+            return getattr(value, field)
+
+        return function
+
+    def update(self, key, **fields):
+        """
+        Update fields of the item with `key' in place, and record it as
+        changed. Older revisions of the item keep a patch with the previous
+        values of the changed fields, instead of a full copy of the item.
+
+        :param object key: Key of the item to update.
+        :param dict fields: Fields to update.
+        :return: The updated item.
+        """
+
+        cdef Entry entry
+        cdef Patch patch
+        cdef dict previous
+
+        if "id" in fields:
+            raise ValueError("The ID of an item cannot be updated.")
+
+        item = self[key]
+        previous = {name: getattr(item, name) for name in fields}
+
+        # Check unique indexes before anything is changed.
+        if self.store.indexes:
+            candidate = copy.copy(item)
+
+            for name, value in fields.iteritems():
+                setattr(candidate, name, value)
+
+            self.store.check_unique(key, candidate)
+
+        # Record the change, unless it is already recorded for this revision.
+        entry = self.store.lookup[key]
+
+        if entry.revision != self.store.revision:
+            self.add(item)
+            entry = self.store.lookup[key]
+
+        # Replace the older entries by patches. Existing patches already
+        # contain the value of fields changed since.
+        entry = entry.elder
+
+        while entry is not None:
+            if entry.value is item:
+                entry.value = Patch(item, dict(previous))
+            elif type(entry.value) is Patch:
+                patch = entry.value
+
+                if patch.value is item:
+                    for name, value in previous.iteritems():
+                        patch.fields.setdefault(name, value)
+
+            entry = entry.elder
+
+        self.store.unindex(key)
+
+        for name, value in fields.iteritems():
+            setattr(item, name, value)
+
+        self.store.reindex(key)
+
+        return item
+
+
+cdef class LazyCollectionRevision(ImmutableCollection):
+    """
+    Revision of a lazy collection. Not all items may be resident, so the
+    number of items is derived from `count()' of the collection, corrected
+    for the changes since this revision.
+    """
+
+    __slots__ = ImmutableCollection.__slots__
+
+    def __len__(self):
+        """
+        """
+
+        cdef LazyMutableCollection collection = self.collection
+
+        if collection is None or (collection.ready and not collection.evicted):
+            return super(LazyCollectionRevision, self).__len__()
+
+        return collection.count() - self.store.count_change(self.revision)
+
 
 cdef class LazyMutableCollection(MutableCollection):
     """
@@ -174,21 +375,77 @@ cdef class LazyMutableCollection(MutableCollection):
     method that yield all items, or (re-)loads `item_ids'. Furthermore, a
     `count()' method is required to provide a count method that efficiently
     returns the number of objects in this collection.
+
+    By setting `point_loading' to True, a miss will only load the requested
+    item via `load([item_id])', instead of loading all items. In that case,
+    `load(item_ids)' should yield the requested items that exist, and skip the
+    ones that do not exist.
+
+    The number of items kept in memory can be bounded by setting
+    `max_resident_items' (requires `point_loading'). The least recently used
+    items will be evicted, and reloaded transparently when requested again.
+    In this mode, `load()' should not re-add items that are still resident
+    (e.g. `item_id in self.store').
+
+    Setting `preload' to True allows the provider to load the items in the
+    background (see `prefetch()'), for instance at startup or when a client
+    logs in. Setting `idle_timeout' unloads the items when the collection has
+    not been accessed for that many seconds. Items are reloaded when needed,
+    which also requires `load()' to not re-add items that are still resident.
     """
 
     __slots__ = MutableCollection.__slots__
 
+    # Class type for older versions.
+    old_revision_class = LazyCollectionRevision
+
+    # Load single items on a miss, instead of loading all items.
+    point_loading = False
+
+    # Maximum number of items kept in memory. Zero means unbounded.
+    max_resident_items = 0
+
+    # Load all items in the background when prefetching.
+    preload = False
+
+    # Number of seconds without access before unloading. Zero means never.
+    idle_timeout = 0
+
     def __init__(self, *args, **kwargs):
         """
         """
 
         super(LazyMutableCollection, self).__init__(*args, **kwargs)
 
+        if self.max_resident_items > 0 and not self.point_loading:
+            raise ValueError(
+                "Bounding the number of resident items requires point "
+                "loading.")
+
         self.busy = False
         self.ready = False
         self.modified = False
+        self.evicted = False
         self.pending_commit = -1
         self.iter_item = None
+        self.resident = collections.OrderedDict()
+        self.pinned = set()
+        self.last_access = 0.0
+        self.prefetcher = None
+        self.idle_timer = None
+
+    def __call__(self, int revision=-1):
+        """
+        Return a copy of this instance with a different revision number. The
+        copy counts the items using `count()'.
+        """
+
+        result = super(LazyMutableCollection, self).__call__(revision)
+
+        if isinstance(result, LazyCollectionRevision):
+            (<LazyCollectionRevision> result).collection = self
+
+        return result
 
     def count(self):
         """
@@ -210,35 +467,189 @@ cdef class LazyMutableCollection(MutableCollection):
 
         raise NotImplementedError("Needs to be overridden.")
 
+    def prefetch(self):
+        """
+        Load all items in the background, using a greenlet. Requests for items
+        that are not resident will wait for the greenlet to finish.
+
+        Bounded collections are not prefetched, since the items would be
+        evicted anyway.
+
+        :return: The greenlet that loads the items, or None if there is
+                 nothing to load.
+        :rtype gevent.Greenlet:
+        """
+
+        if (self.ready and not self.evicted) or self.busy or \
+                self.max_resident_items > 0:
+            return
+
+        if self.prefetcher is None:
+            self.prefetcher = gevent.spawn(self._prefetch)
+
+        return self.prefetcher
+
+    def _prefetch(self):
+        """
+        Greenlet body of `prefetch()'.
+        """
+
+        try:
+            for _ in self.itervalues():
+                pass
+        finally:
+            self.prefetcher = None
+
+    def join_prefetch(self):
+        """
+        Wait for a running prefetch greenlet to finish, unless invoked from
+        that greenlet.
+        """
+
+        cdef object prefetcher = self.prefetcher
+
+        if prefetcher is not None and prefetcher is not gevent.getcurrent():
+            prefetcher.join()
+
+    def unload(self):
+        """
+        Evict all items that can be evicted, e.g. items that do not carry
+        required revision history. Evicted items are reloaded when needed.
+        """
+
+        if self.busy:
+            return
+
+        for key in self.store.lookup.keys():
+            if self.store.evict(key):
+                self.evicted = True
+                self.resident.pop(key, None)
+                self.pinned.discard(key)
+
+    def _unload_when_idle(self):
+        """
+        Greenlet body that unloads this collection after `idle_timeout'
+        seconds without access.
+        """
+
+        cdef double remaining
+
+        try:
+            while True:
+                remaining = self.last_access + self.idle_timeout - time.time()
+
+                if remaining <= 0:
+                    break
+
+                gevent.sleep(remaining)
+
+            self.unload()
+        finally:
+            self.idle_timer = None
+
+    def accessed(self):
+        """
+        Record the access time and start the idle timer, if `idle_timeout' is
+        set.
+        """
+
+        if self.idle_timeout > 0:
+            self.last_access = time.time()
+
+            if self.idle_timer is None:
+                self.idle_timer = gevent.spawn_later(
+                    self.idle_timeout, self._unload_when_idle)
+
+    def touch(self, key):
+        """
+        Mark `key' as most recently used. If there are more resident items
+        than `max_resident_items', the least recently used ones are evicted.
+
+        :param object key: Key of the item that was used.
+        """
+
+        self.accessed()
+
+        if self.max_resident_items <= 0:
+            return
+
+        self.pinned.discard(key)
+        self.resident.pop(key, None)
+        self.resident[key] = True
+
+        if len(self.resident) > self.max_resident_items:
+            self.evict()
+
+    def evict(self):
+        """
+        Evict the least recently used items until at most
+        `max_resident_items' items are resident. Items that carry revision
+        history cannot be evicted yet. They are set aside until the next
+        clean, so they are not scanned over and over again.
+        """
+
+        cdef int excess = len(self.resident) - self.max_resident_items
+
+        while excess > 0 and self.resident:
+            key, _ = self.resident.popitem(last=False)
+
+            if self.store.evict(key):
+                self.evicted = True
+                excess -= 1
+            else:
+                self.pinned.add(key)
+
+    def load_missing(self, item_ids):
+        """
+        Point-load `item_ids' that are not in the store. The items did not
+        change, so they are backdated to not show up as changed in diffs.
+
+        :param list item_ids: Item IDs to load.
+        """
+
+        for item in self.load(item_ids):
+            self.store.backdate(item.id)
+            self.touch(item.id)
+
     def update_ids(self, item_ids):
         """
         """
 
-        # Don't update if this instance isn't ready.
-        if not self.ready:
+        # Don't update if this instance isn't ready. In point loading mode,
+        # the (non-resident) items are loaded to record the change.
+        if not self.ready and not self.point_loading:
             return
 
-        for _ in self.load(item_ids):
-            pass
+        for item in self.load(item_ids):
+            self.touch(item.id)
 
     def remove_ids(self, item_ids):
         """
         """
 
-        # Don't remove items if this instance isn't ready.
-        if not self.ready:
+        # Don't remove items if this instance isn't ready. In point loading
+        # mode, non-resident items are loaded first, so the removal is recorded
+        # against the previous value. Therefore, invoke this method before the
+        # items are removed from the backend.
+        if not self.ready and not self.point_loading:
             return
 
+        if self.point_loading:
+            self.load_missing([
+                item_id for item_id in item_ids
+                if item_id not in self.store.lookup])
+
         for item_id in item_ids:
-            self.store.remove(item_id)
+            if item_id in self.store.lookup:
+                self.store.remove(item_id)
 
     def commit(self, int revision):
         """
         """
 
         # Store commit if not yet ready. It will be commited when items are
-        # loaded.
-        if self.modified and not self.ready:
+        # loaded. In point loading mode, there is no need to wait.
+        if self.modified and not self.ready and not self.point_loading:
             self.pending_commit = revision
         else:
             super(LazyMutableCollection, self).commit(revision)
@@ -252,35 +663,65 @@ cdef class LazyMutableCollection(MutableCollection):
 
         super(LazyMutableCollection, self).clean(revision)
 
+        # Items set aside may be evictable now.
+        if self.pinned:
+            for key in self.pinned:
+                self.resident[key] = True
+
+            self.pinned.clear()
+
+            if len(self.resident) > self.max_resident_items:
+                self.evict()
+
     def add(self, item):
         """
         """
 
         self.modified = True
         super(LazyMutableCollection, self).add(item)
+        self.touch(item.id)
 
-    def remove(self, item):
+    def create_index(self, field, bint unique=False):
         """
+        Create an index on a field of the items. Only resident items are
+        indexed, so all items are loaded by `find()'. Collections that bound
+        the number of resident items cannot be indexed.
         """
 
-        self.modified = True
-        super(LazyMutableCollection, self).remove(item)
+        if self.max_resident_items > 0:
+            raise ValueError(
+                "Indexes require all items to be resident, which is not "
+                "possible if the number of resident items is bounded.")
 
-    def __contains__(self, key):
+        super(LazyMutableCollection, self).create_index(field, unique)
+
+    def find(self, field, value):
         """
+        Yield the items with `value' for `field'. All items are loaded first,
+        if they are not resident.
         """
 
-        if not self.ready:
-            for _ in self.load():
-                pass
+        if not self.ready or self.evicted:
+            self.join_prefetch()
 
-        return super(LazyMutableCollection, self).__contains__(key)
+            if not self.ready or self.evicted:
+                for _ in self.itervalues():
+                    pass
+
+        return super(LazyMutableCollection, self).find(field, value)
+
+    def remove(self, item):
+        """
+        """
+
+        self.modified = True
+        super(LazyMutableCollection, self).remove(item)
 
     def __len__(self):
         """
         """
 
-        if not self.ready:
+        if not self.ready or self.evicted:
             return self.count()
 
         return super(LazyMutableCollection, self).__len__()
@@ -289,9 +730,19 @@ cdef class LazyMutableCollection(MutableCollection):
         """
         """
 
-        if not self.ready:
-            for _ in self.load():
-                pass
+        if not self.ready or self.evicted:
+            if key in self.store:
+                self.touch(key)
+                return True
+
+            self.join_prefetch()
+
+            if self.point_loading:
+                if key not in self.store.lookup:
+                    self.load_missing([key])
+            elif not self.ready or self.evicted:
+                for _ in self.itervalues():
+                    pass
 
         return super(LazyMutableCollection, self).__contains__(key)
 
@@ -302,33 +753,66 @@ cdef class LazyMutableCollection(MutableCollection):
         if self.busy and self.iter_item.id == key:
             return self.iter_item
 
-        if not self.ready:
+        if not self.ready or self.evicted:
             try:
-                return super(LazyMutableCollection, self).__getitem__(key)
+                item = super(LazyMutableCollection, self).__getitem__(key)
             except KeyError:
-                for _ in self.load():
-                    pass
+                self.join_prefetch()
+
+                if self.point_loading:
+                    # Only load if the key is absent, not when it has been
+                    # marked as removed.
+                    if key not in self.store.lookup:
+                        self.load_missing([key])
+                elif not self.ready or self.evicted:
+                    for _ in self.itervalues():
+                        pass
+            else:
+                self.touch(key)
+                return item
 
-        return super(LazyMutableCollection, self).__getitem__(key)
+        item = super(LazyMutableCollection, self).__getitem__(key)
+        self.touch(key)
+
+        return item
 
     def iterkeys(self):
         """
         """
 
-        if not self.ready:
-            for item in self.load():
-                yield item.id
-        else:
-            for key in super(LazyMutableCollection, self).iterkeys():
-                yield key
+        for item in self.itervalues():
+            yield item.id
 
     def itervalues(self):
         """
         """
 
-        if not self.ready:
+        cdef dict resident
+
+        if not self.ready or self.evicted:
+            self.join_prefetch()
+
+        if self.ready and not self.evicted:
+            self.accessed()
+
+            for item in super(LazyMutableCollection, self).itervalues():
+                yield item
+        elif self.max_resident_items > 0 or self.evicted:
+            # Items that were (re-)added did not change, so backdate them.
+            # Compare the entries, since items may be evicted while loading.
+            resident = dict(self.store.lookup)
+
             for item in self.load():
+                if self.store.lookup[item.id] is not resident.get(item.id):
+                    self.store.backdate(item.id)
+
+                self.touch(item.id)
                 yield item
+
+            # All items are resident again, unless bounded.
+            if self.max_resident_items <= 0:
+                self.evicted = False
         else:
-            for item in super(LazyMutableCollection, self).itervalues():
+            for item in self.load():
+                self.touch(item.id)
                 yield item
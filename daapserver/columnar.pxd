@@ -0,0 +1,39 @@
+from cpython cimport array
+
+from daapserver.collection cimport MutableCollection
+from daapserver.models cimport Item
+
+
+cdef class ColumnStore(object):
+    cdef readonly int size
+    cdef list free
+
+    cdef array.array fields
+    cdef array.array ids
+    cdef array.array persistent_ids
+    cdef array.array database_ids
+    cdef array.array tracks
+    cdef array.array years
+    cdef array.array bitrates
+    cdef array.array durations
+    cdef array.array file_sizes
+
+    cdef readonly list strings
+    cdef dict offsets
+    cdef list string_columns
+
+    cdef int _offset(self, object value)
+    cdef object _string(self, int offset)
+    cdef tuple _column(self, str column)
+    cdef object _read(self, array.array values, int kind, unsigned int bit,
+                      int row)
+
+    cpdef int append(self, Item item) except -1
+    cpdef Item get(self, int row)
+    cpdef object value(self, int row, str column)
+    cpdef release(self, int row)
+
+
+cdef class ColumnarItemCollection(MutableCollection):
+    cdef readonly ColumnStore columns
+    cdef public int dead
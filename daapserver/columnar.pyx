@@ -0,0 +1,502 @@
+from cpython cimport array
+
+from daapserver.revision cimport Entry
+from daapserver.models cimport FIELD_TRACK, FIELD_YEAR, FIELD_BITRATE, \
+    FIELD_DURATION, FIELD_FILE_SIZE
+from daapserver.models import Database
+
+import array
+
+# Names of the string columns, in the order of `ColumnStore.string_columns'.
+STRING_COLUMNS = (
+    "name", "artist", "album", "album_artist", "file_name", "file_type",
+    "file_suffix", "album_art", "genre")
+
+# Bit of `ColumnStore.fields' for each numeric column.
+NUMERIC_COLUMNS = {
+    "track": FIELD_TRACK,
+    "year": FIELD_YEAR,
+    "bitrate": FIELD_BITRATE,
+    "duration": FIELD_DURATION,
+    "file_size": FIELD_FILE_SIZE,
+}
+
+# Template to allocate arrays of outcomes of predicates with.
+MATCHES = array.array("b")
+
+# Types of the column arrays.
+cdef enum:
+    COLUMN_INT
+    COLUMN_LONG
+    COLUMN_STRING
+
+
+cdef class ColumnStore(object):
+    """
+    Store item fields in column arrays. Each item occupies one row. Strings are
+    stored as offsets in a table of distinct strings, so repeated values (e.g.
+    artist or album) are stored once.
+
+    Rows are not moved, so a row number can be used as a reference to an item.
+    Released rows are reused.
+    """
+
+    def __init__(self):
+        """
+        Construct a new, empty column store.
+        """
+
+        self.size = 0
+        self.free = []
+
+        self.fields = array.array("I")
+        self.ids = array.array("i")
+        self.persistent_ids = array.array("l")
+        self.database_ids = array.array("i")
+        self.tracks = array.array("i")
+        self.years = array.array("i")
+        self.bitrates = array.array("i")
+        self.durations = array.array("i")
+        self.file_sizes = array.array("l")
+
+        self.strings = []
+        self.offsets = {}
+        self.string_columns = [array.array("i") for _ in STRING_COLUMNS]
+
+    def __len__(self):
+        """
+        Return the number of rows in use.
+        """
+
+        return self.size - len(self.free)
+
+    cdef int _offset(self, object value):
+        """
+        Return the offset of `value' in the string table, adding it if
+        required. None is stored as -1.
+        """
+
+        cdef int offset
+
+        if value is None:
+            return -1
+
+        try:
+            return self.offsets[value]
+        except KeyError:
+            offset = len(self.strings)
+
+            self.strings.append(value)
+            self.offsets[value] = offset
+
+            return offset
+
+    cdef object _string(self, int offset):
+        """
+        Return the string at `offset', or None if `offset' is -1.
+        """
+
+        if offset == -1:
+            return None
+
+        return self.strings[offset]
+
+    cpdef int append(self, Item item) except -1:
+        """
+        Store an item in a (new or released) row.
+
+        :param Item item: Item to store.
+        :return: Row number.
+        :rtype int:
+        """
+
+        cdef int row
+        cdef int i
+        cdef array.array column
+
+        values = (
+            item.name, item.artist, item.album, item.album_artist,
+            item.file_name, item.file_type, item.file_suffix, item.album_art,
+            item.genre)
+
+        if self.free:
+            row = self.free.pop()
+
+            self.fields[row] = item.fields
+            self.ids[row] = item.id
+            self.persistent_ids[row] = item.persistent_id
+            self.database_ids[row] = item.database_id
+            self.tracks[row] = item._track
+            self.years[row] = item._year
+            self.bitrates[row] = item._bitrate
+            self.durations[row] = item._duration
+            self.file_sizes[row] = item._file_size
+
+            for i, column in enumerate(self.string_columns):
+                column[row] = self._offset(values[i])
+        else:
+            row = self.size
+            self.size += 1
+
+            self.fields.append(item.fields)
+            self.ids.append(item.id)
+            self.persistent_ids.append(item.persistent_id)
+            self.database_ids.append(item.database_id)
+            self.tracks.append(item._track)
+            self.years.append(item._year)
+            self.bitrates.append(item._bitrate)
+            self.durations.append(item._duration)
+            self.file_sizes.append(item._file_size)
+
+            for i, column in enumerate(self.string_columns):
+                column.append(self._offset(values[i]))
+
+        return row
+
+    cpdef Item get(self, int row):
+        """
+        Return a new `Item' with the fields of a row.
+
+        :param int row: Row number.
+        :return: Item instance.
+        :rtype Item:
+        """
+
+        cdef Item item = Item()
+        cdef list columns = self.string_columns
+
+        item.id = self.ids.data.as_ints[row]
+        item.persistent_id = self.persistent_ids.data.as_longs[row]
+        item.database_id = self.database_ids.data.as_ints[row]
+
+        item.fields = self.fields.data.as_uints[row]
+        item._track = self.tracks.data.as_ints[row]
+        item._year = self.years.data.as_ints[row]
+        item._bitrate = self.bitrates.data.as_ints[row]
+        item._duration = self.durations.data.as_ints[row]
+        item._file_size = self.file_sizes.data.as_longs[row]
+
+        item.name = self._string((<array.array> columns[0]).data.as_ints[row])
+        item.artist = self._string(
+            (<array.array> columns[1]).data.as_ints[row])
+        item.album = self._string(
+            (<array.array> columns[2]).data.as_ints[row])
+        item.album_artist = self._string(
+            (<array.array> columns[3]).data.as_ints[row])
+        item.file_name = self._string(
+            (<array.array> columns[4]).data.as_ints[row])
+        item.file_type = self._string(
+            (<array.array> columns[5]).data.as_ints[row])
+        item.file_suffix = self._string(
+            (<array.array> columns[6]).data.as_ints[row])
+        item.album_art = self._string(
+            (<array.array> columns[7]).data.as_ints[row])
+        item.genre = self._string(
+            (<array.array> columns[8]).data.as_ints[row])
+
+        return item
+
+    cdef tuple _column(self, str column):
+        """
+        Return the array of a column, as a tuple of (array, type, bit), where
+        bit is the bit of `fields' that indicates the value is set, or zero
+        if the value is always set.
+        """
+
+        cdef unsigned int bit
+
+        if column == "id":
+            return self.ids, COLUMN_INT, 0
+        elif column == "persistent_id":
+            return self.persistent_ids, COLUMN_LONG, 0
+        elif column == "database_id":
+            return self.database_ids, COLUMN_INT, 0
+        elif column in NUMERIC_COLUMNS:
+            bit = NUMERIC_COLUMNS[column]
+
+            if bit == FIELD_TRACK:
+                return self.tracks, COLUMN_INT, bit
+            elif bit == FIELD_YEAR:
+                return self.years, COLUMN_INT, bit
+            elif bit == FIELD_BITRATE:
+                return self.bitrates, COLUMN_INT, bit
+            elif bit == FIELD_DURATION:
+                return self.durations, COLUMN_INT, bit
+            else:
+                return self.file_sizes, COLUMN_LONG, bit
+        elif column in STRING_COLUMNS:
+            return self.string_columns[STRING_COLUMNS.index(column)], \
+                COLUMN_STRING, 0
+
+        raise KeyError("Unknown column '%s'." % column)
+
+    cdef object _read(self, array.array values, int kind, unsigned int bit,
+                      int row):
+        """
+        Return the value of a row of a column array, as returned by
+        `_column()'.
+        """
+
+        if bit and not self.fields.data.as_uints[row] & bit:
+            return None
+        elif kind == COLUMN_INT:
+            return values.data.as_ints[row]
+        elif kind == COLUMN_LONG:
+            return values.data.as_longs[row]
+        else:
+            return self._string(values.data.as_ints[row])
+
+    cpdef object value(self, int row, str column):
+        """
+        Return the value of a single column of a row. Use
+        `ColumnarItemCollection.column()' to read a column of many rows.
+
+        :param int row: Row number.
+        :param str column: Column (field) name.
+        :return: Value of the field.
+        """
+
+        values, kind, bit = self._column(column)
+
+        return self._read(values, kind, bit, row)
+
+    cpdef release(self, int row):
+        """
+        Mark a row as unused, so it can be reused for another item. String
+        table entries are not released.
+
+        :param int row: Row number.
+        """
+
+        self.free.append(row)
+
+
+cdef class ColumnarItemCollection(MutableCollection):
+    """
+    Collection of items that stores the item fields in a `ColumnStore'. The
+    revision store maps item IDs to row numbers, so the revisioning works as
+    usual. Items are instantiated on access, and modifying them has no effect
+    unless they are added again.
+
+    Use `column()' and `select()' to process a field for all items at once,
+    without instantiating items.
+
+    Only the fields of `Item' are stored. Subclasses of `Item' with additional
+    fields are not supported.
+    """
+
+    __slots__ = MutableCollection.__slots__
+
+    def __init__(self, parent, store=None, int revision=-1,
+                 ColumnStore columns=None):
+        """
+        """
+
+        super(ColumnarItemCollection, self).__init__(
+            parent, store=store, revision=revision)
+
+        self.columns = ColumnStore() if columns is None else columns
+        self.dead = 0
+
+    def __call__(self, int revision=-1):
+        """
+        Return a copy of this instance with a different revision number. The
+        copy shares the columns.
+        """
+
+        if revision == self.revision:
+            return self
+
+        return ColumnarItemCollection(
+            self.parent, store=self.store, revision=revision,
+            columns=self.columns)
+
+    def __getitem__(self, key):
+        """
+        """
+
+        return self.columns.get(self.store.get(key, revision=self.revision))
+
+    def iterkeys(self):
+        """
+        """
+
+        for row in self.store.iterate(revision=self.revision):
+            yield self.columns.ids.data.as_ints[row]
+
+    def itervalues(self):
+        """
+        """
+
+        for row in self.store.iterate(revision=self.revision):
+            yield self.columns.get(row)
+
+    def column(self, str column):
+        """
+        Return the value of one field, for all items of this revision. The
+        column array is looked up once, and read directly for every row.
+
+        :param str column: Field name (e.g. `artist').
+        :return: List of values.
+        :rtype list:
+        """
+
+        cdef ColumnStore columns = self.columns
+        cdef array.array values
+        cdef int kind
+        cdef unsigned int bit
+        cdef int row
+        cdef list result = []
+
+        values, kind, bit = columns._column(column)
+
+        for row in self.store.values(self.revision):
+            result.append(columns._read(values, kind, bit, row))
+
+        return result
+
+    def select(self, str column, predicate):
+        """
+        Return the IDs of the items of this revision for which `predicate'
+        holds for the value of a field. For string columns, the predicate is
+        evaluated once per distinct string.
+
+        :param str column: Field name (e.g. `year').
+        :param callable predicate: Function that accepts the field value.
+        :return: List of item IDs.
+        :rtype list:
+        """
+
+        cdef ColumnStore columns = self.columns
+        cdef array.array values
+        cdef int kind
+        cdef unsigned int bit
+        cdef int row
+        cdef int index
+        cdef array.array matches
+        cdef list result = []
+
+        values, kind, bit = columns._column(column)
+
+        # Outcome of the predicate per string offset, shifted by one for
+        # None: zero if unknown, one if false and two if true.
+        matches = array.clone(MATCHES, len(columns.strings) + 1, zero=True)
+
+        for row in self.store.values(self.revision):
+            if kind == COLUMN_STRING:
+                index = values.data.as_ints[row] + 1
+
+                if matches.data.as_schars[index] == 0:
+                    matches.data.as_schars[index] = 2 if predicate(
+                        columns._string(index - 1)) else 1
+
+                match = matches.data.as_schars[index] == 2
+            else:
+                match = predicate(columns._read(values, kind, bit, row))
+
+            if match:
+                result.append(columns.ids.data.as_ints[row])
+
+        return result
+
+    def index_function(self, field):
+        """
+        Return the function that returns the value of `field' of a row.
+        """
+
+        cdef ColumnStore columns = self.columns
+
+        values, kind, bit = columns._column(field)
+
+        def function(int row):
+            return columns._read(values, kind, bit, row)
+
+        return function
+
+    def add(self, Item item):
+        """
+        """
+
+        if self.parent is not None:
+            item.intern(self.parent.strings)
+
+        if item.id in self.store.lookup:
+            self.dead += 1
+
+        self.store.add(item.id, self.columns.append(item))
+
+        if self.parent is not None and self.parent.smart_containers:
+            self.parent.item_changed(item)
+
+    def update(self, key, **fields):
+        """
+        Update fields of the item with `key'. The columns are compact, so the
+        updated item is stored in a new row.
+        """
+
+        if "id" in fields:
+            raise ValueError("The ID of an item cannot be updated.")
+
+        item = self[key]
+
+        for name, value in fields.iteritems():
+            setattr(item, name, value)
+
+        self.add(item)
+
+        return item
+
+    def remove(self, item):
+        """
+        """
+
+        self.dead += 1
+        self.store.remove(item.id)
+
+        if self.parent is not None and self.parent.smart_containers:
+            self.parent.item_removed(item)
+
+    def clean(self, int revision):
+        """
+        Clean the revision history, and release rows that are no longer
+        referenced once a quarter of the rows is dead.
+        """
+
+        super(ColumnarItemCollection, self).clean(revision)
+
+        if self.dead * 4 > len(self.columns):
+            self.compact()
+
+    def compact(self):
+        """
+        Release all rows that are not referenced by any revision anymore.
+        """
+
+        cdef Entry entry
+        cdef set referenced = set()
+        cdef int row
+
+        for entry in self.store.lookup.itervalues():
+            while entry is not None:
+                if not entry.removed:
+                    referenced.add(entry.value)
+
+                entry = entry.elder
+
+        released = set(self.columns.free)
+
+        for row in range(self.columns.size):
+            if row not in referenced and row not in released:
+                self.columns.release(row)
+
+        self.dead = 0
+
+
+class ColumnarDatabase(Database):
+    """
+    Database that stores its items in columns.
+    """
+
+    __slots__ = Database.__slots__
+
+    items_collection_class = ColumnarItemCollection
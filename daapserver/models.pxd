@@ -1,24 +1,72 @@
 from daapserver.collection cimport MutableCollection
 
+# Bits of `Item.fields', indicating which numeric fields are not None.
+cdef enum:
+    FIELD_TRACK = 1
+    FIELD_YEAR = 2
+    FIELD_BITRATE = 4
+    FIELD_DURATION = 8
+    FIELD_FILE_SIZE = 16
+
 
 cdef class Server(object):
     cdef public long persistent_id
     cdef public object name
 
+    cdef readonly int revision
+    cdef readonly set dirty
+
     cdef public object databases
 
     cdef _commit(self, int revision)
     cdef _clean(self, int revision)
 
 
+cdef class StringTable(object):
+    cdef dict strings
+    cdef dict encoded
+
+
+cdef class Timeline(object):
+    cdef readonly int revision
+    cdef readonly list entries
+
+    cpdef int publish(self, int server_revision)
+    cpdef int to_local(self, int server_revision)
+    cpdef trim(self, int server_revision)
+
+
+cdef class DatabaseCollection(MutableCollection):
+    pass
+
+
+cdef class ItemCollection(MutableCollection):
+    cdef bint updating
+    cdef public int discarded
+
+
+cdef class ContainerCollection(MutableCollection):
+    pass
+
+
 cdef class Database(object):
     cdef public int id
     cdef public long persistent_id
     cdef public object name
 
+    cdef public StringTable strings
+    cdef public dict smart_containers
+    cdef public Timeline timeline
+
+    cdef readonly Server server
+    cdef readonly int revision
+    cdef readonly set dirty
+
     cdef public object items
     cdef public object containers
 
+    cpdef int sweep_strings(self)
+    cdef bint _changed(self)
     cdef _commit(self, int revision)
     cdef _clean(self, int revision)
 
@@ -28,20 +76,26 @@ cdef class Item(object):
     cdef public long persistent_id
     cdef public int database_id
     cdef public object name
-    cdef public object track
     cdef public object artist
     cdef public object album
     cdef public object album_artist
-    cdef public object year
-    cdef public object bitrate
-    cdef public object duration
-    cdef public object file_size
     cdef public object file_name
     cdef public object file_type
     cdef public object file_suffix
     cdef public object album_art
     cdef public object genre
 
+    # Numeric fields are stored as C types. A bit in `fields' is set if the
+    # field is not None.
+    cdef unsigned int fields
+    cdef int _track
+    cdef int _year
+    cdef int _bitrate
+    cdef int _duration
+    cdef long long _file_size
+
+    cpdef intern(self, StringTable strings)
+
 
 cdef class Container(object):
     cdef public int id
@@ -54,8 +108,9 @@ cdef class Container(object):
 
     cdef public object container_items
 
-    cdef _commit(self, int revision)
-    cdef _clean(self, int revision)
+
+cdef class SmartContainer(Container):
+    cdef public object predicate
 
 
 cdef class ContainerItem(object):
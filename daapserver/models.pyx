@@ -1,13 +1,284 @@
+from daapserver.revision cimport RevisionStore
+
 from daapserver import utils
 
+import functools
 import copy
+import bisect
+import sys
+
+
+cdef class StringTable(object):
+    """
+    Table of interned strings. Fields such as artist or album are repeated for
+    many items, so each distinct value is stored once. The UTF-8 encodings of
+    the values are cached as well, since they are encoded for every listing.
+    """
+
+    def __init__(self):
+        """
+        Construct a new, empty string table.
+        """
+
+        self.strings = {}
+        self.encoded = {}
+
+    def __len__(self):
+        """
+        Return the number of interned strings.
+        """
+
+        return len(self.strings)
+
+    def __contains__(self, value):
+        """
+        Check whether a value has been interned.
+        """
+
+        return value in self.strings
+
+    def intern(self, object value):
+        """
+        Return the interned instance of `value'.
+
+        :param object value: String to intern. None is returned as is.
+        :return: Interned string.
+        """
+
+        if value is None:
+            return None
+
+        return self.strings.setdefault(value, value)
+
+    def encode(self, object value):
+        """
+        Return the UTF-8 encoding of `value'. The encoding is cached if the
+        value has been interned.
+
+        :param object value: String to encode.
+        :return: Encoded string.
+        :rtype str:
+        """
+
+        if type(value) is not unicode:
+            return value
+
+        try:
+            return self.encoded[value]
+        except KeyError:
+            result = value.encode("utf-8")
+
+            if value in self.strings:
+                self.encoded[value] = result
+
+            return result
+
+    def sweep(self, items):
+        """
+        Drop the strings that are not used by `items', e.g. the strings of
+        items that were removed. Items that still use a dropped string keep
+        their instance, but new items will not share it.
+
+        :param iterable items: Items whose strings should be kept.
+        :return: Number of strings dropped.
+        :rtype int:
+        """
+
+        cdef dict strings = {}
+        cdef Item item
+        cdef int count = len(self.strings)
+
+        for item in items:
+            for value in (item.artist, item.album, item.album_artist,
+                          item.file_type, item.file_suffix, item.genre):
+                if value is not None and value in self.strings:
+                    strings[value] = self.strings[value]
+
+        self.strings = strings
+        self.encoded = {
+            value: result for value, result in self.encoded.iteritems()
+            if value in strings}
+
+        return count - len(strings)
+
+
+cdef class Timeline(object):
+    """
+    Revision timeline of a database with its own revision numbers. A new
+    local revision is only published if the database changed. The entries
+    map server revisions to the local revisions that were published at
+    that server revision.
+    """
+
+    def __init__(self):
+        """
+        Construct a new timeline, at local revision 1.
+        """
+
+        self.revision = 1
+        self.entries = [(1, 1)]
+
+    cpdef int publish(self, int server_revision):
+        """
+        Publish a new local revision at a server revision.
+
+        :param int server_revision: Server revision that is published.
+        :return: The new local revision.
+        :rtype int:
+        """
+
+        self.revision += 1
+        self.entries.append((server_revision, self.revision))
+
+        return self.revision
+
+    cpdef int to_local(self, int server_revision):
+        """
+        Return the local revision of a server revision. Revisions -1 (latest)
+        and 0 (none) are returned as is.
+
+        :param int server_revision: Server revision.
+        :return: Local revision.
+        :rtype int:
+        """
+
+        cdef int index
+
+        if server_revision <= 0:
+            return server_revision
+
+        index = bisect.bisect_right(
+            self.entries, (server_revision, sys.maxint))
+
+        return self.entries[max(index - 1, 0)][1]
+
+    cpdef trim(self, int server_revision):
+        """
+        Drop the entries that are not required for server revisions starting
+        at `server_revision'.
+
+        :param int server_revision: Minimal server revision.
+        """
+
+        cdef int index = bisect.bisect_right(
+            self.entries, (server_revision, sys.maxint))
+
+        if index > 1:
+            del self.entries[:index - 1]
+
+
+cdef class ItemCollection(MutableCollection):
+    """
+    Collection of items that interns the repeated string fields of items into
+    the string table of the parent database. The number of items that were
+    removed or replaced is counted, so unused strings can be swept.
+    """
+
+    __slots__ = MutableCollection.__slots__
+
+    def add(self, item):
+        """
+        """
+
+        if isinstance(item, Item):
+            (<Item> item).intern(self.parent.strings)
+
+        if item.id in self.store:
+            self.discarded += 1
+
+        super(ItemCollection, self).add(item)
+
+        # During an update, the item still has its previous values.
+        if (<Database> self.parent).smart_containers and not self.updating:
+            self.parent.item_changed(item)
+
+    def remove(self, item):
+        """
+        """
+
+        super(ItemCollection, self).remove(item)
+        self.discarded += 1
+
+        if (<Database> self.parent).smart_containers:
+            self.parent.item_removed(item)
+
+    def update(self, key, **fields):
+        """
+        Update fields of an item. Smart containers evaluate the item once,
+        after the fields are updated.
+        """
+
+        self.updating = True
+
+        try:
+            item = super(ItemCollection, self).update(key, **fields)
+        finally:
+            self.updating = False
+
+        if isinstance(item, Item):
+            (<Item> item).intern(self.parent.strings)
+
+        self.discarded += 1
+
+        if (<Database> self.parent).smart_containers:
+            self.parent.item_changed(item)
+
+        return item
+
+
+cdef class ContainerCollection(MutableCollection):
+    """
+    Collection of containers that registers smart containers with the parent
+    database, so their membership is maintained when items change.
+    """
+
+    __slots__ = MutableCollection.__slots__
+
+    def add(self, container):
+        """
+        """
+
+        super(ContainerCollection, self).add(container)
+
+        self.parent.attach(container.container_items)
+
+        # A container may replace a smart container with the same ID.
+        if isinstance(container, SmartContainer):
+            self.parent.add_smart_container(container)
+        else:
+            (<Database> self.parent).smart_containers.pop(container.id, None)
+
+    def remove(self, container):
+        """
+        """
+
+        super(ContainerCollection, self).remove(container)
+
+        (<Database> self.parent).smart_containers.pop(container.id, None)
+
+
+cdef class DatabaseCollection(MutableCollection):
+    """
+    Collection of databases that attaches the databases to the parent server,
+    so databases that change are committed and cleaned.
+    """
+
+    __slots__ = MutableCollection.__slots__
+
+    def add(self, database):
+        """
+        """
+
+        super(DatabaseCollection, self).add(database)
+
+        self.parent.attach(database)
 
 
 cdef class Server(object):
 
     __slots__ = ()
 
-    databases_collection_class = MutableCollection
+    databases_collection_class = DatabaseCollection
 
     def __init__(self, **kwargs):
         """
@@ -17,6 +288,8 @@ cdef class Server(object):
         The Server is the only instance that does not require an ID.
         """
 
+        self.revision = 1
+        self.dirty = set()
         self.databases = self.databases_collection_class(self)
 
         for key, value in kwargs.iteritems():
@@ -35,6 +308,8 @@ cdef class Server(object):
         result.persistent_id = self.persistent_id
         result.name = self.name
 
+        result.revision = self.revision
+        result.dirty = self.dirty
         result.databases = self.databases
 
         return result
@@ -73,7 +348,7 @@ cdef class Server(object):
     def commit(self, int revision):
         """
         Propagate a commit to all models that are part of this instance and
-        their children.
+        their children. Only the databases that changed are committed.
 
         :param int revision: Revision to commit to.
         """
@@ -83,38 +358,65 @@ cdef class Server(object):
     def clean(self, int revision):
         """
         Propagate a clean to all models that are part of this instance and
-        their children.
+        their children. Only the databases that changed are cleaned.
 
         :param int revision: Revision to clean up to.
         """
 
         self._clean(revision)
 
+    def attach(self, Database database):
+        """
+        Attach a database to this server, so it is committed and cleaned
+        when it changes.
+
+        :param Database database: Database to attach.
+        """
+
+        database.server = self
+
+        if database.dirty:
+            self.dirty.add(database)
+
     cdef _commit(self, int revision):
         """
         Actual implementation of the commit method. Propagates the commit to
-        items in the collections.
+        the databases that changed.
         """
 
         cdef Database database
 
+        self.revision = revision
         self.databases.commit(revision)
 
-        for database in self.databases.itervalues():
-            database._commit(revision)
+        # Databases with a timeline only publish a new local revision if
+        # they changed. The committed revision is the next one to publish.
+        for database in list(self.dirty):
+            if database.timeline is None:
+                database._commit(revision)
+            elif database._changed():
+                database._commit(database.timeline.publish(revision - 1) + 1)
 
     cdef _clean(self, int revision):
         """
         Actual implementation of the clean method. Propagates the clean to
-        items in the collections.
+        the databases that changed. Databases without history left are
+        forgotten until they change again.
         """
 
         cdef Database database
 
         self.databases.clean(revision)
 
-        for database in self.databases.itervalues():
-            database._clean(revision)
+        for database in list(self.dirty):
+            if database.timeline is None:
+                database._clean(revision)
+            else:
+                database._clean(database.timeline.to_local(revision))
+                database.timeline.trim(revision)
+
+            if not database.dirty:
+                self.dirty.discard(database)
 
     def to_tree(self):
         """
@@ -130,8 +432,13 @@ cdef class Database(object):
 
     __slots__ = ()
 
-    items_collection_class = MutableCollection
-    containers_collection_class = MutableCollection
+    items_collection_class = ItemCollection
+    containers_collection_class = ContainerCollection
+
+    # Keep an own revision timeline, so the collections are only committed
+    # if this database changed. Revisions of the collections are local, use
+    # `to_local_revision()' to translate a server revision.
+    independent_revisions = False
 
     def __init__(self, **kwargs):
         """
@@ -139,9 +446,26 @@ cdef class Database(object):
         attributes of this instance.
         """
 
+        self.strings = StringTable()
+        self.smart_containers = {}
+        self.timeline = Timeline() if self.independent_revisions else None
+
+        self.server = None
+        self.dirty = set()
+
+        # The revision collections are committed to. With a timeline, local
+        # revision 1 is published already, so changes go to the next one.
+        if self.timeline is None:
+            self.revision = 1
+        else:
+            self.revision = self.timeline.revision + 1
+
         self.items = self.items_collection_class(self)
         self.containers = self.containers_collection_class(self)
 
+        self.attach(self.items)
+        self.attach(self.containers)
+
         for key, value in kwargs.iteritems():
             setattr(self, key, value)
 
@@ -159,6 +483,12 @@ cdef class Database(object):
         result.persistent_id = self.persistent_id
         result.name = self.name
 
+        result.strings = self.strings
+        result.smart_containers = self.smart_containers
+        result.timeline = self.timeline
+        result.server = self.server
+        result.revision = self.revision
+        result.dirty = self.dirty
         result.items = self.items
         result.containers = self.containers
 
@@ -196,33 +526,181 @@ cdef class Database(object):
 
         return str(self)
 
+    def to_local_revision(self, int revision):
+        """
+        Translate a server revision to the revision of the collections of
+        this database.
+
+        :param int revision: Server revision.
+        :return: Local revision.
+        :rtype int:
+        """
+
+        if self.timeline is None:
+            return revision
+
+        return self.timeline.to_local(revision)
+
+    def attach(self, collection):
+        """
+        Attach a collection of this database, e.g. the container items of a
+        container, so it is committed and cleaned when it changes. Containers
+        that are added to `containers' are attached automatically.
+
+        :param MutableCollection collection: Collection to attach.
+        """
+
+        collection.store.listener = functools.partial(
+            self.collection_changed, collection)
+
+        if collection.store.changed:
+            self.collection_changed(collection)
+
+    def attach_containers(self):
+        """
+        Attach the container items of the resident containers that are not
+        attached yet.
+        """
+
+        for container in self.containers.store.values():
+            container_items = container.container_items
+
+            if (<RevisionStore> container_items.store).listener is None:
+                self.attach(container_items)
+
+    def collection_changed(self, collection):
+        """
+        Register a collection that changes for the first time since the last
+        commit, so it is committed and cleaned with this database. Collections
+        that did not change are not committed, so the store is committed to
+        the current revision first.
+
+        :param MutableCollection collection: Collection that changes.
+        """
+
+        cdef RevisionStore store = collection.store
+        cdef int revision = self.revision
+
+        if self.timeline is None:
+            revision = self.server.revision if self.server is not None else 0
+
+        if not store.changed and store.revision < revision:
+            store.commit(revision)
+
+        self.dirty.add(collection)
+
+        if self.server is not None:
+            self.server.dirty.add(self)
+
+    cdef bint _changed(self):
+        """
+        Check whether any collection changed since the last commit.
+        """
+
+        for collection in self.dirty:
+            if (<RevisionStore> collection.store).changed:
+                return True
+
+        return False
+
     cdef _commit(self, int revision):
         """
         Actual implementation of the commit method. Propagates the commit to
-        items in the collections.
+        the collections that changed.
         """
 
-        cdef Container container
+        self.revision = revision
 
-        self.items.commit(revision)
-        self.containers.commit(revision)
+        # Containers can be added without `ContainerCollection.add()', e.g.
+        # when a lazy collection loads them. Attach their container items
+        # before committing, so they are not left behind.
+        if self.containers in self.dirty:
+            self.attach_containers()
 
-        for container in self.containers.itervalues():
-            container._commit(revision)
+        for collection in list(self.dirty):
+            collection.commit(revision)
 
     cdef _clean(self, int revision):
         """
         Actual implementation of the clean method. Propagates the clean to
-        items in the collections.
+        the collections that changed. Collections without history left are
+        forgotten until they change again.
+        """
+
+        cdef RevisionStore store
+        cdef ItemCollection items
+
+        for collection in list(self.dirty):
+            collection.clean(revision)
+            store = collection.store
+
+            if not store.changed and not store.dirty:
+                self.dirty.discard(collection)
+
+        # Sweep the strings of removed items, once enough items are removed
+        # or replaced for the sweep to be worth a pass over the items.
+        if isinstance(self.items, ItemCollection):
+            items = self.items
+
+            if items.discarded > 0 and \
+                    items.discarded * 4 >= len(items.store.lookup):
+                self.sweep_strings()
+
+    cpdef int sweep_strings(self):
+        """
+        Drop the interned strings that are not used by the current items
+        anymore. Strings of items that are not resident (e.g. of lazy
+        collections) are dropped too, and are interned again on load.
+
+        :return: Number of strings dropped.
+        :rtype int:
+        """
+
+        if isinstance(self.items, ItemCollection):
+            (<ItemCollection> self.items).discarded = 0
+
+        return self.strings.sweep(self.items.store.values())
+
+    def add_smart_container(self, SmartContainer container):
+        """
+        Register a smart container, so its membership is maintained when items
+        are added, removed or updated. The membership is evaluated for all
+        items, unless the container replaces one with the same predicate.
+
+        :param SmartContainer container: Smart container to register.
+        """
+
+        cdef SmartContainer previous = self.smart_containers.get(container.id)
+
+        self.smart_containers[container.id] = container
+
+        if previous is None or previous.predicate is not container.predicate:
+            container.refresh(self.items)
+
+    def item_changed(self, item):
+        """
+        Re-evaluate the membership of an added or updated item for all smart
+        containers.
+
+        :param Item item: Item that was added or updated.
+        """
+
+        cdef SmartContainer container
+
+        for container in self.smart_containers.itervalues():
+            container.evaluate(item)
+
+    def item_removed(self, item):
         """
+        Remove an item from all smart containers.
 
-        cdef Container container
+        :param Item item: Item that was removed.
+        """
 
-        self.items.clean(revision)
-        self.containers.clean(revision)
+        cdef SmartContainer container
 
-        for container in self.containers.itervalues():
-            container._clean(revision)
+        for container in self.smart_containers.itervalues():
+            container.discard(item.id)
 
     def to_tree(self):
         """
@@ -261,22 +739,94 @@ cdef class Item(object):
         result.persistent_id = self.persistent_id
         result.database_id = self.database_id
         result.name = self.name
-        result.track = self.track
         result.artist = self.artist
         result.album = self.album
         result.album_artist = self.album_artist
-        result.year = self.year
-        result.bitrate = self.bitrate
-        result.duration = self.duration
-        result.file_size = self.file_size
         result.file_name = self.file_name
         result.file_type = self.file_type
         result.file_suffix = self.file_suffix
         result.album_art = self.album_art
         result.genre = self.genre
 
+        result.fields = self.fields
+        result._track = self._track
+        result._year = self._year
+        result._bitrate = self._bitrate
+        result._duration = self._duration
+        result._file_size = self._file_size
+
         return result
 
+    property track:
+        def __get__(self):
+            return self._track if self.fields & FIELD_TRACK else None
+
+        def __set__(self, value):
+            if value is None:
+                self.fields &= ~FIELD_TRACK
+            else:
+                self._track = value
+                self.fields |= FIELD_TRACK
+
+    property year:
+        def __get__(self):
+            return self._year if self.fields & FIELD_YEAR else None
+
+        def __set__(self, value):
+            if value is None:
+                self.fields &= ~FIELD_YEAR
+            else:
+                self._year = value
+                self.fields |= FIELD_YEAR
+
+    property bitrate:
+        def __get__(self):
+            return self._bitrate if self.fields & FIELD_BITRATE else None
+
+        def __set__(self, value):
+            if value is None:
+                self.fields &= ~FIELD_BITRATE
+            else:
+                self._bitrate = value
+                self.fields |= FIELD_BITRATE
+
+    property duration:
+        def __get__(self):
+            return self._duration if self.fields & FIELD_DURATION else None
+
+        def __set__(self, value):
+            if value is None:
+                self.fields &= ~FIELD_DURATION
+            else:
+                self._duration = value
+                self.fields |= FIELD_DURATION
+
+    property file_size:
+        def __get__(self):
+            return self._file_size if self.fields & FIELD_FILE_SIZE else None
+
+        def __set__(self, value):
+            if value is None:
+                self.fields &= ~FIELD_FILE_SIZE
+            else:
+                self._file_size = value
+                self.fields |= FIELD_FILE_SIZE
+
+    cpdef intern(self, StringTable strings):
+        """
+        Replace the repeated string fields by their interned instances of
+        `strings'.
+
+        :param StringTable strings: String table to intern into.
+        """
+
+        self.artist = strings.intern(self.artist)
+        self.album = strings.intern(self.album)
+        self.album_artist = strings.intern(self.album_artist)
+        self.file_type = strings.intern(self.file_type)
+        self.file_suffix = strings.intern(self.file_suffix)
+        self.genre = strings.intern(self.genre)
+
     def __unicode__(self):
         """
         Return an unicode representation of this instance.
@@ -390,30 +940,102 @@ cdef class Container(object):
 
         return str(self)
 
-    cdef _commit(self, int revision):
+    def to_tree(self):
         """
-        Actual implementation of the commit method. Propagates the commit to
-        items in the collections.
+        Generate a tree representation of this object and children.
+
+        :return: Tree representation as a string.
+        :rtype str:
         """
+        return utils.to_tree(self, self.container_items)
 
-        self.container_items.commit(revision)
 
-    cdef _clean(self, int revision):
+cdef class SmartContainer(Container):
+    """
+    Container with membership defined by a predicate over items. The container
+    items are maintained by the database the container is added to: only the
+    items that are added, removed or updated are evaluated.
+
+    The container item of a member has the same ID as the item.
+    """
+
+    __slots__ = Container.__slots__
+
+    def __init__(self, **kwargs):
         """
-        Actual implementation of the clean method. Propagates the clean to
-        items in the collections.
+        Initialize a new SmartContainer. The `predicate' is a callable that
+        accepts an item, and returns True if the item is a member.
         """
 
-        self.container_items.clean(revision)
+        self.is_smart = True
 
-    def to_tree(self):
+        super(SmartContainer, self).__init__(**kwargs)
+
+    def __copy__(self):
         """
-        Generate a tree representation of this object and children.
+        Return a copy of this instance.
 
-        :return: Tree representation as a string.
-        :rtype str:
+        :return: Copy of this instance.
+        :rtype SmartContainer:
         """
-        return utils.to_tree(self, self.container_items)
+
+        cdef SmartContainer result = <SmartContainer> super(
+            SmartContainer, self).__copy__()
+
+        result.predicate = self.predicate
+
+        return result
+
+    def evaluate(self, item):
+        """
+        Add or remove an item, depending on the predicate.
+
+        :param Item item: Item to evaluate.
+        :return: True if the item is a member.
+        :rtype bool:
+        """
+
+        member = item.id in self.container_items
+
+        if self.predicate(item):
+            if not member:
+                self.container_items.add(ContainerItem(
+                    id=item.id, item_id=item.id, container_id=self.id,
+                    database_id=self.database_id))
+
+            return True
+        elif member:
+            self.container_items.remove(self.container_items[item.id])
+
+        return False
+
+    def discard(self, item_id):
+        """
+        Remove an item, if it is a member.
+
+        :param int item_id: ID of the item to remove.
+        """
+
+        if item_id in self.container_items:
+            self.container_items.remove(self.container_items[item_id])
+
+    def refresh(self, items):
+        """
+        Evaluate the membership of all items, and remove members that are no
+        longer part of `items'.
+
+        :param MutableCollection items: Items to evaluate.
+        """
+
+        members = set()
+
+        for item in items.itervalues():
+            if self.evaluate(item):
+                members.add(item.id)
+
+        for item_id in self.container_items.keys():
+            if item_id not in members:
+                self.discard(item_id)
 
 
 cdef class ContainerItem(object):
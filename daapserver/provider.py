@@ -1,13 +1,26 @@
-from daapserver.utils import parse_byte_range, invoke_hooks
+from daapserver.utils import parse_byte_range, invoke_hooks, FilePool, \
+    MappedFileCache, StreamingFile, file_validators, fadvise_willneed
+
+from daapserver.artwork import ArtworkCache
 
 from datetime import datetime
 
+import sys
 import enum
-import cStringIO
+import time
+import heapq
+import logging
+import collections
+import gevent
 import gevent.lock
 import gevent.event
+import gevent.threadpool
+
+__all__ = (
+    "LocalFileProvider", "Provider", "RevisionTracker", "Session", "State")
 
-__all__ = ("LocalFileProvider", "Provider", "Session", "State")
+# Logger instance
+logger = logging.getLogger(__name__)
 
 
 class State(enum.Enum):
@@ -18,6 +31,7 @@ class State(enum.Enum):
     connecting = 1
     connected = 2
     streaming = 3
+    waiting = 4
 
 
 class Session(object):
@@ -28,8 +42,9 @@ class Session(object):
     """
 
     __slots__ = (
-        "revision", "since", "state", "remote_address", "user_agent",
-        "client_version", "counters")
+        "revision", "since", "last_activity", "state", "remote_address",
+        "user_agent", "client_version", "counters", "container_id",
+        "last_item")
 
     def __init__(self):
         """
@@ -38,12 +53,18 @@ class Session(object):
 
         self.revision = 0
         self.since = datetime.now()
+        self.last_activity = time.time()
         self.state = State.connecting
 
         self.remote_address = None
         self.user_agent = None
         self.client_version = None
 
+        # Last container listed and last item requested, to predict the next
+        # item that is requested.
+        self.container_id = None
+        self.last_item = None
+
         self.counters = {
             "items": 0,
             "items_unique": 0,
@@ -59,6 +80,108 @@ class Session(object):
 
         self.counters[counter] += 1
 
+    def touch(self):
+        """
+        Record activity of the client.
+        """
+
+        self.last_activity = time.time()
+
+    def is_idle(self, timeout):
+        """
+        Check whether the client has been idle for more than `timeout'
+        seconds. Clients that are streaming or waiting for the next revision
+        are never idle.
+
+        :param float timeout: Number of seconds.
+        :return: True if the client is idle.
+        :rtype bool:
+        """
+
+        if self.state in (State.streaming, State.waiting):
+            return False
+
+        return time.time() - self.last_activity > timeout
+
+
+class RevisionTracker(object):
+    """
+    Keep track of the revisions of sessions, to find the lowest revision in
+    O(log n). The number of sessions per revision is counted, and the
+    revisions are kept in a min-heap. Revisions without sessions are removed
+    from the heap when they become the lowest.
+    """
+
+    __slots__ = ("counts", "heap")
+
+    def __init__(self):
+        """
+        Construct a new, empty tracker.
+        """
+
+        self.counts = {}
+        self.heap = []
+
+    def __len__(self):
+        """
+        Return the number of tracked sessions.
+        """
+
+        return sum(self.counts.itervalues())
+
+    def add(self, revision):
+        """
+        Add a session at a revision.
+
+        :param int revision: Revision of the session.
+        """
+
+        count = self.counts.get(revision, 0)
+
+        if count == 0:
+            heapq.heappush(self.heap, revision)
+
+        self.counts[revision] = count + 1
+
+    def remove(self, revision):
+        """
+        Remove a session at a revision.
+
+        :param int revision: Revision of the session.
+        """
+
+        count = self.counts.pop(revision) - 1
+
+        if count > 0:
+            self.counts[revision] = count
+
+    def move(self, old_revision, new_revision):
+        """
+        Move a session from one revision to another.
+
+        :param int old_revision: Previous revision of the session.
+        :param int new_revision: New revision of the session.
+        """
+
+        if old_revision != new_revision:
+            self.add(new_revision)
+            self.remove(old_revision)
+
+    def lowest(self):
+        """
+        Return the lowest revision of all sessions.
+
+        :return: Lowest revision, or None if there are no sessions.
+        :rtype int:
+        """
+
+        heap = self.heap
+
+        while heap and heap[0] not in self.counts:
+            heapq.heappop(heap)
+
+        return heap[0] if heap else None
+
 
 class Provider(object):
     """
@@ -75,14 +198,60 @@ class Provider(object):
     # Whether persistent IDs are supported
     supports_persistent_id = False
 
+    # Number of seconds after which idle sessions expire. Zero means never.
+    # This value is advertised to clients.
+    session_timeout = 1800
+
+    # Number of seconds between checks for idle sessions.
+    reap_interval = 60
+
+    # Number of seconds a client waits for the next revision, before the
+    # current revision is returned. Zero means wait until the next update.
+    update_timeout = 0
+
+    # Number of waiting clients to wake up at once after an update, and the
+    # number of seconds between batches. Zero means wake up all at once.
+    wakeup_batch_size = 0
+    wakeup_interval = 0.05
+
+    # Number of seconds to coalesce updates into one revision. Zero means
+    # every update creates a revision. If `update_max_pending' updates are
+    # pending, they are published immediately. Zero means no limit.
+    update_delay = 0
+    update_max_pending = 0
+
+    # Retention policy for revision history. If set, history is cleaned
+    # regardless of sessions that lag behind, keeping at most `max_revisions'
+    # revisions, or the revisions of the last `max_revision_age' seconds.
+    # Lagging sessions receive a full response instead of a delta. Zero means
+    # no limit.
+    max_revisions = 0
+    max_revision_age = 0
+
+    # Maximum number of bytes of (resized) artwork to cache in memory. Zero
+    # disables the artwork cache, and artwork is served as is. If
+    # `artwork_cache_directory' is set, artwork is cached on disk as well,
+    # using at most `artwork_disk_cache_size' bytes.
+    artwork_cache_size = 16 * 1024 * 1024
+    artwork_cache_directory = None
+    artwork_disk_cache_size = 256 * 1024 * 1024
+
+    # Whether to prefetch the first `prefetch_next_size' bytes of the next item
+    # of a container, when a client starts streaming another item.
+    prefetch_next = False
+    prefetch_next_size = 1024 * 1024
+
     def __init__(self):
         """
         Create a new Provider. This method should be invoked from the subclass.
         """
 
         self.revision = 1
+        self.min_revision = 1
+        self.revision_times = collections.deque([(1, time.time())])
         self.server = None
         self.sessions = {}
+        self.session_revisions = RevisionTracker()
         self.session_counter = 0
         self.hooks = {
             "session_created": [],
@@ -91,7 +260,20 @@ class Provider(object):
         }
 
         self.lock = gevent.lock.Semaphore()
-        self.next_revision_available = gevent.event.Event()
+        self.waiters = set()
+        self.reaper = None
+        self.prefetcher = None
+        self.base_containers = {}
+        self.next_items = {}
+        self.pending_updates = 0
+        self.update_timer = None
+
+        if self.artwork_cache_size:
+            self.artwork_cache = ArtworkCache(
+                self.artwork_cache_size, self.artwork_cache_directory,
+                self.artwork_disk_cache_size)
+        else:
+            self.artwork_cache = None
 
     def create_session(self, user_agent, remote_address, client_version):
         """
@@ -106,6 +288,7 @@ class Provider(object):
 
         self.session_counter += 1
         self.sessions[self.session_counter] = session = self.session_class()
+        self.session_revisions.add(session.revision)
 
         # Set session properties
         session.user_agent = user_agent
@@ -115,6 +298,13 @@ class Provider(object):
         # Invoke hooks
         invoke_hooks(self.hooks, "session_created", self.session_counter)
 
+        # The client will request the collections soon.
+        self.prefetch()
+
+        # Expire the session when the client disappears.
+        if self.session_timeout > 0 and self.reaper is None:
+            self.reaper = gevent.spawn(self._reap_sessions)
+
         return self.session_counter
 
     def destroy_session(self, session_id):
@@ -123,20 +313,117 @@ class Provider(object):
         """
 
         try:
-            del self.sessions[session_id]
+            session = self.sessions.pop(session_id)
         except KeyError:
             pass
+        else:
+            self.session_revisions.remove(session.revision)
 
         # Invoke hooks
         invoke_hooks(self.hooks, "session_destroyed", session_id)
 
+    @property
+    def waiter_count(self):
+        """
+        Number of clients waiting for the next revision.
+        """
+
+        return len(self.waiters)
+
+    def touch_session(self, session_id):
+        """
+        Record activity for a session. Unknown sessions are ignored.
+
+        :param int session_id: Session identifier
+        """
+
+        session = self.sessions.get(session_id)
+
+        if session is not None:
+            session.touch()
+
+    def set_session_revision(self, session_id, revision):
+        """
+        Advance the revision of a session. The revision is never decremented.
+
+        :param int session_id: Session identifier
+        :param int revision: Revision the client is up-to-date with.
+        """
+
+        session = self.sessions[session_id]
+
+        if revision > session.revision:
+            self.session_revisions.move(session.revision, revision)
+            session.revision = revision
+
+    def expire_sessions(self):
+        """
+        Destroy the sessions that have been idle for more than
+        `session_timeout' seconds. Revision history that was only kept for
+        these sessions is cleaned.
+
+        :return: The IDs of the destroyed sessions.
+        :rtype list:
+        """
+
+        expired = [
+            session_id for session_id, session in self.sessions.iteritems()
+            if session.is_idle(self.session_timeout)]
+
+        for session_id in expired:
+            self.destroy_session(session_id)
+
+        if expired:
+            with self.lock:
+                self.clean()
+
+        return expired
+
+    def _reap_sessions(self):
+        """
+        Greenlet body that expires idle sessions every `reap_interval'
+        seconds, until no sessions are left.
+        """
+
+        try:
+            while self.sessions:
+                gevent.sleep(self.reap_interval)
+                self.expire_sessions()
+        finally:
+            self.reaper = None
+
+    def prefetch(self):
+        """
+        Start loading lazy collections that have `preload' enabled in the
+        background. Invoked at startup and when a new session is created.
+
+        Container items are only considered if the containers are loaded
+        already, to prevent loading the containers synchronously.
+        """
+
+        def _prefetch(collection):
+            if getattr(collection, "preload", False):
+                collection.prefetch()
+
+        if self.server is None:
+            return
+
+        for database in self.server.databases.itervalues():
+            _prefetch(database.items)
+            _prefetch(database.containers)
+
+            if getattr(database.containers, "ready", True) and \
+                    not getattr(database.containers, "evicted", False):
+                for container in database.containers.itervalues():
+                    _prefetch(container.container_items)
+
     def get_next_revision(self, session_id, revision, delta):
         """
         Determine the next revision number for a given session id, revision
         and delta.
 
         In case the client is up-to-date, this method will block until the next
-        revision is available.
+        revision is available, or until `update_timeout' seconds have passed.
 
         :param int session_id: Session identifier
         :param int revision: Client revision number
@@ -147,50 +434,215 @@ class Provider(object):
 
         session = self.sessions[session_id]
         session.state = State.connected
+        session.touch()
 
         if delta == revision:
             # Increment revision. Never decrement.
-            session.revision = max(session.revision, revision)
+            self.set_session_revision(session_id, revision)
 
-            # Wait for next revision to become ready.
-            self.next_revision_available.wait()
+            # Wait for next revision to become ready, unless the client is
+            # behind already. The session does not expire while waiting.
+            if revision >= self.revision:
+                waiter = gevent.event.Event()
+
+                self.waiters.add(waiter)
+                session.state = State.waiting
+
+                try:
+                    waiter.wait(timeout=self.update_timeout or None)
+                finally:
+                    self.waiters.discard(waiter)
+                    session.state = State.connected
 
         return self.revision
 
+    def wake_waiters(self):
+        """
+        Unblock all clients that wait for the next revision. If
+        `wakeup_batch_size' is set, the clients are woken up in batches, so
+        they do not all request the changes at the same time.
+        """
+
+        waiters = list(self.waiters)
+        batch_size = self.wakeup_batch_size or len(waiters)
+
+        self.waiters = set()
+
+        def _wake(start):
+            for waiter in waiters[start:start + batch_size]:
+                waiter.set()
+
+        def _wake_later():
+            for start in xrange(batch_size, len(waiters), batch_size):
+                gevent.sleep(self.wakeup_interval)
+                _wake(start)
+
+        _wake(0)
+
+        if batch_size < len(waiters):
+            gevent.spawn(_wake_later)
+
     def update(self):
         """
         Update this provider. Should be invoked when the server gets updated.
 
-        This method will notify all clients that wait for
-        `self.next_revision_available`.
+        This method will notify all clients that wait for the next revision.
+
+        If `update_delay' is set, updates are coalesced: the changes are
+        published as one revision after `update_delay' seconds, or when
+        `update_max_pending' updates are pending. Use `flush_updates()' to
+        publish pending updates immediately.
+        """
+
+        if self.update_delay <= 0:
+            return self._update()
+
+        self.pending_updates += 1
+
+        if self.update_max_pending > 0 and \
+                self.pending_updates >= self.update_max_pending:
+            self.flush_updates()
+        elif self.update_timer is None:
+            self.update_timer = gevent.spawn_later(
+                self.update_delay, self.flush_updates)
+
+    def flush_updates(self):
+        """
+        Publish pending updates as one revision, if there are any.
+        """
+
+        if self.update_timer is not None:
+            if self.update_timer is not gevent.getcurrent():
+                self.update_timer.kill()
+
+            self.update_timer = None
+
+        if self.pending_updates > 0:
+            self.pending_updates = 0
+            self._update()
+
+    def _update(self):
+        """
+        Publish the changes as a new revision.
         """
 
         with self.lock:
             # Increment revision and commit it.
             self.revision += 1
+            self.revision_times.append((self.revision, time.time()))
             self.server.commit(self.revision + 1)
 
             # Unblock all waiting clients.
-            self.next_revision_available.set()
-            self.next_revision_available.clear()
+            self.wake_waiters()
 
             # Check sessions to see which revision can be removed.
-            if self.sessions:
-                lowest_revision = min(
-                    session.revision for session in self.sessions.itervalues())
-
-                # Remove all old revision history
-                if lowest_revision == self.revision:
-                    self.server.clean(lowest_revision)
+            self.clean()
 
         # Invoke hooks
         invoke_hooks(self.hooks, "updated", self.revision)
 
+    def clean(self):
+        """
+        Remove old revision history, if all sessions are up-to-date, or if
+        the history exceeds the retention policy. Should be invoked while
+        holding `self.lock`.
+        """
+
+        lowest_revision = self.session_revisions.lowest()
+        retained_revision = self.get_retained_revision()
+
+        if lowest_revision == self.revision:
+            revision = lowest_revision
+        elif retained_revision is None:
+            return
+        elif lowest_revision is None:
+            revision = retained_revision
+        else:
+            revision = max(retained_revision, lowest_revision)
+
+        # Remove old revision history, but never below what has been removed
+        # already.
+        if revision < self.min_revision:
+            return
+
+        self.server.clean(revision)
+        self.min_revision = revision
+
+        while len(self.revision_times) > 1 and \
+                self.revision_times[1][0] <= revision:
+            self.revision_times.popleft()
+
+    def get_retained_revision(self):
+        """
+        Return the lowest revision that has to be kept according to the
+        retention policy.
+
+        :return: Lowest revision to keep, or None if there is no policy.
+        :rtype int:
+        """
+
+        revision = 0
+
+        if self.max_revisions > 0:
+            revision = self.revision - self.max_revisions + 1
+
+        if self.max_revision_age > 0:
+            cutoff = time.time() - self.max_revision_age
+
+            # The revision that was current at the cutoff is kept.
+            for published_revision, published in self.revision_times:
+                if published > cutoff:
+                    break
+
+                revision = max(revision, published_revision)
+
+        return revision if revision > 0 else None
+
+    def is_stale(self, revision, delta):
+        """
+        Check whether a request refers to revision history that has been
+        removed. Such requests are answered with a full response.
+
+        :param int revision: Requested revision.
+        :param int delta: Revision the client has.
+        :return: True if the history is not available anymore.
+        :rtype bool:
+        """
+
+        return min(revision, delta) < self.min_revision
+
+    def get_delta(self, database, collection, revision, delta):
+        """
+        Return the revisions of a collection of a database to compute a
+        delta with. If the database did not change between both revisions,
+        they map to the same local revision, and the same revision is
+        returned twice, so the delta is empty.
+
+        :param Database database: Database of the collection.
+        :param MutableCollection collection: Collection of the database.
+        :param int revision: Requested server revision.
+        :param int delta: Server revision the client has.
+        :return: Tuple of (new, old) revisions of the collection.
+        :rtype tuple:
+        """
+
+        local_revision = database.to_local_revision(revision)
+        local_delta = database.to_local_revision(delta)
+
+        new = collection(local_revision)
+
+        if local_delta == local_revision:
+            return new, new
+
+        return new, collection(local_delta)
+
     def get_databases(self, session_id, revision, delta):
         """
         """
 
-        if delta == 0:
+        self.touch_session(session_id)
+
+        if delta == 0 or self.is_stale(revision, delta):
             new = self.server.databases
             old = None
         else:
@@ -203,18 +655,19 @@ class Provider(object):
         """
         """
 
-        if delta == 0:
+        self.touch_session(session_id)
+
+        if delta == 0 or self.is_stale(revision, delta):
             new = self.server \
                       .databases[database_id] \
                       .containers
             old = None
         else:
-            new = self.server \
-                      .databases[database_id] \
-                      .containers(revision)
-            old = self.server \
-                      .databases[database_id] \
-                      .containers(delta)
+            database = self.server.databases[database_id]
+
+            # The database may have its own revision timeline.
+            new, old = self.get_delta(
+                database, database.containers, revision, delta)
 
         return new, old
 
@@ -223,21 +676,25 @@ class Provider(object):
         """
         """
 
-        if delta == 0:
+        self.touch_session(session_id)
+
+        # The client is likely to play from this container.
+        self.sessions[session_id].container_id = container_id
+
+        if delta == 0 or self.is_stale(revision, delta):
             new = self.server \
                       .databases[database_id] \
                       .containers[container_id] \
                       .container_items
             old = None
         else:
-            new = self.server \
-                      .databases[database_id] \
-                      .containers[container_id] \
-                      .container_items(revision)
-            old = self.server \
-                      .databases[database_id] \
-                      .containers[container_id] \
-                      .container_items(delta)
+            database = self.server.databases[database_id]
+            container_items = database.containers[container_id] \
+                                      .container_items
+
+            # The database may have its own revision timeline.
+            new, old = self.get_delta(
+                database, container_items, revision, delta)
 
         return new, old
 
@@ -245,18 +702,19 @@ class Provider(object):
         """
         """
 
-        if delta == 0:
+        self.touch_session(session_id)
+
+        if delta == 0 or self.is_stale(revision, delta):
             new = self.server \
                       .databases[database_id] \
                       .items
             old = None
         else:
-            new = self.server \
-                      .databases[database_id] \
-                      .items(revision)
-            old = self.server \
-                      .databases[database_id] \
-                      .items(delta)
+            database = self.server.databases[database_id]
+
+            # The database may have its own revision timeline.
+            new, old = self.get_delta(
+                database, database.items, revision, delta)
 
         return new, old
 
@@ -264,6 +722,11 @@ class Provider(object):
         """
         """
 
+        def _done():
+            # Change state back to connected.
+            session.state = State.connected
+            session.touch()
+
         def _inner(data):
             # Change state to streaming
             session.state = State.streaming
@@ -277,10 +740,14 @@ class Provider(object):
                         yield chunk
             finally:
                 # Change state back to connected, even if an exception is
-                # raised.
-                session.state = State.connected
+                # raised. Close the data, e.g. to release a file.
+                if hasattr(data, "close"):
+                    data.close()
+
+                _done()
 
         session = self.sessions[session_id]
+        session.touch()
         item = self.server.databases[database_id].items[item_id]
 
         # Increment counter for statistics. Make a distinction between requests
@@ -290,21 +757,355 @@ class Provider(object):
         if byte_range is None:
             session.increment_counter("items_unique")
 
+        # Prefetch the next item, once per item. Requests for other byte ranges
+        # of the same item (e.g. seeking) do not trigger a prefetch.
+        if self.prefetch_next and session.last_item != (database_id, item_id):
+            session.last_item = (database_id, item_id)
+
+            self.prefetcher = gevent.spawn(
+                self.prefetch_next_item, session, database_id, item_id)
+
         data, mimetype, size = self.get_item_data(session, item, byte_range)
 
+        # Pass files through, so the server can send them without copying.
+        # The session state is updated when the file is closed.
+        if hasattr(data, "fileno"):
+            session.state = State.streaming
+            return StreamingFile(data, _done), mimetype, size
+
         return _inner(data), mimetype, size
 
-    def get_artwork(self, session_id, database_id, item_id):
+    def get_item_size(self, session_id, database_id, item_id):
+        """
+        Return the size of an item, to resolve byte ranges that are relative
+        to the end of the file. By default, this is the file size of the item.
+
+        :param int session_id: Session ID.
+        :param int database_id: Database ID.
+        :param int item_id: Item ID.
+        :return: Size in bytes, or zero if unknown.
+        :rtype int:
+        """
+
+        return self.server.databases[database_id].items[item_id].file_size
+
+    def iter_file(self, fp):
         """
+        Yield the contents of a file object in blocks, and close it
+        afterwards. Used to stream files that are passed through, if the WSGI
+        server does not provide `wsgi.file_wrapper'.
+
+        :param file fp: File object to read.
+        """
+
+        try:
+            for chunk in iter(lambda: fp.read(65536), ""):
+                yield chunk
+        finally:
+            fp.close()
+
+    def get_item_ranges(self, session_id, database_id, item_id, byte_ranges):
+        """
+        Return multiple byte ranges of an item, e.g. for a
+        `multipart/byteranges' response.
+
+        :param int session_id: Session ID.
+        :param int database_id: Database ID.
+        :param int item_id: Item ID.
+        :param list byte_ranges: List of (begin, end) tuples.
+        :return: Tuple of (parts, mimetype, size). Parts yields a tuple of the
+                 (begin, end) range and an iterator of the data of each range,
+                 in order.
+        :rtype tuple:
         """
 
+        def _read(data, length):
+            # Yield data, but limit files to the length of the range.
+            if isinstance(data, basestring):
+                yield data
+            elif hasattr(data, "read"):
+                while length > 0:
+                    chunk = data.read(min(65536, length))
+
+                    if not chunk:
+                        break
+
+                    length -= len(chunk)
+                    yield chunk
+            else:
+                for chunk in data:
+                    yield chunk
+
+        def _inner(parts):
+            # Change state to streaming
+            session.state = State.streaming
+
+            try:
+                for (begin, end), data in zip(byte_ranges, parts):
+                    begin, end = (begin or 0), (end or size)
+
+                    yield (begin, end), _read(data, end - begin)
+            finally:
+                # Change state back to connected, even if an exception is
+                # raised. Close all data, e.g. to release files.
+                for data in parts:
+                    if hasattr(data, "close"):
+                        data.close()
+
+                session.state = State.connected
+                session.touch()
+
         session = self.sessions[session_id]
+        session.touch()
+        item = self.server.databases[database_id].items[item_id]
+
+        # Increment counter for statistics.
+        session.increment_counter("items")
+
+        parts, mimetype, size = self.get_item_ranges_data(
+            session, item, byte_ranges)
+
+        return _inner(parts), mimetype, size
+
+    def get_artwork(self, session_id, database_id, item_id, width=None,
+                    height=None):
+        """
+        Return the artwork of an item, resized to fit the given dimensions.
+        Artwork is only resized if the artwork cache is enabled.
+
+        :param int session_id: Session ID.
+        :param int database_id: Database ID.
+        :param int item_id: Item ID.
+        :param int width: Maximum width, or None for any width.
+        :param int height: Maximum height, or None for any height.
+        :return: Tuple of (data, mimetype, size).
+        :rtype tuple:
+        """
+
+        session = self.sessions[session_id]
+        session.touch()
         item = self.server.databases[database_id].items[item_id]
 
         # Increment counter for statistics
         session.increment_counter("artworks")
 
-        return self.get_artwork_data(session, item)
+        if self.artwork_cache is None:
+            return self.get_artwork_data(session, item)
+
+        # The validators identify the artwork file, so the cached content
+        # hash is not used anymore when the file changes.
+        validators = self.get_file_validators(session, item, artwork=True)
+
+        return self.artwork_cache.get(
+            (database_id, item_id, item.album_art, validators),
+            lambda: self.get_artwork_data(session, item), width, height)
+
+    def get_next_item(self, session, database_id, item_id):
+        """
+        Return the item that is likely requested after an item. This is the
+        next item of the container the client listed last, or of the base
+        container. Containers are ordered by the order of the container items.
+
+        :param Session session: Client session
+        :param int database_id: Database ID.
+        :param int item_id: Item ID.
+        :return: The next item, or None if unknown.
+        :rtype Item:
+        """
+
+        database = self.server.databases[database_id]
+        containers = []
+
+        if session.container_id in database.containers:
+            containers.append(database.containers[session.container_id])
+
+        base_container = self.get_base_container(database)
+
+        if base_container is not None:
+            containers.append(base_container)
+
+        for container in containers:
+            next_items = self.get_next_items(database_id, container)
+
+            if item_id in next_items:
+                next_item_id = next_items[item_id]
+
+                if next_item_id is None:
+                    return None
+
+                return database.items[next_item_id]
+
+    def get_base_container(self, database):
+        """
+        Return the base container of a database. The container is remembered,
+        so the containers are only scanned if it changes.
+
+        :param Database database: Database to find the base container of.
+        :return: The base container, or None if there is none.
+        :rtype Container:
+        """
+
+        container_id = self.base_containers.get(database.id)
+
+        if container_id in database.containers:
+            container = database.containers[container_id]
+
+            if container.is_base:
+                return container
+
+        for container in database.containers.itervalues():
+            if container.is_base:
+                self.base_containers[database.id] = container.id
+                return container
+
+    def get_next_items(self, database_id, container):
+        """
+        Return a mapping of the item IDs of a container to the item ID that
+        follows it, or None for the last item. The mapping is cached until the
+        container items change.
+
+        :param int database_id: Database ID.
+        :param Container container: Container to map.
+        :return: Mapping of item ID to next item ID.
+        :rtype dict:
+        """
+
+        store = container.container_items.store
+        key = database_id, container.id
+
+        try:
+            cached_store, revision, next_items = self.next_items[key]
+        except KeyError:
+            pass
+        else:
+            if cached_store is store and revision == store.revision and \
+                    not store.changed:
+                return next_items
+
+        container_items = sorted(
+            container.container_items.itervalues(),
+            key=lambda container_item: (
+                container_item.order, container_item.id))
+        next_items = {}
+
+        for index, container_item in enumerate(container_items):
+            if index + 1 < len(container_items):
+                next_item_id = container_items[index + 1].item_id
+            else:
+                next_item_id = None
+
+            # The first occurrence of an item wins.
+            next_items.setdefault(container_item.item_id, next_item_id)
+
+        # Uncommitted changes can be changed again, without a new revision.
+        if not store.changed:
+            self.next_items[key] = store, store.revision, next_items
+
+        return next_items
+
+    def prefetch_next_item(self, session, database_id, item_id):
+        """
+        Prefetch the first bytes of the item that is likely requested after
+        an item, so the next item starts without waiting for cold storage.
+        Errors are logged, since prefetching is an optimization only.
+
+        :param Session session: Client session
+        :param int database_id: Database ID.
+        :param int item_id: Item ID.
+        """
+
+        try:
+            item = self.get_next_item(session, database_id, item_id)
+
+            if item is not None:
+                self.prefetch_item_data(
+                    session, item, self.prefetch_next_size)
+        except Exception:
+            logger.exception(
+                "Unable to prefetch the item after item %d.", item_id)
+
+    def get_item_validators(self, session_id, database_id, item_id):
+        """
+        Return the validators of an item, to answer conditional requests
+        without fetching the item.
+
+        :param int session_id: Session ID.
+        :param int database_id: Database ID.
+        :param int item_id: Item ID.
+        :return: Tuple of (etag, last_modified), or None if unknown. The last
+                 modified time is a UNIX timestamp, or None if unknown.
+        :rtype tuple:
+        """
+
+        session = self.sessions[session_id]
+        item = self.server.databases[database_id].items[item_id]
+
+        return self.get_file_validators(session, item)
+
+    def get_artwork_validators(self, session_id, database_id, item_id,
+                               width=None, height=None):
+        """
+        Return the validators of the artwork of an item, to answer conditional
+        requests without fetching the artwork. If the artwork cache knows the
+        content hash of the artwork, it is used as entity tag.
+
+        :param int session_id: Session ID.
+        :param int database_id: Database ID.
+        :param int item_id: Item ID.
+        :param int width: Maximum width, or None for any width.
+        :param int height: Maximum height, or None for any height.
+        :return: Tuple of (etag, last_modified), or None if unknown.
+        :rtype tuple:
+        """
+
+        session = self.sessions[session_id]
+        item = self.server.databases[database_id].items[item_id]
+        validators = self.get_file_validators(session, item, artwork=True)
+
+        if self.artwork_cache is not None:
+            etag = self.artwork_cache.etag(
+                (database_id, item_id, item.album_art, validators), width,
+                height)
+
+            if etag is not None:
+                return etag, None
+
+        if validators is None:
+            return None
+
+        # Resized artwork is a different representation.
+        etag, last_modified = validators
+
+        return "%s-%dx%d" % (etag, width or 0, height or 0), last_modified
+
+    def get_file_validators(self, session, item, artwork=False):
+        """
+        Return the validators of the file of an item, or of its artwork, e.g.
+        derived from the size and modification time. By default, no
+        validators are known.
+
+        :param Session session: Client session
+        :param Item item: Requested item.
+        :param bool artwork: Whether to return the validators of the artwork.
+        :return: Tuple of (etag, last_modified), or None if unknown.
+        :rtype tuple:
+        """
+
+        return None
+
+    def prefetch_item_data(self, session, item, size):
+        """
+        Prefetch the first `size' bytes of an item, e.g. by warming a cache.
+        By default, nothing is prefetched.
+
+        Note: this method requires `Provider.prefetch_next = True`
+
+        :param Session session: Client session
+        :param Item item: Item to prefetch.
+        :param int size: Number of bytes to prefetch.
+        """
+
+        pass
 
     def get_item_data(self, session, item, byte_range=None):
         """
@@ -317,6 +1118,10 @@ class Provider(object):
         is requested, add a fourth tuple item, length. The length should be the
         size of the requested data that is being returned.
 
+        File objects (with a `fileno()' method) are passed to the WSGI server
+        as is, positioned at the start of the range. If the server provides
+        `wsgi.file_wrapper', it may send the file using `sendfile'.
+
         Note: this method requires `Provider.supports_artwork = True`
 
         :param Session session: Client session
@@ -328,6 +1133,41 @@ class Provider(object):
 
         raise NotImplementedError("Needs to be overridden.")
 
+    def get_item_ranges_data(self, session, item, byte_ranges):
+        """
+        Fetch multiple byte ranges of the requested item. By default, this
+        invokes `get_item_data' for each range. Override this method to serve
+        all ranges from one open file or connection.
+
+        The result should be a tuple, of the form (parts, mimetype, size),
+        where parts is a list with the data of each range. The data of a range
+        can be an iterator, file descriptor or raw bytes. File descriptors
+        should be positioned at the start of the range.
+
+        :param Session session: Client session
+        :param Item item: Requested item.
+        :param list byte_ranges: List of (begin, end) tuples.
+        :return: Tuple of (parts, mimetype, size).
+        :rtype tuple:
+        """
+
+        parts = []
+
+        try:
+            for byte_range in byte_ranges:
+                data, mimetype, size = self.get_item_data(
+                    session, item, byte_range)
+                parts.append(data)
+        except Exception:
+            # Release the parts that were opened already.
+            for data in parts:
+                if hasattr(data, "close"):
+                    data.close()
+
+            raise
+
+        return parts, mimetype, size
+
     def get_artwork_data(self, session, item):
         """
         Fetch artwork for the requested item.
@@ -353,33 +1193,94 @@ class LocalFileProvider(Provider):
 
     supports_artwork = True
 
+    # Number of bytes to read at once when streaming a part of a file.
+    block_size = 65536
+
+    # Maximum number of files to keep open for serving byte ranges.
+    max_open_files = 64
+
+    # Maximum size of a file to serve byte ranges from a memory mapping. Set
+    # to zero to disable memory mapping.
+    max_mapped_file_size = 0
+
+    # Maximum number of bytes to keep memory mapped.
+    max_mapped_size = 64 * 1024 * 1024
+
+    # Number of threads to open and read files with, so a slow disk does not
+    # block the event loop. Whole files are passed through if the WSGI server
+    # provides `wsgi.file_wrapper', so it can send them, e.g. with `sendfile'.
+    # Otherwise, and for byte ranges, the files are read by these threads.
+    # Zero means files are read in the event loop.
+    io_threads = 4
+
+    def __init__(self):
+        """
+        Create a new local file provider.
+        """
+
+        super(LocalFileProvider, self).__init__()
+
+        if self.io_threads:
+            self.io_pool = gevent.threadpool.ThreadPool(self.io_threads)
+        else:
+            self.io_pool = None
+
+        self.file_pool = FilePool(self.max_open_files, self.io_pool)
+        self.mapped_files = MappedFileCache(self.max_mapped_size)
+
+        # Resize and store artwork in the I/O threads as well.
+        if self.artwork_cache is not None:
+            self.artwork_cache.threadpool = self.io_pool
+
     def get_item_data(self, session, item, byte_range=None):
         """
         Return a file pointer to the item file. Assumes `item.file_name` points
         to the file on disk.
+
+        Byte ranges are read from a pool of shared file descriptors, since
+        clients that seek request many ranges of the same file. Ranges of
+        small files can be served from memory mapped files instead, if
+        `max_mapped_file_size' is set.
         """
 
-        # Parse byte range
-        if byte_range is not None:
-            begin, end = parse_byte_range(byte_range, max_byte=item.file_size)
+        if byte_range is None:
+            # Pass the whole file through. See `iter_file()' if the server
+            # cannot send it.
+            fp = self.file_pool.call(open, item.file_name, "rb")
+
+            return fp, item.file_type, item.file_size
+
+        # Stream a part of the file in blocks. If the size is unknown, reads
+        # stop at the end of the file.
+        begin, end = parse_byte_range(
+            byte_range, max_byte=item.file_size or sys.maxint)
+
+        if 0 < item.file_size <= self.max_mapped_file_size:
+            source = self.mapped_files
         else:
-            begin, end = 0, item.file_size
+            source = self.file_pool
 
-        # Open the file
-        fp = open(item.file_name, "rb+")
+        data = source.read(item.file_name, begin, end - begin, self.block_size)
 
-        if not begin:
-            return fp, item.file_type, item.file_size
-        elif begin and not end:
-            fp.seek(begin)
-            return fp, item.file_type, item.file_size
-        elif begin and end:
-            fp.seek(begin)
+        return data, item.file_type, item.file_size
+
+    def prefetch_item_data(self, session, item, size):
+        """
+        Warm the page cache with the first bytes of the item file. Uses
+        `posix_fadvise' if supported. Otherwise, the bytes are read. The
+        descriptor is kept open in the pool.
+        """
 
-            data = fp.read(end - begin)
-            result = cStringIO.StringIO(data)
+        fd, _ = self.file_pool.acquire(item.file_name)
 
-            return result, item.file_type, item.file_size
+        try:
+            if fadvise_willneed(fd, 0, size):
+                return
+        finally:
+            self.file_pool.release(item.file_name, fd)
+
+        for _ in self.file_pool.read(item.file_name, 0, size, self.block_size):
+            pass
 
     def get_artwork_data(self, session, item):
         """
@@ -387,6 +1288,35 @@ class LocalFileProvider(Provider):
         points to the file on disk.
         """
 
-        fp = open(item.album_art, "rb+")
+        fp = self.file_pool.call(open, item.album_art, "rb")
 
         return fp, None, None
+
+    def iter_file(self, fp):
+        """
+        Yield the contents of a file object in blocks, read in the I/O
+        threads, and close it afterwards.
+
+        :param file fp: File object to read.
+        """
+
+        try:
+            while True:
+                chunk = self.file_pool.call(fp.read, self.block_size)
+
+                if not chunk:
+                    break
+
+                yield chunk
+        finally:
+            fp.close()
+
+    def get_file_validators(self, session, item, artwork=False):
+        """
+        Return validators derived from the identity, size and modification
+        time of the file on disk.
+        """
+
+        file_name = item.album_art if artwork else item.file_name
+
+        return self.file_pool.call(file_validators, file_name)
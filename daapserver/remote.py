@@ -0,0 +1,448 @@
+from daapserver.provider import LocalFileProvider
+from daapserver.utils import parse_byte_range, CacheDirectory
+
+import re
+import sys
+import socket
+import httplib
+import urlparse
+import tempfile
+import functools
+import collections
+import gevent.ssl
+import gevent.socket
+
+__all__ = (
+    "HTTPConnection", "HTTPSConnection", "ConnectionPool", "RemoteProvider")
+
+# HTTP status codes that redirect to the `Location' header.
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# Pattern of a `Content-Range' header of a 206 response.
+CONTENT_RANGE = re.compile(r"^bytes (\d+)-\d+/(\d+|\*)$")
+
+
+class HTTPConnection(httplib.HTTPConnection):
+    """
+    HTTP connection that uses gevent sockets, so other greenlets can run while
+    waiting for the remote server.
+    """
+
+    def connect(self):
+        """
+        """
+
+        self.sock = gevent.socket.create_connection(
+            (self.host, self.port), self.timeout, self.source_address)
+
+
+class HTTPSConnection(httplib.HTTPSConnection):
+    """
+    HTTPS connection that uses gevent sockets, so other greenlets can run
+    while waiting for the remote server.
+    """
+
+    def connect(self):
+        """
+        """
+
+        sock = gevent.socket.create_connection(
+            (self.host, self.port), self.timeout, self.source_address)
+        context = gevent.ssl.create_default_context()
+
+        self.sock = context.wrap_socket(sock, server_hostname=self.host)
+
+
+class ConnectionPool(object):
+    """
+    Pool of keep-alive connections, per scheme, host and port. A connection is
+    reused if its previous response was read completely.
+    """
+
+    def __init__(self, max_idle=4, timeout=30):
+        """
+        Construct a new, empty pool.
+
+        :param int max_idle: Maximum number of idle connections per host.
+        :param int timeout: Timeout of a connection, in seconds.
+        """
+
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.idle = collections.defaultdict(list)
+
+    def connect(self, scheme, host, port):
+        """
+        Open a new connection.
+
+        :param str scheme: Either `http' or `https'.
+        :param str host: Host to connect to.
+        :param int port: Port to connect to, or None for the default port.
+        :return: The connection.
+        :rtype HTTPConnection:
+        """
+
+        if scheme == "https":
+            return HTTPSConnection(host, port, timeout=self.timeout)
+        elif scheme == "http":
+            return HTTPConnection(host, port, timeout=self.timeout)
+
+        raise ValueError("Unsupported scheme '%s'." % scheme)
+
+    def request(self, method, url, headers=None, max_redirects=5):
+        """
+        Perform a request, and follow redirects. The response body is not
+        read. The returned callable must be invoked when done with the
+        response, to return the connection to the pool.
+
+        :param str method: HTTP method.
+        :param str url: URL to request.
+        :param dict headers: Additional request headers.
+        :param int max_redirects: Maximum number of redirects to follow.
+        :return: Tuple of (response, release).
+        :rtype tuple:
+        """
+
+        for _ in xrange(max_redirects + 1):
+            parts = urlparse.urlsplit(url)
+            key = parts.scheme, parts.hostname, parts.port
+            path = urlparse.urlunsplit(("", "", parts.path or "/",
+                                        parts.query, ""))
+
+            response, connection = self._send(key, method, path, headers)
+            release = functools.partial(
+                self.release, key, connection, response)
+            location = response.getheader("Location")
+
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response, release
+
+            response.read()
+            release()
+
+            url = urlparse.urljoin(url, location)
+
+        raise IOError("Too many redirects for '%s'." % url)
+
+    def _send(self, key, method, path, headers):
+        """
+        Send a request on an idle connection, or on a new one. Idle
+        connections may have been closed by the remote server, so they are
+        tried until one succeeds.
+        """
+
+        idle = self.idle[key]
+
+        while idle:
+            connection = idle.pop()
+
+            try:
+                connection.request(method, path, headers=headers or {})
+                return connection.getresponse(), connection
+            except (httplib.HTTPException, socket.error):
+                connection.close()
+
+        connection = self.connect(*key)
+
+        try:
+            connection.request(method, path, headers=headers or {})
+            return connection.getresponse(), connection
+        except (httplib.HTTPException, socket.error):
+            connection.close()
+            raise
+
+    def release(self, key, connection, response):
+        """
+        Return a connection to the pool, if its response was read completely
+        and the connection can be kept alive. Otherwise, close it.
+        """
+
+        idle = self.idle[key]
+
+        if response.isclosed() and not response.will_close and \
+                len(idle) < self.max_idle:
+            idle.append(connection)
+        else:
+            connection.close()
+
+    def close(self):
+        """
+        Close all idle connections.
+        """
+
+        for idle in self.idle.itervalues():
+            while idle:
+                idle.pop().close()
+
+
+class RemoteProvider(LocalFileProvider):
+    """
+    Provider for items that are stored remotely, e.g. by a streaming service.
+    Remote files are streamed to the client while they are written to a cache
+    directory. Byte ranges are served from the cache when they are cached.
+
+    Only a prefix of a remote file is cached. A byte range that starts in the
+    prefix continues the download, while a byte range that starts after the
+    prefix is streamed from the remote server without caching it.
+
+    Subclasses should implement `get_item_url' and `get_artwork_url'.
+    """
+
+    # Directory to cache remote files in. If not set, a temporary directory
+    # is used.
+    cache_directory = None
+
+    # Maximum number of bytes to cache on disk.
+    max_cache_size = 1024 * 1024 * 1024
+
+    # Maximum number of idle connections to keep open per remote host.
+    max_idle_connections = 4
+
+    # Timeout of remote connections, in seconds.
+    connection_timeout = 30
+
+    def __init__(self):
+        """
+        Create a new remote provider.
+        """
+
+        super(RemoteProvider, self).__init__()
+
+        # Descriptors of removed files must not be reused, since a new file
+        # may be written with the same name.
+        self.cache = CacheDirectory(
+            self.cache_directory or tempfile.mkdtemp(), self.max_cache_size,
+            on_remove=self.file_pool.invalidate)
+        self.connections = ConnectionPool(
+            self.max_idle_connections, self.connection_timeout)
+
+    def get_item_url(self, session, item):
+        """
+        Return the URL of the requested item. Only invoked if the item is not
+        cached completely.
+
+        :param Session session: Client session
+        :param Item item: Requested item.
+        :return: URL of the item.
+        :rtype str:
+        """
+
+        raise NotImplementedError("Needs to be overridden.")
+
+    def get_artwork_url(self, session, item):
+        """
+        Return the URL of the artwork of the requested item. Only invoked if
+        the artwork is not cached completely.
+
+        :param Session session: Client session
+        :param Item item: Requested item.
+        :return: URL of the artwork.
+        :rtype str:
+        """
+
+        raise NotImplementedError("Needs to be overridden.")
+
+    def get_item_data(self, session, item, byte_range=None):
+        """
+        Stream the requested item from the cache, or from the remote server.
+        """
+
+        return self.fetch(
+            "item-%d" % item.id, lambda: self.get_item_url(session, item),
+            byte_range, mimetype=item.file_type)
+
+    def get_item_size(self, session_id, database_id, item_id):
+        """
+        Return the size of the cached file, if the remote server reported it.
+        Otherwise, the file size of the item.
+        """
+
+        entry = self.cache.entries.get("item-%d" % item_id)
+
+        if entry is not None and entry.size is not None:
+            return entry.size
+
+        return super(RemoteProvider, self).get_item_size(
+            session_id, database_id, item_id)
+
+    def prefetch_item_data(self, session, item, size):
+        """
+        Download the first bytes of the item into the cache, unless they are
+        cached already.
+        """
+
+        key = "item-%d" % item.id
+        entry = self.cache.get(key)
+
+        # The size of the remote file may be known.
+        if entry.size is not None:
+            size = min(size, entry.size)
+        elif item.file_size:
+            size = min(size, item.file_size)
+
+        if entry.length >= size:
+            return
+
+        data, _, _ = self.fetch(
+            key, lambda: self.get_item_url(session, item), (0, size))
+
+        for _ in data:
+            pass
+
+    def get_artwork_data(self, session, item):
+        """
+        Stream the artwork of the requested item from the cache, or from the
+        remote server.
+        """
+
+        return self.fetch(
+            "artwork-%d" % item.id,
+            lambda: self.get_artwork_url(session, item))
+
+    def fetch(self, key, url, byte_range=None, mimetype=None):
+        """
+        Return a byte range of a remote file. The range is read from disk if
+        it is cached. Otherwise, it is requested from the remote server.
+
+        :param str key: Cache key of the file.
+        :param callable url: Returns the URL of the file. Only invoked if the
+                             range is not cached.
+        :param tuple byte_range: Optional byte range to return a part of the
+                                 file.
+        :param str mimetype: Mimetype to use if the remote server does not
+                             provide one.
+        :return: Tuple of (data, mimetype, size).
+        :rtype tuple:
+        """
+
+        entry = self.cache.get(key)
+        begin = byte_range and byte_range[0] or 0
+
+        # Serve from disk, if the range is cached.
+        if entry.size is not None:
+            begin, end = parse_byte_range(byte_range, max_byte=entry.size)
+
+            if end <= entry.length:
+                data = self.file_pool.read(
+                    entry.file_name, begin, end - begin, self.block_size)
+
+                return data, entry.mimetype or mimetype, entry.size
+
+        # Continue the download if the range starts in the cached prefix, so
+        # the bytes can be cached. Otherwise, only request the range.
+        if begin <= entry.length and not entry.writing:
+            start = entry.length
+        else:
+            start = begin
+
+        end = byte_range and byte_range[1] or entry.size
+        response, release, position, size = self._request(url(), start, end)
+
+        try:
+            begin, end = parse_byte_range(
+                byte_range, max_byte=sys.maxint if size is None else size)
+        except ValueError:
+            release()
+            raise
+
+        # The remote server ignored the byte range, so the cached prefix
+        # cannot be continued. Start over.
+        if position < start and not entry.writing:
+            self.cache.discard(key)
+            entry = self.cache.get(key)
+
+        if entry.size is None:
+            entry.size = size
+            entry.mimetype = response.getheader("Content-Type")
+
+        data = self._stream(entry, response, release, position, begin, end)
+
+        return data, entry.mimetype or mimetype, size
+
+    def _request(self, url, begin, end=None):
+        """
+        Request a byte range of a remote file. Remote servers that do not
+        support byte ranges return the whole file.
+
+        :return: Tuple of (response, release, position, size), where position
+                 is the offset of the first byte of the response.
+        :rtype tuple:
+        """
+
+        if end is None:
+            headers = {"Range": "bytes=%d-" % begin}
+        else:
+            headers = {"Range": "bytes=%d-%d" % (begin, end - 1)}
+
+        response, release = self.connections.request("GET", url, headers)
+
+        if response.status == 206:
+            match = CONTENT_RANGE.match(
+                response.getheader("Content-Range", ""))
+
+            if match is not None:
+                position, size = match.groups()
+
+                return response, release, int(position), \
+                    None if size == "*" else int(size)
+        elif response.status == 200:
+            size = response.getheader("Content-Length")
+
+            return response, release, 0, None if size is None else int(size)
+
+        release()
+
+        raise IOError(
+            "Unexpected response %d for '%s'." % (response.status, url))
+
+    def _stream(self, entry, response, release, position, begin, end):
+        """
+        Yield the bytes from `begin' to `end' of a response that starts at
+        `position'. The bytes are appended to the cache as well, if the
+        response continues the cached prefix and no other download of the
+        entry is in progress.
+        """
+
+        tee = not entry.writing and not entry.complete and \
+            entry.length == position and entry.key in self.cache.entries
+
+        try:
+            if tee:
+                entry.writing = True
+                fp = open(entry.file_name, "ab", 0)
+
+                # Serve the cached part of the range from disk first.
+                if begin < position:
+                    for chunk in self.file_pool.read(
+                            entry.file_name, begin, position - begin,
+                            self.block_size):
+                        yield chunk
+
+            while position < end:
+                chunk = response.read(min(self.block_size, end - position))
+
+                if not chunk:
+                    # The size is known when the response ends.
+                    if tee and entry.size is None:
+                        entry.size = entry.length
+
+                    break
+
+                if tee:
+                    fp.write(chunk)
+                    self.cache.grow(entry, len(chunk))
+
+                if position + len(chunk) > begin:
+                    yield chunk[max(begin - position, 0):]
+
+                position += len(chunk)
+
+            if tee and entry.length == entry.size:
+                fp.close()
+                self.cache.finish(entry)
+        finally:
+            if tee:
+                fp.close()
+                entry.writing = False
+
+            release()
@@ -1,2 +1,3 @@
-from daapserver.models cimport Database, Item, Container, ContainerItem
+from daapserver.models cimport Database, Item, Container, ContainerItem, \
+    StringTable
 from daapserver.daap cimport DAAPObject, SpeedyDAAPObject
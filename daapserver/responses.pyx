@@ -57,7 +57,8 @@ def server_info(provider, server_name, password):
         DAAPObject("daap.protocolversion", "3.0.12"),
         DAAPObject("com.apple.itunes.music-sharing-version", 196619),
         DAAPObject("dmap.itemname", server_name),
-        DAAPObject("dmap.timeoutinterval", 1800),
+        DAAPObject(
+            "dmap.timeoutinterval", provider.session_timeout or 1800),
         DAAPObject("dmap.supportsautologout", 1),
         DAAPObject("dmap.loginrequired", 1 if password else 0),
         DAAPObject("dmap.authenticationmethod", 2 if password else 0),
@@ -198,6 +199,9 @@ def items(provider, new, old, added, removed, is_update):
     Generate items response.
     """
 
+    # Cached encodings of the interned strings of the database.
+    cdef StringTable strings = new.parent.strings
+
     # Single item response
     def _item(Item item):
         data = [
@@ -212,11 +216,14 @@ def items(provider, new, old, added, removed, is_update):
         if item.track is not None:
             data.append(DAAPObject("daap.songtracknumber", item.track))
         if item.artist is not None:
-            data.append(DAAPObject("daap.songartist", item.artist))
+            data.append(DAAPObject(
+                "daap.songartist", strings.encode(item.artist)))
         if item.album is not None:
-            data.append(DAAPObject("daap.songalbum", item.album))
+            data.append(DAAPObject(
+                "daap.songalbum", strings.encode(item.album)))
         if item.album_artist is not None:
-            data.append(DAAPObject("daap.songalbumartist", item.album_artist))
+            data.append(DAAPObject(
+                "daap.songalbumartist", strings.encode(item.album_artist)))
         if item.year is not None:
             data.append(DAAPObject("daap.songyear", item.year))
         if item.bitrate is not None:
@@ -226,7 +233,8 @@ def items(provider, new, old, added, removed, is_update):
         if item.file_size is not None:
             data.append(DAAPObject("daap.songsize", item.file_size))
         if item.file_suffix is not None:
-            data.append(DAAPObject("daap.songformat", item.file_suffix))
+            data.append(DAAPObject(
+                "daap.songformat", strings.encode(item.file_suffix)))
         if provider.supports_artwork and item.album_art:
             data.append(DAAPObject("daap.songartworkcount", 1))
             data.append(DAAPObject("daap.songextradata", 1))
@@ -3,11 +3,34 @@ cdef class RevisionStore(object):
     cdef readonly dict lookup
     cdef readonly int revision
     cdef readonly int min_revision
+    cdef readonly bint dirty
+    cdef readonly bint changed
+    cdef int modified_revision
+    cdef readonly dict indexes
+    cdef public object listener
 
     cdef _add(self, object key, Entry value, Entry elder=?)
 
+    cdef _changing(self)
+    cdef _modified(self)
+    cdef _stale(self, object key)
+    cdef _index(self, object key, object value)
+    cdef _prune(self)
     cdef _check_revision(self, int revision)
 
+    cpdef list values(self, int revision=?)
+    cpdef int count_change(self, int revision)
+
+
+cdef class Index(object):
+    cdef readonly object function
+    cdef readonly bint unique
+    cdef readonly dict entries
+    cdef readonly set stale
+
+    cdef _add(self, object key, object value)
+    cdef _discard(self, object key, object index_value)
+
 
 cdef class Entry(object):
     cdef object value
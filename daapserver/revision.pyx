@@ -8,6 +8,11 @@ cdef class RevisionStore(object):
         self.lookup = dict()
         self.revision = 1
         self.min_revision = 1
+        self.dirty = False
+        self.changed = False
+        self.modified_revision = 0
+        self.indexes = {}
+        self.listener = None
 
     cdef _add(self, object key, Entry value, Entry elder=None):
         """
@@ -34,6 +39,85 @@ cdef class RevisionStore(object):
 
         # For fast random lookup.
         self.lookup[key] = value
+        self.changed = True
+
+        if elder is not None:
+            self._modified()
+
+    cdef _changing(self):
+        """
+        Invoke the listener if the store is about to change for the first time
+        since the last commit. The listener may commit the store to a later
+        revision first, so the change is recorded at that revision.
+        """
+
+        if not self.changed and self.listener is not None:
+            self.listener()
+
+    cdef _modified(self):
+        """
+        Record that an entry was added or replaced at the current revision.
+        """
+
+        self.dirty = True
+        self.modified_revision = self.revision
+
+    cdef _stale(self, object key):
+        """
+        Record that the indexed values of the current value of `key' may
+        become stale.
+        """
+
+        cdef Index index
+        cdef Entry current = self.lookup.get(key)
+
+        if current is None or current.removed:
+            return
+
+        for index in self.indexes.itervalues():
+            index.stale.add((key, index.function(current.value)))
+
+    cdef _index(self, object key, object value):
+        """
+        Add a value to all indexes. Values of unique indexes are checked
+        first, so no index is modified if one is violated.
+        """
+
+        cdef Index index
+
+        self.check_unique(key, value)
+
+        for index in self.indexes.itervalues():
+            index._add(key, value)
+
+    cdef _prune(self):
+        """
+        Remove keys from the indexes for values that are not part of any
+        revision anymore.
+        """
+
+        cdef Index index
+        cdef Entry current
+        cdef bint head
+
+        for index in self.indexes.itervalues():
+            for key, index_value in list(index.stale):
+                current = self.lookup.get(key)
+                head = True
+
+                while current is not None:
+                    if not current.removed and \
+                            index.function(current.value) == index_value:
+                        break
+
+                    current = current.elder
+                    head = False
+
+                if current is None:
+                    index._discard(key, index_value)
+                    index.stale.discard((key, index_value))
+                elif head:
+                    index.stale.discard((key, index_value))
 
     cdef _check_revision(self, int revision):
         """
@@ -44,7 +128,9 @@ cdef class RevisionStore(object):
                 "Revision %d less than minimal revision %d." % (
                     revision, self.min_revision))
 
-        if revision > self.revision:
+        # A store that did not change since the last commit is the same at
+        # later revisions, so it does not have to be committed to them.
+        if revision > self.revision and self.changed:
             raise ValueError("Revision %d exceeds maximal revision %d." % (
                 revision, self.revision))
 
@@ -109,6 +195,65 @@ cdef class RevisionStore(object):
 
                     current = current.next
 
+    cpdef list values(self, int revision=-1):
+        """
+        Return the values of a revision as a list. This is faster than
+        `iterate()' if all values are required.
+
+        :param int revision: Revision to return the values of.
+        :return: List of values.
+        :rtype list:
+        """
+
+        cdef Entry current = self.next
+        cdef list values = []
+
+        if revision != -1:
+            self._check_revision(revision)
+
+        while current is not None:
+            if revision != -1 and revision < current.revision:
+                if current.elder is not None:
+                    current = current.elder
+                else:
+                    current = current.next
+            else:
+                if not current.removed:
+                    values.append(current.value)
+
+                current = current.next
+
+        return values
+
+    cpdef int count_change(self, int revision):
+        """
+        Return the number of values of the latest revision minus the number
+        of values of `revision'. Only keys that changed after `revision' are
+        visited, so values that are evicted are accounted for.
+
+        :param int revision: Revision to compare with.
+        :return: Difference in the number of values.
+        :rtype int:
+        """
+
+        cdef Entry current
+        cdef int change = 0
+
+        for current in self.lookup.itervalues():
+            if current.revision <= revision:
+                continue
+
+            if not current.removed:
+                change += 1
+
+            while current is not None and current.revision > revision:
+                current = current.elder
+
+            if current is not None and not current.removed:
+                change -= 1
+
+        return change
+
     def commit(self, int revision=-1):
         """
         """
@@ -123,6 +268,8 @@ cdef class RevisionStore(object):
 
             self.revision = revision
 
+        self.changed = False
+
     def get(self, object key, int revision=-1):
         """
         """
@@ -151,24 +298,91 @@ cdef class RevisionStore(object):
         """
         """
 
+        cdef Entry entry
+
+        self._changing()
+
         # Wrap in value
-        cdef Entry entry = Entry(
-            value=None, revision=self.revision, removed=True)
+        entry = Entry(value=None, revision=self.revision, removed=True)
+
+        if self.indexes:
+            self._stale(key)
 
         # Replace in the linked list.
         self._add(key, entry, elder=self.lookup[key])
 
+    def evict(self, object key):
+        """
+        Drop `key' from this store, to release the memory held by its value.
+        This is different from removing a key, since no revision is recorded.
+
+        A key can only be evicted if it does not carry any history that is
+        still required, e.g. it has no elder entries and it has not changed
+        since the minimal revision. Otherwise, the evicted key would be
+        missing from the diffs.
+
+        :param object key: Key to evict.
+        :return: True if the key was evicted, False otherwise.
+        :rtype bool:
+        """
+
+        cdef Entry current = self.lookup.get(key)
+
+        if current is None or current.elder is not None or \
+                current.revision >= self.min_revision:
+            return False
+
+        # Unlink from the linked list.
+        if current.previous is not None:
+            current.previous.next = current.next
+        else:
+            self.next = current.next
+
+        if current.next is not None:
+            current.next.previous = current.previous
+
+        del self.lookup[key]
+
+        for index in self.indexes.itervalues():
+            (<Index> index)._discard(key, index.function(current.value))
+
+        return True
+
+    def backdate(self, object key):
+        """
+        Mark the value of `key' as if it was added before the minimal
+        revision. This is useful for (re-)loading values that did not change,
+        for instance after they were evicted, so they do not show up as
+        changed in diffs.
+
+        Keys that carry history are not backdated.
+
+        :param object key: Key to backdate.
+        """
+
+        cdef Entry current = self.lookup[key]
+
+        if current.elder is None:
+            current.revision = self.min_revision - 1
+
     def clean(self, int revision=-1):
         """
+        Drop the history that is not required for revisions starting at
+        `revision'. The entries are only walked if the store is dirty, i.e. if
+        history was recorded since the last clean.
         """
 
         cdef Entry current = self.next
 
-        # Optimize for no revision
-        if revision == -1:
+        if not self.dirty:
+            if revision != -1:
+                self._check_revision(revision)
+        elif revision == -1:
             while current is not None:
                 current.elder = None
                 current = current.next
+
+            self.dirty = False
         else:
             self._check_revision(revision)
 
@@ -184,15 +398,29 @@ cdef class RevisionStore(object):
                     previous.elder = None
                     current = current.next
 
+            # History of later revisions is kept, so it is still dirty.
+            self.dirty = self.modified_revision > revision
+
         # Store minimal revision
         self.min_revision = revision if revision != -1 else self.revision
 
+        if self.indexes:
+            self._prune()
+
     def add(self, object key, object value):
         """
         """
 
+        cdef Entry entry
+
+        self._changing()
+
         # Wrap in value
-        cdef Entry entry = Entry(value=value, revision=self.revision)
+        entry = Entry(value=value, revision=self.revision)
+
+        if self.indexes:
+            self._index(key, value)
+            self._stale(key)
 
         # Add to (or replace in) the linked list
         try:
@@ -200,6 +428,125 @@ cdef class RevisionStore(object):
         except KeyError:
             self._add(key, entry)
 
+    def create_index(self, object name, object function, bint unique=False):
+        """
+        Create a secondary index. The index maps the result of `function' for
+        each value to the keys, for all revisions that are kept.
+
+        :param object name: Name of the index.
+        :param callable function: Function that returns the indexed value of
+                                  a value.
+        :param bool unique: If True, at most one key can have a value in the
+                            latest revision.
+        """
+
+        cdef Entry current
+        cdef Index index
+        cdef bint head
+
+        if name in self.indexes:
+            raise ValueError("Index '%s' already exists." % name)
+
+        index = Index(function, unique=unique)
+
+        for key, current in self.lookup.iteritems():
+            if unique and not current.removed:
+                for other in index.find(function(current.value)):
+                    if other in self:
+                        raise ValueError(
+                            "Value '%s' is not unique, key '%s' has it "
+                            "already." % (function(current.value), other))
+
+            head = True
+
+            while current is not None:
+                if not current.removed:
+                    index._add(key, current.value)
+
+                    if not head:
+                        index.stale.add((key, function(current.value)))
+
+                current = current.elder
+                head = False
+
+        self.indexes[name] = index
+
+    def drop_index(self, object name):
+        """
+        Remove a secondary index.
+
+        :param object name: Name of the index.
+        """
+
+        del self.indexes[name]
+
+    def unindex(self, object key):
+        """
+        Prepare for changing the current value of `key' in place. The indexed
+        values are kept for older revisions. Invoke `reindex(key)' after the
+        value has been changed.
+
+        :param object key: Key of the value that will change.
+        """
+
+        if self.indexes:
+            self._stale(key)
+
+    def reindex(self, object key):
+        """
+        Index the current value of `key' after it was changed in place.
+
+        :param object key: Key of the value that changed.
+        """
+
+        if self.indexes:
+            self._index(key, self.get(key))
+
+    def check_unique(self, object key, object value):
+        """
+        Check that `value' does not violate a unique index, if it would be
+        stored for `key'.
+
+        :param object key: Key of the value.
+        :param object value: Value to check.
+        :raises ValueError: If another key has the value of a unique index.
+        """
+
+        cdef Index index
+
+        for index in self.indexes.itervalues():
+            if not index.unique:
+                continue
+
+            index_value = index.function(value)
+
+            for other in index.entries.get(index_value, ()):
+                if other != key and other in self and \
+                        index.function(self.get(other)) == index_value:
+                    raise ValueError(
+                        "Value '%s' is not unique, key '%s' has it "
+                        "already." % (index_value, other))
+
+    def find(self, object name, object index_value, int revision=-1):
+        """
+        Yield the keys that have `index_value' for an index at a revision.
+
+        :param object name: Name of the index.
+        :param object index_value: Value to look up.
+        :param int revision: Revision to look up.
+        """
+
+        cdef Index index = self.indexes[name]
+
+        for key in list(index.find(index_value)):
+            try:
+                value = self.get(key, revision=revision)
+            except KeyError:
+                continue
+
+            if value is not None and index.function(value) == index_value:
+                yield key
+
     def diff(self, int revision_a, int revision_b):
         """
         """
@@ -272,6 +619,60 @@ cdef class RevisionStore(object):
                     yield key, 0
 
 
+cdef class Index(object):
+    """
+    Secondary index of a `RevisionStore'. Keys that had a value in older
+    revisions are kept, until that revision is cleaned. Therefore, the keys
+    are only candidates that have to be checked against a revision.
+    """
+
+    def __init__(self, object function, bint unique=False):
+        """
+        """
+
+        self.function = function
+        self.unique = unique
+        self.entries = {}
+        self.stale = set()
+
+    def __len__(self):
+        """
+        Return the number of distinct indexed values.
+        """
+
+        return len(self.entries)
+
+    cdef _add(self, object key, object value):
+        """
+        """
+
+        index_value = self.function(value)
+
+        try:
+            (<set> self.entries[index_value]).add(key)
+        except KeyError:
+            self.entries[index_value] = {key}
+
+    cdef _discard(self, object key, object index_value):
+        """
+        """
+
+        cdef set keys = self.entries.get(index_value)
+
+        if keys is not None:
+            keys.discard(key)
+
+            if not keys:
+                del self.entries[index_value]
+
+    def find(self, object index_value):
+        """
+        Return the candidate keys for an indexed value.
+        """
+
+        return self.entries.get(index_value, ())
+
+
 cdef class Entry(object):
     """
     """
@@ -2,14 +2,17 @@ from daapserver import responses, utils
 
 from flask import Flask, Response, request
 from werkzeug.contrib.cache import SimpleCache
+from werkzeug.wsgi import wrap_file
 from werkzeug import http
 
 from functools import wraps
 
+import calendar
 import hashlib
 import inspect
 import logging
 import time
+import uuid
 
 # Logger instance
 logger = logging.getLogger(__name__)
@@ -31,6 +34,13 @@ QS_IGNORE_CACHE = [
     "session-id",
 ]
 
+# Query string arguments with server revisions. Used by the daap_cache, which
+# uses the local revisions of a database instead.
+QS_REVISIONS = [
+    "revision-number",
+    "delta",
+]
+
 
 class ObjectResponse(Response):
     """
@@ -167,6 +177,22 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
         return _inner
     app.authenticate = daap_authenticate
 
+    def daap_session(func):
+        """
+        Check the session ID of the request. Returns 403 response if the
+        session is unknown, e.g. because it expired. The client should login
+        again.
+        """
+
+        @wraps(func)
+        def _inner(*args, **kwargs):
+            session_id = request.args.get("session-id", type=int)
+
+            if session_id not in provider.sessions:
+                return Response(None, 403)
+            return func(*args, **kwargs)
+        return _inner
+
     def daap_cache_response(func):
         """
         Cache object responses if the cache has been initialized. The cache key
@@ -192,9 +218,14 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
             key.update(request.path)
 
             for k, v in request.args.iteritems():
-                if k not in QS_IGNORE_CACHE:
+                if k not in QS_IGNORE_CACHE and k not in QS_REVISIONS:
                     key.update(v)
 
+            # Use the local revisions of the database, so the response is
+            # shared between server revisions that did not change it.
+            key.update("%d-%d-%d" % get_local_revisions(
+                kwargs.get("database_id")))
+
             # Hit the cache
             key = key.digest()
             value = cache.get(key)
@@ -207,6 +238,123 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
             return value
         return _inner
 
+    def get_local_revisions(database_id):
+        """
+        Return the requested revision and delta, translated to the local
+        revisions of a database, and whether the history of the delta has
+        been removed.
+        """
+
+        revision = request.args.get("revision-number", 0, type=int)
+        delta = request.args.get("delta", 0, type=int)
+        stale = delta != 0 and provider.is_stale(revision, delta)
+
+        if database_id is not None:
+            try:
+                database = provider.server.databases[database_id]
+            except KeyError:
+                pass
+            else:
+                revision = database.to_local_revision(revision)
+                delta = database.to_local_revision(delta)
+
+        return revision, delta, stale
+
+    def daap_conditional_response(func):
+        """
+        Answer conditional requests for listings with `304 Not Modified',
+        before the response is generated. The entity tag is derived from the
+        request and the revisions of the provider, so it changes when the
+        provider publishes new data.
+        """
+
+        @wraps(func)
+        def _inner(*args, **kwargs):
+            key = hashlib.md5()
+
+            # Add basic info
+            key.update(func.__name__)
+            key.update(request.path)
+
+            for k, v in sorted(request.args.iteritems()):
+                if k not in QS_IGNORE_CACHE:
+                    key.update("%s=%s&" % (k, v))
+
+            # A delta may become a full response if the history is cleaned.
+            key.update("%d-%d" % (provider.revision, provider.min_revision))
+
+            validators = key.hexdigest(), None
+
+            if is_not_modified(validators):
+                return not_modified(validators)
+
+            response = func(*args, **kwargs)
+            set_validators(response, validators)
+
+            return response
+        return _inner
+
+    def is_not_modified(validators):
+        """
+        Check whether the client has a representation with the given
+        validators already. `If-None-Match' takes precedence over
+        `If-Modified-Since', as per RFC7232 section 6.
+        """
+
+        if validators is None:
+            return False
+
+        etag, last_modified = validators
+
+        if request.if_none_match:
+            return request.if_none_match.contains_weak(etag)
+
+        if last_modified is not None and request.if_modified_since:
+            return last_modified <= calendar.timegm(
+                request.if_modified_since.utctimetuple())
+
+        return False
+
+    def set_validators(response, validators):
+        """
+        Set the `ETag' and `Last-Modified' headers of a response.
+        """
+
+        if validators is None:
+            return
+
+        etag, last_modified = validators
+        response.set_etag(etag)
+
+        if last_modified is not None:
+            response.last_modified = last_modified
+
+    def not_modified(validators):
+        """
+        Return a `304 Not Modified' response with the given validators.
+        """
+
+        response = Response(None, 304)
+        set_validators(response, validators)
+
+        return response
+
+    def stream_file(data):
+        """
+        Wrap file objects with `wsgi.file_wrapper', if the WSGI server provides
+        it, so the file can be sent without copying it through Python.
+        Otherwise, the provider reads the file in blocks. Other data is
+        returned as is.
+        """
+
+        if hasattr(data, "fileno"):
+            if "wsgi.file_wrapper" in request.environ:
+                return wrap_file(request.environ, data)
+
+            return provider.iter_file(data)
+
+        return data
+
     #
     # Request handlers
     #
@@ -276,16 +424,20 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
     @app.route("/activity", methods=["GET"])
     @daap_trace
     @daap_authenticate
+    @daap_session
     @daap_unpack_args
     def activity(session_id):
         """
         """
 
+        provider.touch_session(session_id)
+
         return Response(None, status=200)
 
     @app.route("/update", methods=["GET"])
     @daap_trace
     @daap_authenticate
+    @daap_session
     @daap_unpack_args
     def update(session_id, revision, delta):
         """
@@ -311,6 +463,8 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
     @app.route("/databases", methods=["GET"])
     @daap_trace
     @daap_authenticate
+    @daap_session
+    @daap_conditional_response
     @daap_cache_response
     @daap_unpack_args
     def databases(session_id, revision, delta):
@@ -329,13 +483,25 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
         "/databases/<int:database_id>/items/<int:item_id>/extra_data/artwork",
         methods=["GET"])
     @daap_trace
+    @daap_session
     @daap_unpack_args
     def database_item_artwork(database_id, item_id, session_id):
         """
         """
 
+        # Clients request thumbnails of a maximum width and height.
+        width = request.args.get("mw", type=int)
+        height = request.args.get("mh", type=int)
+
+        validators = provider.get_artwork_validators(
+            session_id, database_id, item_id, width=width, height=height)
+
+        if is_not_modified(validators):
+            return not_modified(validators)
+
         data, mimetype, total_length = provider.get_artwork(
-            session_id, database_id, item_id)
+            session_id, database_id, item_id, width=width, height=height)
+        data = stream_file(data)
 
         # Setup response
         response = Response(
@@ -345,12 +511,17 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
         if total_length:
             response.headers["Content-Length"] = total_length
 
+        # The content hash may be known now.
+        set_validators(response, provider.get_artwork_validators(
+            session_id, database_id, item_id, width=width, height=height))
+
         return response
 
     @app.route(
         "/databases/<int:database_id>/groups/<int:group_id>/extra_data/"
         "artwork", methods=["GET"])
     @daap_trace
+    @daap_session
     @daap_unpack_args
     def database_group_artwork(database_id, group_id, session_id, revision,
                                delta):
@@ -362,17 +533,64 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
         "/databases/<int:database_id>/items/<int:item_id>.<suffix>",
         methods=["GET"])
     @daap_trace
+    @daap_session
     @daap_unpack_args
     def database_item(database_id, item_id, suffix, session_id):
         """
         """
 
+        validators = provider.get_item_validators(
+            session_id, database_id, item_id)
+
+        if is_not_modified(validators):
+            return not_modified(validators)
+
         range_header = request.headers.get("Range", None)
+        ranges = range_header and http.parse_range_header(range_header)
 
-        if range_header:
-            begin, end = http.parse_range_header(range_header).ranges[0]
+        # Resolve suffix and open-ended ranges against the size of the item.
+        # Invalid headers are ignored.
+        if ranges:
+            total_length = provider.get_item_size(
+                session_id, database_id, item_id)
+            ranges = utils.resolve_byte_ranges(ranges.ranges, total_length)
+
+            if ranges is not None and not ranges:
+                return Response(None, 416, {
+                    "Content-Range": "bytes */%d" % total_length})
+
+        if ranges and len(ranges) > 1:
+            parts, mimetype, total_length = provider.get_item_ranges(
+                session_id, database_id, item_id, ranges)
+            boundary = uuid.uuid4().hex
+
+            def _inner():
+                # Stream the parts, separated by boundaries, as per RFC7233
+                # appendix A.
+                for (begin, end), data in parts:
+                    yield "--%s\r\nContent-Type: %s\r\n" \
+                        "Content-Range: bytes %d-%d/%s\r\n\r\n" % (
+                            boundary, mimetype, begin, end - 1,
+                            total_length if total_length > 0 else "*")
+
+                    for chunk in data:
+                        yield chunk
+
+                    yield "\r\n"
+
+                yield "--%s--\r\n" % boundary
+
+            # Setup response
+            response = Response(
+                _inner(), 206,
+                content_type="multipart/byteranges; boundary=%s" % boundary,
+                direct_passthrough=True)
+            response.call_on_close(parts.close)
+        elif ranges:
+            begin, end = ranges[0]
             data, mimetype, total_length = provider.get_item(
                 session_id, database_id, item_id, byte_range=(begin, end))
+            data = stream_file(data)
             begin, end = (begin or 0), (end or total_length)
 
             # Setup response
@@ -392,6 +610,7 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
         else:
             data, mimetype, total_length = provider.get_item(
                 session_id, database_id, item_id)
+            data = stream_file(data)
 
             # Setup response
             response = Response(
@@ -401,11 +620,15 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
             if total_length > 0:
                 response.headers["Content-Length"] = total_length
 
+        set_validators(response, validators)
+
         return response
 
     @app.route("/databases/<int:database_id>/items", methods=["GET"])
     @daap_trace
     @daap_authenticate
+    @daap_session
+    @daap_conditional_response
     @daap_cache_response
     @daap_unpack_args
     def database_items(database_id, session_id, revision, delta, type):
@@ -422,6 +645,8 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
     @app.route("/databases/<int:database_id>/containers", methods=["GET"])
     @daap_trace
     @daap_authenticate
+    @daap_session
+    @daap_conditional_response
     @daap_cache_response
     @daap_unpack_args
     def database_containers(database_id, session_id, revision, delta):
@@ -440,6 +665,7 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
     @app.route("/databases/<int:database_id>/groups", methods=["GET"])
     @daap_trace
     @daap_authenticate
+    @daap_session
     @daap_cache_response
     @daap_unpack_args
     def database_groups(database_id, session_id, revision, delta, type):
@@ -452,6 +678,8 @@ def create_server_app(provider, password=None, cache=True, cache_timeout=3600,
         methods=["GET"])
     @daap_trace
     @daap_authenticate
+    @daap_session
+    @daap_conditional_response
     @daap_cache_response
     @daap_unpack_args
     def database_container_item(database_id, container_id, session_id,
@@ -0,0 +1,566 @@
+from daapserver.collection import LazyMutableCollection
+from daapserver.models import Server, Database, Item, Container, \
+    ContainerItem
+from daapserver.provider import LocalFileProvider
+
+import sqlite3
+
+__all__ = (
+    "SQLiteCollection", "SQLiteItemCollection", "SQLiteContainerCollection",
+    "SQLiteContainerItemCollection", "SQLiteDatabase", "SQLiteContainer",
+    "SQLiteProvider", "create_schema")
+
+# Maximum number of IDs per query. SQLite limits the number of host parameters
+# to 999 by default.
+BATCH_SIZE = 500
+
+# Table definitions. Every table stores the model fields, prefixed by the
+# columns that form the primary key. The primary keys double as index for the
+# `COUNT' and `load' queries.
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS databases (
+        id INTEGER NOT NULL,
+        persistent_id INTEGER,
+        name TEXT,
+        PRIMARY KEY (id)
+    );
+
+    CREATE TABLE IF NOT EXISTS items (
+        database_id INTEGER NOT NULL,
+        id INTEGER NOT NULL,
+        persistent_id INTEGER,
+        name TEXT,
+        track INTEGER,
+        artist TEXT,
+        album TEXT,
+        album_artist TEXT,
+        year INTEGER,
+        bitrate INTEGER,
+        duration INTEGER,
+        file_size INTEGER,
+        file_name TEXT,
+        file_type TEXT,
+        file_suffix TEXT,
+        album_art TEXT,
+        genre TEXT,
+        PRIMARY KEY (database_id, id)
+    );
+
+    CREATE TABLE IF NOT EXISTS containers (
+        database_id INTEGER NOT NULL,
+        id INTEGER NOT NULL,
+        persistent_id INTEGER,
+        parent_id INTEGER,
+        name TEXT,
+        is_smart INTEGER NOT NULL DEFAULT 0,
+        is_base INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (database_id, id)
+    );
+
+    CREATE TABLE IF NOT EXISTS container_items (
+        database_id INTEGER NOT NULL,
+        container_id INTEGER NOT NULL,
+        id INTEGER NOT NULL,
+        item_id INTEGER NOT NULL,
+        "order" INTEGER,
+        PRIMARY KEY (database_id, container_id, id)
+    );
+"""
+
+# Columns per table, in the order of the model fields.
+DATABASE_COLUMNS = ("id", "persistent_id", "name")
+ITEM_COLUMNS = (
+    "id", "persistent_id", "database_id", "name", "track", "artist", "album",
+    "album_artist", "year", "bitrate", "duration", "file_size", "file_name",
+    "file_type", "file_suffix", "album_art", "genre")
+CONTAINER_COLUMNS = (
+    "id", "persistent_id", "database_id", "parent_id", "name", "is_smart",
+    "is_base")
+CONTAINER_ITEM_COLUMNS = (
+    "id", "database_id", "container_id", "item_id", "order")
+
+
+def create_schema(connection):
+    """
+    Create the tables, if they do not exist yet.
+
+    :param sqlite3.Connection connection: Database connection.
+    """
+
+    connection.executescript(SCHEMA)
+
+
+def _quote(columns):
+    """
+    Quote column names for use in a query (`order' is a keyword).
+    """
+
+    return ", ".join("\"%s\"" % column for column in columns)
+
+
+class SQLiteCollection(LazyMutableCollection):
+    """
+    Lazy collection backed by a SQLite table. Items are loaded on a miss using
+    point lookups, and in batches when (re-)loading multiple IDs.
+
+    A subclass should define the `table', `columns' and `model_class'
+    attributes, and implement `scope()' to limit the rows to the parent.
+
+    The parent is expected to have a `connection' attribute.
+    """
+
+    __slots__ = LazyMutableCollection.__slots__
+
+    point_loading = True
+
+    # Table name, column names and model to instantiate for each row.
+    table = None
+    columns = None
+    model_class = None
+
+    def scope(self):
+        """
+        Return the columns and values that limit the rows of the table to the
+        ones belonging to the parent.
+
+        :return: Tuple of (columns, values)
+        :rtype tuple:
+        """
+
+        raise NotImplementedError("Needs to be overridden.")
+
+    def create(self, row):
+        """
+        Instantiate the model for a row. NULL values are skipped, since not
+        all model fields accept None.
+
+        :param tuple row: Row of the table.
+        :return: New model instance.
+        """
+
+        return self.model_class(**dict(
+            (column, value) for column, value in zip(self.columns, row)
+            if value is not None))
+
+    def query(self, item_ids=None):
+        """
+        Yield the rows for `item_ids'. If `item_ids' is None, yield all rows
+        of the parent. IDs are queried in batches of `BATCH_SIZE'.
+        """
+
+        columns, values = self.scope()
+        where = " AND ".join("\"%s\" = ?" % column for column in columns)
+        sql = "SELECT %s FROM %s WHERE %s" % (
+            _quote(self.columns), self.table, where)
+
+        cursor = self.parent.connection.cursor()
+
+        if item_ids is None:
+            for row in cursor.execute(sql, values):
+                yield row
+        else:
+            item_ids = list(item_ids)
+
+            for i in xrange(0, len(item_ids), BATCH_SIZE):
+                batch = item_ids[i:i + BATCH_SIZE]
+
+                for row in cursor.execute(
+                        "%s AND id IN (%s)" % (
+                            sql, ", ".join("?" * len(batch))),
+                        tuple(values) + tuple(batch)):
+                    yield row
+
+    def count(self):
+        """
+        Count the rows using the primary key index.
+        """
+
+        columns, values = self.scope()
+        where = " AND ".join("\"%s\" = ?" % column for column in columns)
+
+        cursor = self.parent.connection.execute(
+            "SELECT COUNT(*) FROM %s WHERE %s" % (self.table, where), values)
+
+        return cursor.fetchone()[0]
+
+    def load(self, item_ids=None):
+        """
+        Load all rows, or (re-)load the rows for `item_ids'. Resident items
+        are not re-added when loading all rows.
+        """
+
+        if self.busy:
+            raise ValueError("Already busy")
+
+        try:
+            self.busy = True
+
+            for row in self.query(item_ids):
+                item_id = row[0]
+
+                if item_ids is None and item_id in self.store:
+                    item = self.store.get(item_id)
+                else:
+                    item = self.create(row)
+                    self.store.add(item_id, item)
+
+                self.iter_item = item
+                yield item
+
+            # Final actions after all items have been loaded
+            if item_ids is None:
+                self.ready = True
+
+                if self.pending_commit != -1:
+                    revision = self.pending_commit
+                    self.pending_commit = -1
+                    self.commit(revision)
+        finally:
+            self.busy = False
+
+
+class SQLiteItemCollection(SQLiteCollection):
+    """
+    Items of a `SQLiteDatabase'.
+    """
+
+    __slots__ = SQLiteCollection.__slots__
+
+    table = "items"
+    columns = ITEM_COLUMNS
+    model_class = Item
+
+    def scope(self):
+        return ("database_id", ), (self.parent.id, )
+
+    def create(self, row):
+        """
+        Instantiate an item, with its strings interned in the database.
+        """
+
+        item = super(SQLiteItemCollection, self).create(row)
+        item.intern(self.parent.strings)
+
+        return item
+
+
+class SQLiteContainerItemCollection(SQLiteCollection):
+    """
+    Container items of a `SQLiteContainer'.
+    """
+
+    __slots__ = SQLiteCollection.__slots__
+
+    table = "container_items"
+    columns = CONTAINER_ITEM_COLUMNS
+    model_class = ContainerItem
+
+    def scope(self):
+        return ("database_id", "container_id"), (
+            self.parent.database_id, self.parent.id)
+
+
+class SQLiteContainer(Container):
+    """
+    Container that loads its container items from SQLite.
+    """
+
+    __slots__ = Container.__slots__ + ("connection", )
+
+    container_items_collection_class = SQLiteContainerItemCollection
+
+    def __copy__(self):
+        """
+        Return a copy of this instance, including the connection.
+        """
+
+        result = super(SQLiteContainer, self).__copy__()
+        result.connection = self.connection
+
+        return result
+
+
+class SQLiteContainerCollection(SQLiteCollection):
+    """
+    Containers of a `SQLiteDatabase'.
+    """
+
+    __slots__ = SQLiteCollection.__slots__
+
+    table = "containers"
+    columns = CONTAINER_COLUMNS
+    model_class = SQLiteContainer
+
+    def scope(self):
+        return ("database_id", ), (self.parent.id, )
+
+    def create(self, row):
+        """
+        Instantiate a container, which shares the connection of the database.
+        A reloaded container keeps the container items of the previous
+        instance, to preserve their revision history.
+        """
+
+        container = super(SQLiteContainerCollection, self).create(row)
+        container.connection = self.parent.connection
+
+        try:
+            container.container_items = self.store.get(row[0]).container_items
+        except KeyError:
+            self.parent.attach(container.container_items)
+
+        return container
+
+
+class SQLiteDatabase(Database):
+    """
+    Database that loads its items and containers from SQLite.
+    """
+
+    __slots__ = Database.__slots__ + ("connection", )
+
+    items_collection_class = SQLiteItemCollection
+    containers_collection_class = SQLiteContainerCollection
+
+    def __copy__(self):
+        """
+        Return a copy of this instance, including the connection.
+        """
+
+        result = super(SQLiteDatabase, self).__copy__()
+        result.connection = self.connection
+
+        return result
+
+
+class SQLiteProvider(LocalFileProvider):
+    """
+    Provider that stores the databases, items, containers and container items
+    in SQLite. Only the databases are kept in memory, the other objects are
+    loaded on demand.
+
+    The `put_*' and `delete_*' methods write the rows and record the changes
+    in the revisioned collections. Invoke `update()' afterwards to publish the
+    changes to the clients.
+    """
+
+    database_class = SQLiteDatabase
+
+    def __init__(self, file_name=":memory:", server_name="DAAPServer"):
+        """
+        Create a new SQLite provider. Existing databases in the file are added
+        to the server.
+
+        :param str file_name: SQLite database file.
+        :param str server_name: Name of the server.
+        """
+
+        super(SQLiteProvider, self).__init__()
+
+        self.connection = sqlite3.connect(file_name)
+        create_schema(self.connection)
+
+        self.server = Server(name=server_name)
+
+        for row in self.connection.execute(
+                "SELECT %s FROM databases" % _quote(DATABASE_COLUMNS)):
+            database = self.database_class(connection=self.connection)
+
+            for column, value in zip(DATABASE_COLUMNS, row):
+                if value is not None:
+                    setattr(database, column, value)
+
+            self.server.databases.add(database)
+
+    def _write(self, table, columns, rows):
+        """
+        Insert or replace rows in a table.
+        """
+
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO %s (%s) VALUES (%s)" % (
+                table, _quote(columns), ", ".join("?" * len(columns))),
+            rows)
+
+    def _delete(self, table, scope, ids):
+        """
+        Delete rows from a table in batches.
+        """
+
+        columns, values = scope
+        where = " AND ".join("\"%s\" = ?" % column for column in columns)
+        ids = list(ids)
+
+        for i in xrange(0, len(ids), BATCH_SIZE):
+            batch = ids[i:i + BATCH_SIZE]
+
+            self.connection.execute(
+                "DELETE FROM %s WHERE %s AND id IN (%s)" % (
+                    table, where, ", ".join("?" * len(batch))),
+                tuple(values) + tuple(batch))
+
+    def put_database(self, database_id, name, persistent_id=None):
+        """
+        Add or update a database.
+
+        :return: The database instance.
+        :rtype SQLiteDatabase:
+        """
+
+        with self.connection:
+            self._write(
+                "databases", DATABASE_COLUMNS,
+                [(database_id, persistent_id, name)])
+
+        try:
+            database = self.server.databases[database_id]
+        except KeyError:
+            database = self.database_class(
+                id=database_id, connection=self.connection)
+
+        database.name = name
+
+        if persistent_id is not None:
+            database.persistent_id = persistent_id
+
+        self.server.databases.add(database)
+
+        return database
+
+    def put_items(self, database_id, items):
+        """
+        Add or update items of a database.
+
+        :param int database_id: Database ID.
+        :param iterable items: Items to write.
+        """
+
+        database = self.server.databases[database_id]
+        rows = []
+
+        for item in items:
+            item.database_id = database_id
+            rows.append(tuple(
+                getattr(item, column) for column in ITEM_COLUMNS))
+
+        with self.connection:
+            self._write("items", ITEM_COLUMNS, rows)
+
+        database.items.update_ids([row[0] for row in rows])
+        self.server.databases.add(database)
+
+    def delete_items(self, database_id, item_ids):
+        """
+        Remove items from a database.
+
+        :param int database_id: Database ID.
+        :param list item_ids: IDs of items to remove.
+        """
+
+        database = self.server.databases[database_id]
+
+        # Record the removal before the rows are deleted.
+        database.items.remove_ids(item_ids)
+
+        with self.connection:
+            self._delete("items", database.items.scope(), item_ids)
+
+        self.server.databases.add(database)
+
+    def put_containers(self, database_id, containers):
+        """
+        Add or update containers of a database.
+
+        :param int database_id: Database ID.
+        :param iterable containers: Containers to write.
+        """
+
+        database = self.server.databases[database_id]
+        rows = []
+
+        for container in containers:
+            container.database_id = database_id
+            rows.append(tuple(
+                getattr(container, column) for column in CONTAINER_COLUMNS))
+
+        with self.connection:
+            self._write("containers", CONTAINER_COLUMNS, rows)
+
+        database.containers.update_ids([row[0] for row in rows])
+        self.server.databases.add(database)
+
+    def delete_containers(self, database_id, container_ids):
+        """
+        Remove containers, and their container items, from a database.
+
+        :param int database_id: Database ID.
+        :param list container_ids: IDs of containers to remove.
+        """
+
+        database = self.server.databases[database_id]
+
+        # Record the removal before the rows are deleted.
+        database.containers.remove_ids(container_ids)
+
+        with self.connection:
+            self._delete(
+                "containers", database.containers.scope(), container_ids)
+
+            for container_id in container_ids:
+                self.connection.execute(
+                    "DELETE FROM container_items WHERE database_id = ? AND "
+                    "container_id = ?", (database_id, container_id))
+
+        self.server.databases.add(database)
+
+    def put_container_items(self, database_id, container_id,
+                            container_items):
+        """
+        Add or update container items of a container.
+
+        :param int database_id: Database ID.
+        :param int container_id: Container ID.
+        :param iterable container_items: Container items to write.
+        """
+
+        database = self.server.databases[database_id]
+        container = database.containers[container_id]
+        rows = []
+
+        for container_item in container_items:
+            container_item.database_id = database_id
+            container_item.container_id = container_id
+            rows.append(tuple(
+                getattr(container_item, column)
+                for column in CONTAINER_ITEM_COLUMNS))
+
+        with self.connection:
+            self._write("container_items", CONTAINER_ITEM_COLUMNS, rows)
+
+        container.container_items.update_ids([row[0] for row in rows])
+        database.containers.update_ids([container_id])
+        self.server.databases.add(database)
+
+    def delete_container_items(self, database_id, container_id,
+                               container_item_ids):
+        """
+        Remove container items from a container.
+
+        :param int database_id: Database ID.
+        :param int container_id: Container ID.
+        :param list container_item_ids: IDs of container items to remove.
+        """
+
+        database = self.server.databases[database_id]
+        container = database.containers[container_id]
+
+        # Record the removal before the rows are deleted.
+        container.container_items.remove_ids(container_item_ids)
+
+        with self.connection:
+            self._delete(
+                "container_items", container.container_items.scope(),
+                container_item_ids)
+
+        database.containers.update_ids([container_id])
+        self.server.databases.add(database)
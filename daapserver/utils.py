@@ -1,6 +1,26 @@
+import os
 import sys
+import mmap
 import uuid
 import ctypes
+import ctypes.util
+import threading
+import collections
+
+# Python 2.7 does not provide `os.posix_fadvise', so it is invoked from libc.
+# The value of POSIX_FADV_WILLNEED is platform specific, so only Linux is
+# supported.
+POSIX_FADV_WILLNEED = 3
+
+try:
+    if not sys.platform.startswith("linux"):
+        raise OSError("Unsupported platform")
+
+    _posix_fadvise = ctypes.CDLL(ctypes.util.find_library("c")).posix_fadvise
+    _posix_fadvise.argtypes = (
+        ctypes.c_int, ctypes.c_long, ctypes.c_long, ctypes.c_int)
+except (OSError, AttributeError):
+    _posix_fadvise = None
 
 
 def diff(new, old):
@@ -19,6 +39,11 @@ def diff(new, old):
     if old is not None:
         is_update = True
 
+        # Comparing a revision with itself would yield the changes of that
+        # revision, but nothing changed in between.
+        if new.revision == old.revision:
+            return set(), set(), is_update
+
         removed = set(new.removed(old))
         updated = set(new.updated(old))
     else:
@@ -69,6 +94,98 @@ def parse_byte_range(byte_range, min_byte=0, max_byte=sys.maxint):
     return begin, end
 
 
+def resolve_byte_ranges(byte_ranges, size, max_ranges=16):
+    """
+    Resolve the byte ranges of a `Range' header to absolute (begin, end)
+    offsets, given the size of the file. Suffix ranges have a negative begin,
+    and open-ended ranges have no end. Ranges that start at or after the end
+    of the file are unsatisfiable, and are dropped as per RFC7233 section 2.1.
+    Overlapping and adjacent ranges are coalesced, as allowed by RFC7233
+    section 4.1, so each byte is sent once.
+
+    If the size is unknown, a single open-ended range is kept as is. Suffix
+    ranges and multiple ranges cannot be resolved then, since the parts of a
+    multipart response need their end. None is returned in that case, and
+    the header should be ignored. The same applies if more than `max_ranges'
+    ranges remain, since each range may cost a request or a read.
+
+    :param list byte_ranges: List of (begin, end) tuples.
+    :param int size: Size of the file, or zero if unknown.
+    :param int max_ranges: Maximum number of ranges to serve.
+    :return: List of satisfiable (begin, end) tuples, or None.
+    :rtype list:
+    """
+
+    if size <= 0:
+        if len(byte_ranges) != 1 or byte_ranges[0][0] < 0:
+            return None
+
+        return list(byte_ranges)
+
+    resolved = []
+
+    for begin, end in byte_ranges:
+        if begin < 0:
+            resolved.append((max(size + begin, 0), size))
+        elif begin < size:
+            resolved.append((begin, min(end or size, size)))
+
+    result = []
+
+    for begin, end in sorted(resolved):
+        if result and begin <= result[-1][1]:
+            result[-1] = (result[-1][0], max(result[-1][1], end))
+        else:
+            result.append((begin, end))
+
+    if len(result) > max_ranges:
+        return None
+
+    return result
+
+
+def file_validators(file_name):
+    """
+    Return the validators of a file, derived from its inode, size and
+    modification time.
+
+    :param str file_name: Path of the file.
+    :return: Tuple of (etag, last_modified), or None if the file does not
+             exist.
+    :rtype tuple:
+    """
+
+    if not isinstance(file_name, basestring):
+        return None
+
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        return None
+
+    etag = "%x-%x-%x" % (stat.st_ino, stat.st_size, int(stat.st_mtime))
+
+    return etag, int(stat.st_mtime)
+
+
+def fadvise_willneed(fd, offset, length):
+    """
+    Advise the kernel that a part of a file is needed soon, so it is read
+    into the page cache in the background.
+
+    :param int fd: Descriptor of the file.
+    :param int offset: Position of the part.
+    :param int length: Number of bytes of the part.
+    :return: True if the advice was given, False if not supported.
+    :rtype bool:
+    """
+
+    if _posix_fadvise is None:
+        return False
+
+    return _posix_fadvise(fd, offset, length, POSIX_FADV_WILLNEED) == 0
+
+
 def to_tree(instance, *children):
     """
     Generate tree structure of an instance, and its children. This method
@@ -127,3 +244,570 @@ def invoke_hooks(hooks, name, *args, **kwargs):
 
     for callback in callbacks:
         callback(*args, **kwargs)
+
+
+class StreamingFile(object):
+    """
+    Wrapper for a file object, that invokes a callback when it is closed. The
+    file is passed to the WSGI server as is, so a server that provides
+    `wsgi.file_wrapper' can send it using `fileno()', e.g. with `sendfile'.
+    """
+
+    __slots__ = ("fp", "callback")
+
+    def __init__(self, fp, callback=None):
+        """
+        Construct a new streaming file.
+
+        :param file fp: File object to wrap.
+        :param callable callback: Invoked once, when the file is closed.
+        """
+
+        self.fp = fp
+        self.callback = callback
+
+    def __getattr__(self, name):
+        """
+        Proxy other attributes (e.g. `read', `seek' and `fileno') to the file.
+        """
+
+        return getattr(self.fp, name)
+
+    def close(self):
+        """
+        Close the file and invoke the callback, even if closing fails.
+        """
+
+        callback, self.callback = self.callback, None
+
+        try:
+            self.fp.close()
+        finally:
+            if callback is not None:
+                callback()
+
+
+class FilePool(object):
+    """
+    Pool of read-only file descriptors, keyed by path. Concurrent reads of the
+    same file share one descriptor, since reads are positional. At most
+    `max_open' descriptors are kept open. The least recently used ones are
+    closed first, but descriptors that are in use are never closed.
+
+    If a thread pool is given, files are opened and read by its threads, so
+    a slow disk does not block the event loop. The next block is read ahead,
+    while the current block is sent.
+
+    Files that are removed or replaced should be invalidated, otherwise the
+    descriptor of the old file is reused.
+    """
+
+    def __init__(self, max_open=64, threadpool=None):
+        """
+        Construct a new, empty pool.
+
+        :param int max_open: Maximum number of descriptors to keep open.
+        :param ThreadPool threadpool: Optional gevent thread pool to perform
+                                      blocking calls in.
+        """
+
+        self.max_open = max_open
+        self.threadpool = threadpool
+        self.descriptors = collections.OrderedDict()
+        self.references = collections.defaultdict(int)
+        self.invalidated = {}
+
+    def __len__(self):
+        """
+        Return the number of open descriptors.
+        """
+
+        return len(self.descriptors)
+
+    def acquire(self, path):
+        """
+        Return the descriptor of a file, and mark it as in use. Opens the file
+        if it is not in the pool. Every call should be followed by exactly one
+        call to `release(path, fd)'.
+
+        :param str path: Path of the file.
+        :return: Tuple of the descriptor and a lock for seeking.
+        :rtype tuple:
+        """
+
+        try:
+            descriptor = self.descriptors.pop(path)
+        except KeyError:
+            fd = self.call(os.open, path, os.O_RDONLY)
+
+            # Another reader may have opened the file in the meantime.
+            descriptor = self.descriptors.pop(path, None)
+
+            if descriptor is None:
+                descriptor = fd, threading.Lock()
+            else:
+                os.close(fd)
+
+        # Re-insert as most recently used.
+        self.descriptors[path] = descriptor
+        self.references[path] += 1
+
+        self.evict()
+
+        return descriptor
+
+    def release(self, path, fd=None):
+        """
+        Mark a descriptor as not in use by the caller anymore.
+
+        :param str path: Path of the file.
+        :param int fd: Descriptor returned by `acquire(path)'. Required if
+                       the path may be invalidated while it is in use.
+        """
+
+        # Invalidated descriptors are closed by the last reader.
+        if fd in self.invalidated:
+            self.invalidated[fd] -= 1
+
+            if self.invalidated[fd] == 0:
+                del self.invalidated[fd]
+                os.close(fd)
+
+            return
+
+        self.references[path] -= 1
+
+        if self.references[path] == 0:
+            del self.references[path]
+
+        self.evict()
+
+    def evict(self):
+        """
+        Close the least recently used descriptors that are not in use, until
+        at most `max_open' descriptors are open.
+        """
+
+        for path in list(self.descriptors):
+            if len(self.descriptors) <= self.max_open:
+                break
+
+            if path not in self.references:
+                os.close(self.descriptors.pop(path)[0])
+
+    def invalidate(self, path):
+        """
+        Drop the descriptor of a file, e.g. because the file was removed or
+        replaced, so the file is opened again when it is acquired next.
+        Readers that use the descriptor can continue. It is closed when the
+        last one releases it.
+
+        :param str path: Path of the file.
+        """
+
+        descriptor = self.descriptors.pop(path, None)
+
+        if descriptor is None:
+            return
+
+        references = self.references.pop(path, 0)
+
+        if references > 0:
+            self.invalidated[descriptor[0]] = references
+        else:
+            os.close(descriptor[0])
+
+    def close(self):
+        """
+        Close all descriptors that are not in use.
+        """
+
+        for path in list(self.descriptors):
+            if path not in self.references:
+                os.close(self.descriptors.pop(path)[0])
+
+    def call(self, function, *args):
+        """
+        Invoke a blocking function, in the thread pool if there is one.
+        """
+
+        if self.threadpool is None:
+            return function(*args)
+
+        return self.threadpool.apply(function, args)
+
+    def read(self, path, offset, length, block_size=65536):
+        """
+        Yield at most `length' bytes of a file, starting at `offset', in
+        blocks of at most `block_size' bytes. Only one block is kept in memory
+        at a time, or two when reading ahead. The descriptor is released when
+        done.
+
+        :param str path: Path of the file.
+        :param int offset: Position to start reading.
+        :param int length: Number of bytes to read.
+        :param int block_size: Maximum number of bytes per block.
+        """
+
+        fd, lock = self.acquire(path)
+        pending = None
+
+        try:
+            if self.threadpool is None:
+                while length > 0:
+                    data = pread(fd, min(block_size, length), offset, lock)
+
+                    if not data:
+                        break
+
+                    offset += len(data)
+                    length -= len(data)
+                    yield data
+            elif length > 0:
+                pending = self.threadpool.spawn(
+                    pread, fd, min(block_size, length), offset, lock)
+
+                while pending is not None:
+                    data = pending.get()
+                    pending = None
+
+                    if not data:
+                        break
+
+                    offset += len(data)
+                    length -= len(data)
+
+                    # Read the next block ahead, while this one is sent.
+                    if length > 0:
+                        pending = self.threadpool.spawn(
+                            pread, fd, min(block_size, length), offset, lock)
+
+                    yield data
+        finally:
+            # The descriptor cannot be closed while it is being read.
+            if pending is not None:
+                try:
+                    pending.get()
+                except Exception:
+                    pass
+
+            self.release(path, fd)
+
+
+class MappedFileCache(object):
+    """
+    Cache of read-only memory mapped files, keyed by path. Reads are slices of
+    the mapping, so no system calls are required for files that are mapped.
+    The least recently used mappings are dropped first, to keep at most
+    `max_size' bytes mapped.
+
+    Dropped mappings are not closed explicitly, since they may be in use by a
+    reader. They are unmapped as soon as they are not referenced anymore.
+
+    Each hit checks the inode, size and modification time of the file, like
+    `file_validators()'. A file that changed on disk is mapped again.
+    """
+
+    def __init__(self, max_size=64 * 1024 * 1024):
+        """
+        Construct a new, empty cache.
+
+        :param int max_size: Maximum number of bytes to keep mapped.
+        """
+
+        self.max_size = max_size
+        self.size = 0
+        self.mappings = collections.OrderedDict()
+
+    def __len__(self):
+        """
+        Return the number of mapped files.
+        """
+
+        return len(self.mappings)
+
+    def get(self, path):
+        """
+        Return the mapping of a file. Maps the file if it is not cached, or if
+        it changed since it was mapped. Mappings of files larger than
+        `max_size' are returned, but not cached.
+
+        :param str path: Path of the file.
+        :return: Read-only mapping of the file.
+        :rtype mmap:
+        """
+
+        stat = os.stat(path)
+        identity = (stat.st_ino, stat.st_size, stat.st_mtime)
+
+        try:
+            mapping, mapped_identity = self.mappings.pop(path)
+        except KeyError:
+            mapping = None
+        else:
+            if mapped_identity != identity:
+                self.size -= len(mapping)
+                mapping = None
+
+        if mapping is None:
+            fd = os.open(path, os.O_RDONLY)
+
+            try:
+                stat = os.fstat(fd)
+                identity = (stat.st_ino, stat.st_size, stat.st_mtime)
+                mapping = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+
+            if len(mapping) > self.max_size:
+                return mapping
+
+            self.size += len(mapping)
+
+        # Re-insert as most recently used.
+        self.mappings[path] = (mapping, identity)
+
+        self.evict()
+
+        return mapping
+
+    def discard(self, path):
+        """
+        Drop the mapping of a file, e.g. because it changed on disk.
+
+        :param str path: Path of the file.
+        """
+
+        mapping, _ = self.mappings.pop(path, (None, None))
+
+        if mapping is not None:
+            self.size -= len(mapping)
+
+    def evict(self):
+        """
+        Drop the least recently used mappings, until at most `max_size' bytes
+        are mapped.
+        """
+
+        while self.size > self.max_size:
+            _, (mapping, _) = self.mappings.popitem(last=False)
+            self.size -= len(mapping)
+
+    def read(self, path, offset, length, block_size=65536):
+        """
+        Yield at most `length' bytes of a file, starting at `offset', in
+        blocks of at most `block_size' bytes.
+
+        :param str path: Path of the file.
+        :param int offset: Position to start reading.
+        :param int length: Number of bytes to read.
+        :param int block_size: Maximum number of bytes per block.
+        """
+
+        mapping = self.get(path)
+        end = min(offset + length, len(mapping))
+
+        while offset < end:
+            yield mapping[offset:min(offset + block_size, end)]
+            offset += block_size
+
+
+class CacheEntry(object):
+    """
+    A remote file in the cache directory. Only a prefix of `length' bytes may
+    be cached. The entry is complete if all `size' bytes are cached.
+    """
+
+    __slots__ = (
+        "key", "file_name", "length", "size", "mimetype", "complete",
+        "writing")
+
+    def __init__(self, key, file_name):
+        """
+        Construct a new, empty cache entry.
+
+        :param str key: Key of the entry.
+        :param str file_name: File to cache the bytes in.
+        """
+
+        self.key = key
+        self.file_name = file_name
+        self.length = 0
+        self.size = None
+        self.mimetype = None
+        self.complete = False
+        self.writing = False
+
+    def __repr__(self):
+        """
+        """
+
+        return "%s(key=%s, length=%d, size=%s, complete=%s)" % (
+            self.__class__.__name__, self.key, self.length, self.size,
+            self.complete)
+
+
+class CacheDirectory(object):
+    """
+    Directory of cached remote files, bounded by the total number of bytes
+    cached. The least recently used files are removed first, except for files
+    that are being written.
+
+    Files that are incomplete have a `.part' suffix. Complete files of a
+    previous run are kept, but incomplete files are removed.
+    """
+
+    def __init__(self, directory, max_size=1024 * 1024 * 1024,
+                 on_remove=None):
+        """
+        Construct a new cache directory, and index the complete files that are
+        in it already.
+
+        :param str directory: Directory to store the files in.
+        :param int max_size: Maximum number of bytes to cache.
+        :param callable on_remove: Invoked with the name of a file that is
+                                   removed or renamed, e.g. to invalidate
+                                   open descriptors of it.
+        """
+
+        self.directory = directory
+        self.max_size = max_size
+        self.on_remove = on_remove
+        self.size = 0
+        self.entries = collections.OrderedDict()
+
+        files = []
+
+        for key in os.listdir(directory):
+            file_name = os.path.join(directory, key)
+
+            if key.endswith(".part"):
+                os.remove(file_name)
+            else:
+                files.append((os.path.getmtime(file_name), key))
+
+        # Least recently modified files are least recently used.
+        for _, key in sorted(files):
+            entry = CacheEntry(key, os.path.join(directory, key))
+            entry.length = entry.size = os.path.getsize(entry.file_name)
+            entry.complete = True
+
+            self.entries[key] = entry
+            self.size += entry.length
+
+        self.evict()
+
+    def __len__(self):
+        """
+        Return the number of entries.
+        """
+
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Return the entry of a key, and mark it as most recently used. A new
+        entry is created if there is none.
+
+        :param str key: Key of the entry. Should be a valid file name.
+        :return: The entry.
+        :rtype CacheEntry:
+        """
+
+        try:
+            entry = self.entries.pop(key)
+        except KeyError:
+            entry = CacheEntry(
+                key, os.path.join(self.directory, key + ".part"))
+
+        self.entries[key] = entry
+
+        return entry
+
+    def grow(self, entry, length):
+        """
+        Record that `length' bytes were appended to the file of an entry.
+
+        :param CacheEntry entry: Entry that was written.
+        :param int length: Number of bytes appended.
+        """
+
+        entry.length += length
+        self.size += length
+
+        self.evict()
+
+    def finish(self, entry):
+        """
+        Mark an entry as complete, by removing the `.part' suffix of its file.
+
+        :param CacheEntry entry: Entry that is complete.
+        """
+
+        file_name = os.path.join(self.directory, entry.key)
+        os.rename(entry.file_name, file_name)
+
+        if self.on_remove is not None:
+            self.on_remove(entry.file_name)
+
+        entry.file_name = file_name
+        entry.size = entry.length
+        entry.complete = True
+
+    def discard(self, key):
+        """
+        Remove an entry and its file. Readers that have the file open can
+        continue reading.
+
+        :param str key: Key of the entry.
+        """
+
+        entry = self.entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        self.size -= entry.length
+
+        try:
+            os.remove(entry.file_name)
+        except OSError:
+            pass
+
+        if self.on_remove is not None:
+            self.on_remove(entry.file_name)
+
+    def evict(self):
+        """
+        Remove the least recently used entries, until at most `max_size' bytes
+        are cached.
+        """
+
+        for key, entry in self.entries.items():
+            if self.size <= self.max_size:
+                break
+
+            if not entry.writing:
+                self.discard(key)
+
+
+def pread(fd, length, offset, lock):
+    """
+    Read at most `length' bytes of a descriptor at `offset', without
+    depending on the position of the descriptor. Uses `os.pread' if available.
+    Otherwise, the position is changed while holding `lock'.
+
+    :param int fd: Descriptor to read from.
+    :param int length: Number of bytes to read.
+    :param int offset: Position to read from.
+    :param Lock lock: Lock that guards the position of the descriptor.
+    :return: The bytes read.
+    :rtype str:
+    """
+
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+
+    with lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, length)
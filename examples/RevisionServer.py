@@ -68,18 +68,18 @@ class RevisionProvider(provider.Provider):
                 container_item = database.containers[1] \
                                          .container_items[item.id]
 
-                # Copy the items. This step is optional if you don't care
-                # if older revision will all have the same data.
-                item = copy.copy(item)
-                container_item = copy.copy(container_item)
+                # Update some properties. Older revisions keep the previous
+                # values, without copying the item.
+                item = database.items.update(
+                    item.id, duration=item.duration + 1000 * 60)  # One minute
 
-                # Update some properties.
-                item.duration += 1000 * 60  # One minute
+                # Copy the container item. This step is optional if you don't
+                # care if older revision will all have the same data.
+                container_item = copy.copy(container_item)
 
                 database.containers[1] \
                         .container_items \
                         .add(container_item)
-                database.items.add(item)
                 logger.info(
                     "Item %d updated, %d items in container. Revision is "
                     "%d.", item.id, len(database.items), self.revision)
@@ -1,12 +1,10 @@
 from daapserver.models import Server, Database, Item, Container, ContainerItem
-from daapserver import DaapServer, provider
+from daapserver.remote import RemoteProvider
+from daapserver import DaapServer
 
-import os
 import sys
 import gevent
 import logging
-import tempfile
-import requests
 import soundcloud
 
 # Logger instance
@@ -23,16 +21,19 @@ class RemoteItem(Item):
     __slots__ = Item.__slots__ + ("file_url", "album_art_url")
 
 
-class SoundcloudProvider(provider.LocalFileProvider):
+class SoundcloudProvider(RemoteProvider):
     """
     Provide a quick-and-dirty in-memory content provider that uses Soundcloud
     as backend for providing data.
 
-    This provider is not efficient, as it will download the file before use.
-    Long tracks take some time before they actually start playing. Furthermore,
-    this provider does not cleanup files after server exits.
+    Tracks are streamed while they are downloaded, and the downloaded parts
+    are cached on disk (up to `RemoteProvider.max_cache_size' bytes).
     """
 
+    # Tracks are fetched per user. Publish them in one revision per second,
+    # instead of one revision per user.
+    update_delay = 1
+
     def __init__(self, client_id, usernames):
         super(SoundcloudProvider, self,).__init__()
 
@@ -51,7 +52,6 @@ class SoundcloudProvider(provider.LocalFileProvider):
         database.containers.add(container)
 
         # Prepare Soundcloud connection.
-        self.temp_directory = tempfile.mkdtemp()
         self.client = soundcloud.Client(client_id=client_id)
 
         # Fetch tracks, asynchronous.
@@ -101,56 +101,13 @@ class SoundcloudProvider(provider.LocalFileProvider):
             # Inform provider of new tracks.
             self.update()
 
-    def get_item_data(self, session, item, byte_range=None):
-        item.file_name = os.path.join(self.temp_directory, "%s.mp3" % item.id)
-        file_size = download_file(
-            self.client.get(item.file_url, allow_redirects=False).location,
-            item.file_name)
-
-        if file_size is not None:
-            item.file_size = file_size
-
-        # Stream actual item file from disk.
-        return super(SoundcloudProvider, self).get_item_data(
-            session, item, byte_range)
-
-    def get_artwork_data(self, session, item):
-        item.album_art = os.path.join(self.temp_directory, "%s.jpg" % item.id)
+    def get_item_url(self, session, item):
+        return self.client.get(item.file_url, allow_redirects=False).location
 
+    def get_artwork_url(self, session, item):
         # Replacing https:// is just a workaround SSL issues with OpenSSL and
         # requests problems.
-        download_file(
-            item.album_art_url.replace("https://", "http://"), item.album_art)
-
-        # Stream actual artwork file from disk.
-        return super(SoundcloudProvider, self).get_artwork_data(session, item)
-
-
-def download_file(url, file_name):
-    """
-    Helper for downloading a remote file to disk.
-    """
-
-    logger.info("Downloading URL: %s", url)
-    file_size = 0
-
-    if not os.path.isfile(file_name):
-        response = requests.get(url, stream=True)
-
-        with open(file_name, "wb") as fp:
-            if not response.ok:
-                raise Exception("Download exception. Will fail.")
-
-            for block in response.iter_content(1024):
-                if not block:
-                    break
-
-                fp.write(block)
-                file_size += len(block)
-
-        logger.info("Download finished, size is %d bytes.", file_size)
-
-    return file_size
+        return item.album_art_url.replace("https://", "http://")
 
 
 def main():
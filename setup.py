@@ -48,6 +48,7 @@ setup(
         "daapserver/daap.pyx",
         "daapserver/revision.pyx",
         "daapserver/collection.pyx",
+        "daapserver/columnar.pyx",
         "daapserver/models.pyx",
         "daapserver/responses.pyx",
     ]),
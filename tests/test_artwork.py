@@ -0,0 +1,165 @@
+from daapserver.artwork import ArtworkCache, Image, guess_mimetype, \
+    read_data, resize
+
+import shutil
+import tempfile
+import unittest
+import cStringIO
+
+# Artwork of two albums. Only the signature has to be valid.
+COVER_A = "\x89PNG\r\n\x1a\n" + "a" * 100
+COVER_B = "\xff\xd8\xff" + "b" * 100
+
+
+class TestArtworkCache(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Create an empty cache directory.
+        """
+
+        self.directory = tempfile.mkdtemp()
+        self.loads = []
+
+    def tearDown(self):
+        """
+        Remove the cache directory.
+        """
+
+        shutil.rmtree(self.directory)
+
+    def loader(self, data):
+        """
+        Return a loader that records when it is invoked.
+        """
+
+        def _load():
+            self.loads.append(data)
+            return iter([data[:10], data[10:]]), None, None
+
+        return _load
+
+    def test_deduplicate(self):
+        """
+        Test artwork with the same content is stored once, and the source is
+        only loaded once.
+        """
+
+        cache = ArtworkCache()
+
+        for source_key in ("track-1", "track-2", "track-1", "track-2"):
+            data, mimetype, size = cache.get(
+                source_key, self.loader(COVER_A))
+
+            self.assertEqual(data, COVER_A)
+            self.assertEqual(mimetype, "image/png")
+            self.assertEqual(size, len(COVER_A))
+
+        self.assertEqual(len(self.loads), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, len(COVER_A))
+
+    def test_evict(self):
+        """
+        Test the least recently used artwork is dropped from memory first,
+        but is still stored on disk.
+        """
+
+        cache = ArtworkCache(max_size=150, directory=self.directory)
+
+        cache.get("track-1", self.loader(COVER_A))
+        cache.get("track-2", self.loader(COVER_B))
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, len(COVER_B))
+        self.assertEqual(len(cache.disk), 2)
+
+        # Loaded from disk, without loading the source.
+        data, mimetype, size = cache.get("track-1", self.loader(COVER_A))
+
+        self.assertEqual(data, COVER_A)
+        self.assertEqual(mimetype, "image/png")
+        self.assertEqual(len(self.loads), 2)
+
+        # Stored variants are found by a new cache.
+        cache = ArtworkCache(max_size=150, directory=self.directory)
+
+        self.assertEqual(len(cache.disk), 2)
+
+    def test_threadpool(self):
+        """
+        Test artwork is hashed, read and written by the thread pool.
+        """
+
+        class RecordingPool(object):
+            def __init__(self):
+                self.calls = []
+
+            def apply(self, function, args):
+                self.calls.append(function.__name__)
+                return function(*args)
+
+        threadpool = RecordingPool()
+        cache = ArtworkCache(
+            max_size=150, directory=self.directory, threadpool=threadpool)
+
+        cache.get("track-1", self.loader(COVER_A), 10, 10)
+        cache.get("track-2", self.loader(COVER_B), 10, 10)
+        cache.get("track-1", self.loader(COVER_A), 10, 10)
+
+        self.assertEqual(threadpool.calls, [
+            "content_hash", "resize", "write_file",
+            "content_hash", "resize", "write_file",
+            "read_file"])
+
+    @unittest.skipIf(Image is None, "Pillow is not installed.")
+    def test_resize(self):
+        """
+        Test artwork is resized to fit, and variants are cached per size.
+        """
+
+        output = cStringIO.StringIO()
+        Image.new("RGB", (400, 200)).save(output, "JPEG")
+
+        cache = ArtworkCache()
+        load = lambda: (output.getvalue(), "image/jpeg", None)
+
+        data, mimetype, size = cache.get("track-1", load, 100, 100)
+        image = Image.open(cStringIO.StringIO(data))
+
+        self.assertEqual(image.size, (100, 50))
+        self.assertEqual(mimetype, "image/jpeg")
+
+        data, mimetype, size = cache.get("track-1", load)
+
+        self.assertEqual(data, output.getvalue())
+        self.assertEqual(len(cache), 2)
+
+
+class TestArtworkUtils(unittest.TestCase):
+
+    def test_read_data(self):
+        """
+        Test reading raw bytes, files and iterators.
+        """
+
+        self.assertEqual(read_data("abc"), "abc")
+        self.assertEqual(read_data(cStringIO.StringIO("abc")), "abc")
+        self.assertEqual(read_data(iter(["a", "bc"])), "abc")
+
+    def test_guess_mimetype(self):
+        """
+        Test the mimetype is guessed from the signature.
+        """
+
+        self.assertEqual(guess_mimetype(COVER_A), "image/png")
+        self.assertEqual(guess_mimetype(COVER_B), "image/jpeg")
+        self.assertEqual(guess_mimetype("abc"), None)
+
+    def test_resize_invalid(self):
+        """
+        Test invalid images are returned as is.
+        """
+
+        self.assertEqual(
+            resize(COVER_A, "image/png", 10, 10), (COVER_A, "image/png"))
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 
-from daapserver.collection import ImmutableCollection, LazyMutableCollection
+from daapserver.collection import ImmutableCollection, MutableCollection, \
+    LazyMutableCollection, Patch
 
+import gevent
 import unittest
 import collections
 
@@ -26,6 +28,17 @@ class MyItem(object):
         return "MyItem(id=%d, python_id=%d)" % (self.id, id(self))
 
 
+class MyTrack(object):
+    def __init__(self, id, name, duration):
+        """
+        Construct a new track.
+        """
+
+        self.id = id
+        self.name = name
+        self.duration = duration
+
+
 class MyLazyMutableCollection(LazyMutableCollection):
 
     def __init__(self):
@@ -79,6 +92,35 @@ class MyLazyMutableCollection(LazyMutableCollection):
             self.busy = False
 
 
+class MyPointLoadingCollection(MyLazyMutableCollection):
+
+    point_loading = True
+    max_resident_items = 2
+
+    def load(self, item_ids=None):
+        """
+        Load items, without re-adding items that are still resident.
+        """
+
+        for item_id in (item_ids if item_ids is not None else range(5)):
+            if item_id >= 5:
+                continue
+
+            if item_id in self.store and item_ids is None:
+                item = self.store.get(item_id)
+            else:
+                item = MyItem(item_id, self.registry)
+                self.store.add(item.id, item)
+
+            yield item
+
+
+class MyBackgroundCollection(MyLazyMutableCollection):
+
+    preload = True
+    idle_timeout = 0.01
+
+
 class TestImmutableCollection(unittest.TestCase):
     """
     Test cases for `daapserver.collection.ImmutableCollection'.
@@ -103,6 +145,99 @@ class TestImmutableCollection(unittest.TestCase):
                 unicode(instance).encode("ascii", "replace") == str(instance))
 
 
+class TestMutableCollection(unittest.TestCase):
+    """
+    Test cases for `daapserver.collection.MutableCollection'.
+    """
+
+    def test_update(self):
+        """
+        Test fields are patched, and older revisions keep their values.
+        """
+
+        collection = MutableCollection(parent=None)
+        track = MyTrack(1, "A", 100)
+
+        collection.add(track)
+        collection.commit(2)
+
+        self.assertIs(collection.update(1, duration=200), track)
+        self.assertEqual(track.duration, 200)
+        self.assertEqual(list(collection(2).updated(collection(1))), [1])
+
+        # Same revision does not record another change.
+        collection.update(1, name="B")
+        collection.commit(3)
+        collection.update(1, duration=300)
+
+        self.assertIs(collection[1], track)
+        self.assertEqual(collection(3)[1].duration, 300)
+        self.assertEqual(collection(2)[1].duration, 200)
+        self.assertEqual(collection(2)[1].name, "B")
+        self.assertEqual(collection(1)[1].duration, 100)
+        self.assertEqual(collection(1)[1].name, "A")
+        self.assertEqual(
+            [item.name for item in collection(1).itervalues()], ["A"])
+        self.assertEqual(collection(1).keys(), [1])
+
+        # Only the changed fields are stored.
+        entry = collection.store.get(1, revision=1)
+
+        self.assertEqual(type(entry), Patch)
+        self.assertEqual(entry.fields, {"name": "A", "duration": 100})
+
+        with self.assertRaises(ValueError):
+            collection.update(1, id=2)
+
+        with self.assertRaises(KeyError):
+            collection.update(2, name="C")
+
+    def test_index(self):
+        """
+        Test finding items by an indexed field.
+        """
+
+        collection = MutableCollection(parent=None)
+        collection.add(MyTrack(1, "A", 100))
+        collection.add(MyTrack(2, "B", 100))
+        collection.create_index("duration")
+
+        self.assertEqual(
+            sorted(track.id for track in collection.find("duration", 100)),
+            [1, 2])
+
+        collection.commit(2)
+        collection.update(1, duration=200)
+
+        self.assertEqual(collection.find_one("duration", 200).id, 1)
+        self.assertEqual(collection(1).find_one("duration", 100).id, 1)
+        self.assertEqual(collection(1).find_one("duration", 100).duration, 100)
+        self.assertEqual(
+            [track.id for track in collection.find("duration", 100)], [2])
+
+        with self.assertRaises(KeyError):
+            collection(1).find_one("duration", 200)
+
+    def test_unique_index(self):
+        """
+        Test an update that violates a unique index is not applied.
+        """
+
+        collection = MutableCollection(parent=None)
+        collection.add(MyTrack(1, "A", 100))
+        collection.add(MyTrack(2, "B", 100))
+        collection.create_index("name", unique=True)
+        collection.commit(2)
+
+        with self.assertRaises(ValueError):
+            collection.update(2, name="A", duration=200)
+
+        self.assertEqual(collection[2].name, "B")
+        self.assertEqual(collection[2].duration, 100)
+        self.assertEqual(list(collection.store.diff(2, 1)), [])
+        self.assertEqual(collection.find_one("name", "B").id, 2)
+
+
 class TestLazyMutableCollection(unittest.TestCase):
     """
     Test cases for `daapserver.collection.LazyMutableCollection'. It is
@@ -222,6 +357,23 @@ class TestLazyMutableCollection(unittest.TestCase):
         self.assertEqual(id(item_a), id(item_c))
         self.assertEqual(self.collection.registry[2], 1)
 
+    def test_index(self):
+        """
+        Check if finding items loads all items, before and after unloading.
+        """
+
+        self.collection.create_index("id")
+
+        self.assertEqual(self.collection.find_one("id", 3).id, 3)
+        self.assertTrue(self.collection.ready)
+
+        self.collection.commit(2)
+        self.collection.clean(2)
+        self.collection.unload()
+
+        self.assertTrue(self.collection.evicted)
+        self.assertEqual(self.collection.find_one("id", 4).id, 4)
+
     def test_update_remove_items(self):
         """
         Test if item is not re-created when updated (the old revision is
@@ -254,3 +406,180 @@ class TestLazyMutableCollection(unittest.TestCase):
         self.assertListEqual(self.collection.keys(), [2, 1, 0])
         item_ids = list(self.collection(4).removed(self.collection(3)))
         self.assertListEqual(item_ids, [3, 4])
+
+
+class TestPointLoadingCollection(unittest.TestCase):
+    """
+    Test cases for point loading and bounded residency of
+    `daapserver.collection.LazyMutableCollection'.
+    """
+
+    def setUp(self):
+        """
+        Setup a new collection.
+        """
+        self.collection = MyPointLoadingCollection()
+
+    def test_requires_point_loading(self):
+        """
+        Check that bounded residency requires point loading.
+        """
+
+        class MyBoundedCollection(MyLazyMutableCollection):
+            max_resident_items = 2
+
+        with self.assertRaises(ValueError):
+            MyBoundedCollection()
+
+    def test_point_load(self):
+        """
+        Check if a miss only loads the requested item.
+        """
+
+        item = self.collection[3]
+
+        self.assertEqual(item.id, 3)
+        self.assertFalse(self.collection.ready)
+        self.assertDictEqual(dict(self.collection.registry), {3: 1})
+
+        self.assertTrue(1 in self.collection)
+        self.assertFalse(7 in self.collection)
+        self.assertDictEqual(dict(self.collection.registry), {1: 1, 3: 1})
+
+        with self.assertRaises(KeyError):
+            self.collection[7]
+
+    def test_eviction(self):
+        """
+        Check if least recently used items are evicted and reloaded.
+        """
+
+        self.collection.commit(2)
+        self.collection.clean(2)
+
+        self.collection[0]
+        self.collection[1]
+        self.collection[0]
+        self.collection[2]
+
+        self.assertListEqual(list(self.collection.resident), [0, 2])
+        self.assertTrue(self.collection.evicted)
+        self.assertFalse(1 in self.collection.store)
+
+        # Reload an evicted item. It is not considered changed.
+        self.collection.commit(3)
+
+        self.assertEqual(self.collection[1].id, 1)
+        self.assertEqual(self.collection.registry[1], 2)
+        self.assertListEqual(
+            list(self.collection(3).updated(self.collection(2))), [])
+
+        # Iteration does not keep all items resident.
+        self.assertListEqual(sorted(self.collection.keys()), [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.collection.resident), 2)
+
+    def test_count(self):
+        """
+        Check if revisions count the items that are not resident.
+        """
+
+        self.collection.commit(2)
+        self.collection.clean(2)
+
+        self.collection[0]
+        self.collection[1]
+        self.collection[2]
+
+        self.assertTrue(self.collection.evicted)
+        self.assertEqual(len(self.collection.store.lookup), 2)
+        self.assertEqual(len(self.collection(2)), 5)
+
+        # Removals are accounted for, in both revisions.
+        self.collection.commit(3)
+        self.collection.remove_ids([4])
+        self.collection.count = lambda: 4
+
+        self.assertEqual(len(self.collection(3)), 4)
+        self.assertEqual(len(self.collection(2)), 5)
+
+    def test_update_remove_items(self):
+        """
+        Check if changes to non-resident items are recorded.
+        """
+
+        self.collection.commit(2)
+        self.collection.clean(2)
+        self.collection.commit(3)
+
+        self.collection.update_ids([3])
+        self.collection.remove_ids([4])
+
+        self.assertListEqual(
+            list(self.collection(3).updated(self.collection(2))), [3])
+        self.assertListEqual(
+            list(self.collection(3).removed(self.collection(2))), [4])
+
+    def test_index(self):
+        """
+        Check if indexes are refused, since items are evicted.
+        """
+
+        with self.assertRaises(ValueError):
+            self.collection.create_index("id")
+
+
+class TestBackgroundCollection(unittest.TestCase):
+    """
+    Test cases for prefetching and idle unloading of
+    `daapserver.collection.LazyMutableCollection'.
+    """
+
+    def setUp(self):
+        """
+        Setup a new collection.
+        """
+        self.collection = MyBackgroundCollection()
+
+    def test_prefetch(self):
+        """
+        Check if items are loaded in the background, and that requests wait
+        for the prefetch to finish.
+        """
+
+        greenlet = self.collection.prefetch()
+
+        self.assertIsNotNone(greenlet)
+        self.assertFalse(self.collection.ready)
+
+        # Waits for the prefetch, instead of loading again.
+        self.assertEqual(self.collection[2].id, 2)
+        self.assertTrue(self.collection.ready)
+        self.assertIsNone(self.collection.prefetcher)
+        self.assertEqual(self.collection.registry[2], 1)
+
+        # Nothing left to prefetch.
+        self.assertIsNone(self.collection.prefetch())
+
+    def test_idle_unload(self):
+        """
+        Check if an idle collection is unloaded and reloaded without changes.
+        """
+
+        list(self.collection)
+
+        self.collection.commit(2)
+        self.collection.clean(2)
+        self.collection.commit(3)
+
+        self.collection[2]
+        gevent.sleep(0.05)
+
+        self.assertTrue(self.collection.evicted)
+        self.assertFalse(self.collection.store)
+
+        # Reload, which makes it complete again.
+        self.assertListEqual(self.collection.keys(), [0, 1, 2, 3, 4])
+        self.assertFalse(self.collection.evicted)
+        self.assertEqual(self.collection.registry[2], 2)
+        self.assertListEqual(
+            list(self.collection(3).updated(self.collection(2))), [])
@@ -0,0 +1,194 @@
+from daapserver.columnar import ColumnStore, ColumnarDatabase
+from daapserver.models import Server, Item
+
+import unittest
+
+
+class ColumnStoreTest(unittest.TestCase):
+    """
+    Test the column store.
+    """
+
+    def test_append(self):
+        """
+        Test items are stored and instantiated with the same fields.
+        """
+
+        columns = ColumnStore()
+
+        first = columns.append(Item(
+            id=1, persistent_id=2 ** 40, artist="A", album="B", name="C",
+            year=2014, file_size=2 ** 33))
+        second = columns.append(Item(id=2, artist="A", track=0))
+
+        self.assertEqual(len(columns), 2)
+        self.assertEqual(columns.strings, ["C", "A", "B"])
+
+        item = columns.get(first)
+
+        self.assertEqual(item.id, 1)
+        self.assertEqual(item.persistent_id, 2 ** 40)
+        self.assertEqual(item.artist, "A")
+        self.assertEqual(item.year, 2014)
+        self.assertEqual(item.file_size, 2 ** 33)
+        self.assertIsNone(item.track)
+
+        item = columns.get(second)
+
+        self.assertEqual(item.track, 0)
+        self.assertIsNone(item.album)
+
+        self.assertEqual(columns.value(first, "album"), "B")
+        self.assertEqual(columns.value(second, "track"), 0)
+        self.assertIsNone(columns.value(second, "year"))
+
+        with self.assertRaises(KeyError):
+            columns.value(first, "unknown")
+
+    def test_release(self):
+        """
+        Test released rows are reused.
+        """
+
+        columns = ColumnStore()
+
+        row = columns.append(Item(id=1, name="A"))
+        columns.release(row)
+
+        self.assertEqual(len(columns), 0)
+        self.assertEqual(columns.append(Item(id=2, name="B")), row)
+        self.assertEqual(columns.get(row).name, "B")
+        self.assertEqual(columns.size, 1)
+
+
+class ColumnarItemCollectionTest(unittest.TestCase):
+    """
+    Test the columnar item collection.
+    """
+
+    def setUp(self):
+        """
+        Create a server with one columnar database.
+        """
+
+        self.server = Server()
+        self.database = ColumnarDatabase(id=1, name="Database A")
+        self.server.databases.add(self.database)
+
+        for i in range(1, 5):
+            self.database.items.add(Item(
+                id=i, artist="Artist", name="Item %d" % i, year=2010 + i))
+
+    def test_items(self):
+        """
+        Test basic collection functionality.
+        """
+
+        items = self.database.items
+
+        self.assertEqual(len(items), 4)
+        self.assertEqual(sorted(items.keys()), [1, 2, 3, 4])
+        self.assertEqual(items[2].name, "Item 2")
+        self.assertTrue(2 in items)
+        self.assertFalse(5 in items)
+
+        self.assertEqual(
+            sorted(item.id for item in items.itervalues()), [1, 2, 3, 4])
+
+        # Strings are interned in the database string table.
+        self.assertTrue("Artist" in self.database.strings)
+
+    def test_revisions(self):
+        """
+        Test changes are recorded per revision.
+        """
+
+        items = self.database.items
+
+        self.server.commit(2)
+        items.add(Item(id=2, name="Item 2b"))
+        items.remove(items[3])
+
+        self.assertEqual(items[2].name, "Item 2b")
+        self.assertEqual(items(1)[2].name, "Item 2")
+        self.assertEqual(items(1)[3].name, "Item 3")
+        self.assertFalse(3 in items)
+
+        self.assertEqual(sorted(items(2).updated(items(1))), [2])
+        self.assertEqual(list(items(2).removed(items(1))), [3])
+
+    def test_update(self):
+        """
+        Test updating fields stores the item in a new row.
+        """
+
+        items = self.database.items
+
+        self.server.commit(2)
+        items.update(2, year=2020)
+
+        self.assertEqual(items[2].year, 2020)
+        self.assertEqual(items(1)[2].year, 2012)
+        self.assertEqual(len(items.columns), 5)
+
+    def test_columns(self):
+        """
+        Test column operations.
+        """
+
+        items = self.database.items
+
+        self.assertEqual(
+            sorted(items.column("year")), [2011, 2012, 2013, 2014])
+        self.assertEqual(
+            sorted(items.select("year", lambda year: year > 2012)), [3, 4])
+        self.assertEqual(items(1).column("track"), [None] * 4)
+
+        # The predicate is evaluated once per distinct string.
+        calls = []
+
+        def predicate(artist):
+            calls.append(artist)
+            return artist == "Artist"
+
+        self.assertEqual(
+            sorted(items.select("artist", predicate)), [1, 2, 3, 4])
+        self.assertEqual(calls, ["Artist"])
+        self.assertEqual(items.select("album", lambda album: album), [])
+
+    def test_index(self):
+        """
+        Test indexes on columns.
+        """
+
+        items = self.database.items
+        items.create_index("year", unique=True)
+
+        self.assertEqual(items.find_one("year", 2012).id, 2)
+
+        with self.assertRaises(KeyError):
+            items.create_index("unknown")
+
+    def test_compact(self):
+        """
+        Test rows are released after cleaning.
+        """
+
+        items = self.database.items
+
+        self.server.commit(2)
+        items.add(Item(id=1, name="Item 1b"))
+        items.remove(items[2])
+
+        self.assertEqual(len(items.columns), 5)
+
+        self.server.clean(2)
+
+        self.assertEqual(len(items.columns), 3)
+        self.assertEqual(items[1].name, "Item 1b")
+
+        # Released rows are reused.
+        items.add(Item(id=5, name="Item 5"))
+
+        self.assertEqual(items.columns.size, 5)
+        self.assertEqual(items[5].name, "Item 5")
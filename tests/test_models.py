@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
-from daapserver.models import Server, Database, Item, Container, ContainerItem
+from daapserver.models import Server, Database, Item, Container, \
+    ContainerItem, StringTable, SmartContainer
+from daapserver import utils
+
+import copy
 
 import unittest
 
@@ -221,9 +225,302 @@ class ModelsTest(unittest.TestCase):
         self.assertEqual(database.items.store.revision, 1)
         self.assertEqual(database.containers.store.revision, 1)
 
-        # Commit will synchronize revision with children.
+        # Collections that did not change are not committed, but they can be
+        # read at later revisions.
         server.commit(12)
 
         self.assertEqual(server.databases.store.revision, 12)
+        self.assertEqual(database.items.store.revision, 1)
+        self.assertEqual(database.items(11).keys(), [])
+
+        # A collection is committed to the current revision when it changes.
+        database.items.add(Item(id=1))
+
         self.assertEqual(database.items.store.revision, 12)
-        self.assertEqual(database.containers.store.revision, 12)
+        self.assertEqual(database.items(11).keys(), [])
+        self.assertEqual(database.items.keys(), [1])
+
+        server.commit(13)
+
+        self.assertEqual(database.items.store.revision, 13)
+        self.assertEqual(database.containers.store.revision, 1)
+
+    def test_dirty(self):
+        """
+        Test only the collections that changed are committed and cleaned.
+        """
+
+        server = Server()
+        database = Database(id=1)
+        server.databases.add(database)
+
+        for i in range(1, 4):
+            database.containers.add(Container(id=i))
+
+        server.commit(2)
+        server.clean(2)
+
+        self.assertEqual(server.dirty, set())
+        self.assertEqual(database.dirty, set())
+
+        container = database.containers[2]
+        container.container_items.add(ContainerItem(id=1, item_id=1))
+
+        self.assertEqual(server.dirty, {database})
+        self.assertEqual(database.dirty, {container.container_items})
+        self.assertEqual(container.container_items.store.revision, 2)
+
+        server.commit(3)
+
+        self.assertEqual(container.container_items.store.revision, 3)
+        self.assertEqual(
+            database.containers[1].container_items.store.revision, 1)
+
+        # Collections are forgotten when their history has been cleaned.
+        container.container_items.remove(container.container_items[1])
+        server.commit(4)
+        server.clean(2)
+
+        self.assertEqual(database.dirty, {container.container_items})
+        self.assertEqual(
+            list(container.container_items(3).removed(
+                container.container_items(2))), [1])
+
+        server.clean(3)
+
+        self.assertEqual(server.dirty, set())
+        self.assertEqual(database.dirty, set())
+
+    def test_item_fields(self):
+        """
+        Test typed item fields and None-tracking.
+        """
+
+        item = Item(id=1, track=3, duration=180000, file_size=2 ** 40)
+
+        self.assertEqual(item.track, 3)
+        self.assertEqual(item.duration, 180000)
+        self.assertEqual(item.file_size, 2 ** 40)
+        self.assertIsNone(item.year)
+        self.assertIsNone(item.bitrate)
+
+        item.year = 0
+        item.track = None
+
+        self.assertEqual(item.year, 0)
+        self.assertIsNone(item.track)
+
+        item_copy = copy.copy(item)
+
+        self.assertEqual(item_copy.year, 0)
+        self.assertEqual(item_copy.file_size, 2 ** 40)
+        self.assertIsNone(item_copy.track)
+
+    def test_interning(self):
+        """
+        Test interning of repeated strings per database.
+        """
+
+        database = Database(id=1, name="Database A")
+
+        item_a = Item(id=1, artist=u"Bj\xf6rk", album="".join("Post"))
+        item_b = Item(id=2, artist=u"".join([u"Bj", u"\xf6rk"]), album="Post")
+
+        self.assertIsNot(item_a.artist, item_b.artist)
+
+        database.items.add(item_a)
+        database.items.add(item_b)
+
+        self.assertIs(item_a.artist, item_b.artist)
+        self.assertIs(item_a.album, item_b.album)
+        self.assertEqual(len(database.strings), 2)
+        self.assertIs(copy.copy(database).strings, database.strings)
+
+    def test_sweep_strings(self):
+        """
+        Test strings of removed items are swept when the database is cleaned.
+        """
+
+        server = Server()
+        database = Database(id=1, name="Database A")
+        server.databases.add(database)
+
+        database.items.add(Item(id=1, artist=u"Bj\xf6rk", album="Post"))
+        database.items.add(Item(id=2, artist=u"Muse", album="Absolution"))
+        server.commit(2)
+        server.clean(2)
+
+        database.strings.encode(u"Muse")
+
+        self.assertEqual(len(database.strings), 4)
+
+        database.items.remove(database.items[2])
+        server.commit(3)
+
+        self.assertEqual(database.items.discarded, 1)
+
+        server.clean(3)
+
+        self.assertEqual(len(database.strings), 2)
+        self.assertFalse(u"Muse" in database.strings)
+        self.assertEqual(database.items.discarded, 0)
+        self.assertEqual(database.sweep_strings(), 0)
+
+    def test_string_table(self):
+        """
+        Test encoding of strings.
+        """
+
+        strings = StringTable()
+        value = strings.intern(u"Bj\xf6rk")
+
+        self.assertIsNone(strings.intern(None))
+        self.assertEqual(strings.encode(value), "Bj\xc3\xb6rk")
+        self.assertIs(strings.encode(value), strings.encode(value))
+        self.assertEqual(strings.encode("Post"), "Post")
+        self.assertEqual(strings.encode(u"Other"), "Other")
+        self.assertFalse(u"Other" in strings)
+
+    def test_smart_container(self):
+        """
+        Test membership of smart containers is maintained.
+        """
+
+        server = Server()
+        database = Database(id=1, name="Database A")
+        server.databases.add(database)
+
+        database.items.add(Item(id=1, name="Item A", year=1999))
+        database.items.add(Item(id=2, name="Item B", year=2015))
+
+        container = SmartContainer(
+            id=2, name="Recent", predicate=lambda item: item.year > 2000)
+        database.containers.add(container)
+
+        self.assertTrue(container.is_smart)
+        self.assertEqual(container.container_items.keys(), [2])
+
+        server.commit(2)
+        database.items.add(Item(id=3, name="Item C", year=2016))
+        database.items.update(1, year=2001)
+        database.items.update(2, year=1990)
+
+        self.assertEqual(sorted(container.container_items.keys()), [1, 3])
+        self.assertEqual(container.container_items[3].item_id, 3)
+        self.assertEqual(
+            sorted(container.container_items(2).updated(
+                container.container_items(1))), [1, 3])
+        self.assertEqual(
+            list(container.container_items(2).removed(
+                container.container_items(1))), [2])
+
+        database.items.remove(database.items[3])
+
+        self.assertEqual(container.container_items.keys(), [1])
+
+        # Copies with the same predicate are not re-evaluated.
+        database.containers.add(copy.copy(container))
+        database.containers.remove(container)
+        database.items.add(Item(id=4, name="Item D", year=2017))
+
+        self.assertEqual(container.container_items.keys(), [1])
+        self.assertEqual(database.smart_containers, {})
+
+    def test_smart_container_update(self):
+        """
+        Test smart containers evaluate an updated item once, with the new
+        values, and are unregistered when replaced by a plain container.
+        """
+
+        server = Server()
+        database = Database(id=1, name="Database A")
+        server.databases.add(database)
+
+        database.items.add(Item(id=1, name="Item A", year=1999))
+
+        years = []
+
+        def predicate(item):
+            years.append(item.year)
+            return item.year > 2000
+
+        container = SmartContainer(id=2, name="Recent", predicate=predicate)
+        database.containers.add(container)
+
+        del years[:]
+        server.commit(2)
+        database.items.update(1, year=2001, genre="Rock")
+
+        self.assertEqual(years, [2001])
+        self.assertEqual(container.container_items.keys(), [1])
+        self.assertTrue("Rock" in database.strings)
+
+        database.containers.add(Container(id=2, name="Recent"))
+        database.items.add(Item(id=3, name="Item C", year=2016))
+
+        self.assertEqual(database.smart_containers, {})
+        self.assertEqual(years, [2001])
+
+    def test_timeline(self):
+        """
+        Test databases with their own revision timeline.
+        """
+
+        class MyDatabase(Database):
+            __slots__ = Database.__slots__
+
+            independent_revisions = True
+
+        server = Server()
+        database_a = MyDatabase(id=1, name="Database A")
+        database_b = Database(id=2, name="Database B")
+        server.databases.add(database_a)
+        server.databases.add(database_b)
+
+        database_a.items.add(Item(id=1, name="Item A"))
+        database_b.items.add(Item(id=2, name="Item B"))
+
+        server.commit(3)
+
+        self.assertEqual(database_a.timeline.revision, 2)
+        self.assertEqual(database_a.items.store.revision, 3)
+
+        # Database B changes, database A does not.
+        database_b.items.add(Item(id=3, name="Item C"))
+        server.commit(4)
+        server.commit(5)
+
+        self.assertEqual(database_a.timeline.revision, 2)
+        self.assertEqual(database_a.items.store.revision, 3)
+        self.assertEqual(database_b.items.store.revision, 5)
+
+        database_a.items.add(Item(id=4, name="Item D"))
+        server.commit(6)
+
+        self.assertEqual(database_a.timeline.revision, 3)
+        self.assertEqual(database_a.to_local_revision(1), 1)
+        self.assertEqual(database_a.to_local_revision(4), 2)
+        self.assertEqual(database_a.to_local_revision(5), 3)
+        self.assertEqual(database_a.to_local_revision(0), 0)
+        self.assertEqual(database_b.to_local_revision(4), 4)
+
+        items = database_a.items
+
+        self.assertEqual(
+            list(items(database_a.to_local_revision(5)).updated(
+                items(database_a.to_local_revision(4)))), [4])
+
+        # Both server revisions map to the revision of the last change, so
+        # the delta is empty, instead of the changes of that revision.
+        self.assertEqual(database_a.to_local_revision(3), 2)
+        self.assertEqual(
+            utils.diff(
+                items(database_a.to_local_revision(4)),
+                items(database_a.to_local_revision(3))),
+            (set(), set(), True))
+
+        server.clean(5)
+
+        self.assertEqual(database_a.items.store.min_revision, 3)
+        self.assertEqual(database_a.timeline.entries, [(5, 3)])
+        self.assertIs(copy.copy(database_a).timeline, database_a.timeline)
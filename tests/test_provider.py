@@ -1,7 +1,18 @@
-from daapserver.provider import Provider
-from daapserver.models import Server
+from daapserver.provider import Provider, LocalFileProvider, \
+    RevisionTracker, State
+from daapserver.models import Server, Database, Item, Container, \
+    ContainerItem
+from daapserver.collection import LazyMutableCollection
+from daapserver import utils
+from daapserver.utils import StreamingFile, FilePool, MappedFileCache
 
+import os
+import time
+import hashlib
+import gevent
 import unittest
+import tempfile
+import collections
 
 
 class Latch(object):
@@ -28,6 +39,39 @@ class Latch(object):
         self.kwargs = kwargs
 
 
+class LazyContainerCollection(LazyMutableCollection):
+    """
+    Containers that are loaded on first access, with their container items.
+    """
+
+    def count(self):
+        """
+        Return the number of containers.
+        """
+
+        return 1
+
+    def load(self, item_ids=None):
+        """
+        Load the container, unless it is resident already.
+        """
+
+        if 1 in self.store:
+            container = self.store.get(1)
+        else:
+            container = Container(id=1, name="Library", is_base=True)
+            container.container_items.add(ContainerItem(id=1, item_id=1))
+
+            self.store.add(container.id, container)
+
+        yield container
+
+
+class LazyDatabase(Database):
+
+    containers_collection_class = LazyContainerCollection
+
+
 class TestProvider(unittest.TestCase):
 
     def setUp(self):
@@ -61,3 +105,860 @@ class TestProvider(unittest.TestCase):
         self.provider.destroy_session(1)
         self.assertTrue(session_destroyed.toggled)
         self.assertEqual(session_destroyed.args[0], 1)
+
+    def test_expire_sessions(self):
+        """
+        Test idle sessions expire, and no longer pin old revisions.
+        """
+
+        self.provider.update()
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        other_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+
+        self.provider.set_session_revision(session_id, self.provider.revision)
+        self.provider.update()
+
+        self.assertEqual(self.provider.server.databases.store.min_revision, 1)
+
+        # The other session went away. Streaming sessions stay.
+        self.provider.set_session_revision(session_id, self.provider.revision)
+        self.provider.sessions[session_id].state = State.streaming
+        self.provider.sessions[session_id].last_activity -= 3600
+        self.provider.sessions[other_id].last_activity -= 3600
+
+        self.assertEqual(self.provider.expire_sessions(), [other_id])
+        self.assertEqual(self.provider.sessions.keys(), [session_id])
+        self.assertEqual(
+            self.provider.server.databases.store.min_revision,
+            self.provider.revision)
+
+        # Activity keeps a session alive.
+        self.provider.sessions[session_id].state = State.connected
+        self.provider.touch_session(session_id)
+
+        self.assertEqual(self.provider.expire_sessions(), [])
+
+    def test_reaper(self):
+        """
+        Test the reaper expires sessions in the background.
+        """
+
+        self.provider.reap_interval = 0.01
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        self.provider.sessions[session_id].last_activity -= 3600
+
+        reaper = self.provider.reaper
+        reaper.join(timeout=1)
+
+        self.assertEqual(self.provider.sessions, {})
+        self.assertIsNone(self.provider.reaper)
+
+    def test_long_poll(self):
+        """
+        Test waiting clients are woken up in batches, or time out.
+        """
+
+        self.provider.wakeup_batch_size = 2
+        self.provider.wakeup_interval = 0.01
+        self.provider.update_timeout = 0.05
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        revision = self.provider.revision
+
+        # Time out, returning the current revision.
+        self.assertEqual(self.provider.get_next_revision(
+            session_id, revision, revision), revision)
+        self.assertEqual(self.provider.waiter_count, 0)
+
+        # A client that is behind does not wait.
+        self.provider.update()
+
+        self.assertEqual(self.provider.get_next_revision(
+            session_id, revision, revision), revision + 1)
+
+        self.provider.update_timeout = 0
+        waiters = [
+            gevent.spawn(
+                self.provider.get_next_revision, session_id, revision + 1,
+                revision + 1)
+            for _ in range(5)]
+        gevent.sleep(0)
+
+        self.assertEqual(self.provider.waiter_count, 5)
+
+        self.provider.update()
+        gevent.sleep(0)
+
+        self.assertEqual(
+            len([waiter for waiter in waiters if waiter.ready()]), 2)
+        self.assertEqual(self.provider.waiter_count, 0)
+
+        gevent.joinall(waiters, timeout=1)
+
+        self.assertEqual(
+            [waiter.value for waiter in waiters], [revision + 2] * 5)
+
+    def test_coalesced_update(self):
+        """
+        Test updates within the delay are published as one revision.
+        """
+
+        updated = Latch()
+
+        self.provider.hooks["updated"].append(updated)
+        self.provider.update_delay = 0.01
+        self.provider.update_max_pending = 3
+
+        revision = self.provider.revision
+
+        self.provider.update()
+        self.provider.update()
+
+        self.assertEqual(self.provider.revision, revision)
+        self.assertFalse(updated.toggled)
+
+        gevent.sleep(0.05)
+
+        self.assertEqual(self.provider.revision, revision + 1)
+        self.assertTrue(updated.toggled)
+        self.assertIsNone(self.provider.update_timer)
+
+        # Publish immediately if too many updates are pending.
+        for _ in range(3):
+            self.provider.update()
+
+        self.assertEqual(self.provider.revision, revision + 2)
+        self.assertIsNone(self.provider.update_timer)
+
+        self.provider.update()
+        self.provider.flush_updates()
+
+        self.assertEqual(self.provider.revision, revision + 3)
+
+        self.provider.flush_updates()
+
+        self.assertEqual(self.provider.revision, revision + 3)
+
+    def test_retention(self):
+        """
+        Test history is cleaned for lagging sessions, which receive a full
+        response instead.
+        """
+
+        self.provider.max_revisions = 2
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        self.provider.set_session_revision(session_id, 1)
+
+        databases = self.provider.server.databases
+
+        for _ in range(4):
+            self.provider.update()
+
+        self.assertEqual(self.provider.revision, 5)
+        self.assertEqual(self.provider.min_revision, 4)
+        self.assertEqual(databases.store.min_revision, 4)
+        self.assertEqual(len(self.provider.revision_times), 2)
+
+        self.assertTrue(self.provider.is_stale(5, 1))
+        self.assertFalse(self.provider.is_stale(5, 4))
+
+        new, old = self.provider.get_databases(session_id, 5, 1)
+
+        self.assertIs(new, databases)
+        self.assertIsNone(old)
+
+        new, old = self.provider.get_databases(session_id, 5, 4)
+
+        self.assertEqual(old.revision, 4)
+
+    def test_lazy_containers(self):
+        """
+        Test container items of containers loaded by a lazy collection are
+        committed, so deltas of later revisions can be computed.
+        """
+
+        database = LazyDatabase(id=1, name="Library")
+        database.items.add(Item(id=1))
+        database.items.add(Item(id=2))
+
+        self.provider.server.databases.add(database)
+
+        for _ in range(3):
+            self.provider.update()
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+
+        new, old = self.provider.get_container_items(session_id, 1, 1, 4, 0)
+
+        self.assertEqual(new.keys(), [1])
+
+        self.provider.update()
+
+        new, old = self.provider.get_container_items(session_id, 1, 1, 5, 4)
+
+        self.assertEqual(new.keys(), [1])
+        self.assertEqual(list(new.updated(old)), [])
+
+        container = database.containers[1]
+        container.container_items.add(ContainerItem(id=2, item_id=2))
+        self.provider.update()
+
+        new, old = self.provider.get_container_items(session_id, 1, 1, 6, 5)
+
+        self.assertEqual(sorted(new.keys()), [1, 2])
+        self.assertEqual(list(new.updated(old)), [2])
+
+    def test_local_delta(self):
+        """
+        Test a delta between server revisions that map to the same local
+        revision of a database is empty.
+        """
+
+        class MyDatabase(Database):
+            __slots__ = Database.__slots__
+
+            independent_revisions = True
+
+        database_a = MyDatabase(id=1, name="Database A")
+        database_b = Database(id=2, name="Database B")
+
+        self.provider.server.databases.add(database_a)
+        self.provider.server.databases.add(database_b)
+        self.provider.update()
+
+        # The last change of database A is at the shared local revision.
+        database_a.items.add(Item(id=1))
+        self.provider.update()
+        database_b.items.add(Item(id=2))
+        self.provider.update()
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+
+        self.assertEqual(
+            database_a.to_local_revision(4), database_a.to_local_revision(3))
+
+        new, old = self.provider.get_items(session_id, 1, 4, 3)
+
+        self.assertEqual(new.keys(), [1])
+        self.assertEqual(utils.diff(new, old), (set(), set(), True))
+
+        new, old = self.provider.get_items(session_id, 1, 4, 2)
+
+        self.assertEqual(utils.diff(new, old), (set([1]), set(), True))
+
+    def test_retention_age(self):
+        """
+        Test history older than the maximum age is cleaned.
+        """
+
+        self.provider.max_revision_age = 60
+
+        self.provider.update()
+        self.provider.update()
+
+        self.assertIsNone(self.provider.get_retained_revision())
+
+        self.provider.revision_times = collections.deque([
+            (1, time.time() - 120), (2, time.time() - 90),
+            (3, time.time() - 30)])
+
+        self.assertEqual(self.provider.get_retained_revision(), 2)
+
+
+class PrefetchProvider(Provider):
+    """
+    Provider that records the items it prefetches.
+    """
+
+    prefetch_next = True
+
+    def __init__(self):
+        """
+        Initialize a database with four items, a base container with the
+        items in reverse order, and a playlist with items 1 and 3.
+        """
+
+        super(PrefetchProvider, self).__init__()
+
+        self.prefetched = []
+        self.server = Server()
+
+        database = Database(id=1)
+        self.server.databases.add(database)
+
+        base = Container(id=1, is_base=True)
+        playlist = Container(id=2)
+        database.containers.add(base)
+        database.containers.add(playlist)
+
+        for i in xrange(1, 5):
+            database.items.add(Item(id=i))
+            base.container_items.add(
+                ContainerItem(id=i, item_id=i, order=5 - i))
+
+        playlist.container_items.add(ContainerItem(id=1, item_id=1))
+        playlist.container_items.add(ContainerItem(id=2, item_id=3))
+
+    def prefetch_item_data(self, session, item, size):
+        """
+        """
+
+        self.prefetched.append(item.id)
+
+    def get_item_data(self, session, item, byte_range=None):
+        """
+        """
+
+        return "data", "audio/mp3", 4
+
+
+class TestPrefetch(unittest.TestCase):
+
+    def test_prefetch(self):
+        """
+        Test the next item of the base container is prefetched once per item,
+        or of the container the client listed last.
+        """
+
+        provider = PrefetchProvider()
+        session_id = provider.create_session("User-Agent", "127.0.0.1", "1")
+
+        # Base container is in reverse order.
+        provider.get_item(session_id, 1, 3)
+        provider.get_item(session_id, 1, 3, byte_range=(2, None))
+        provider.prefetcher.join()
+
+        self.assertEqual(provider.prefetched, [2])
+
+        # Last item of the base container.
+        provider.get_item(session_id, 1, 1)
+        provider.prefetcher.join()
+
+        self.assertEqual(provider.prefetched, [2])
+
+        # The playlist is used if it was listed last. Item 3 is its last item.
+        provider.get_container_items(session_id, 1, 2, 1, 0)
+        provider.get_item(session_id, 1, 3)
+        provider.get_item(session_id, 1, 1)
+        provider.prefetcher.join()
+
+        self.assertEqual(provider.prefetched, [2, 3])
+
+    def test_next_items(self):
+        """
+        Test the next items of a container are cached until the container
+        items change.
+        """
+
+        provider = PrefetchProvider()
+        provider.update()
+
+        database = provider.server.databases[1]
+        base = database.containers[1]
+        next_items = provider.get_next_items(1, base)
+
+        self.assertEqual(next_items, {4: 3, 3: 2, 2: 1, 1: None})
+        self.assertIs(provider.get_next_items(1, base), next_items)
+        self.assertIs(provider.get_base_container(database), base)
+
+        # Uncommitted changes are used, but not cached.
+        base.container_items.update(1, order=0)
+
+        next_items = provider.get_next_items(1, base)
+
+        self.assertEqual(next_items, {1: 4, 4: 3, 3: 2, 2: None})
+        self.assertIsNot(provider.get_next_items(1, base), next_items)
+
+        provider.update()
+        next_items = provider.get_next_items(1, base)
+
+        self.assertEqual(next_items, {1: 4, 4: 3, 3: 2, 2: None})
+        self.assertIs(provider.get_next_items(1, base), next_items)
+
+
+class InlineFileProvider(LocalFileProvider):
+    """
+    Local file provider that reads files in the event loop.
+    """
+
+    io_threads = 0
+
+
+class TestLocalFileProvider(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Initialize a provider with one item, backed by a temporary file.
+        """
+
+        fd, self.file_name = tempfile.mkstemp()
+        os.write(fd, "0123456789")
+        os.close(fd)
+
+        self.provider = LocalFileProvider()
+        self.provider.server = Server()
+
+        database = Database(id=1)
+        database.items.add(Item(
+            id=1, file_name=self.file_name, file_type="audio/mp3",
+            file_size=10))
+        self.provider.server.databases.add(database)
+
+    def tearDown(self):
+        """
+        Remove the temporary file.
+        """
+
+        os.remove(self.file_name)
+
+    def test_get_item_inline(self):
+        """
+        Test files are passed through without I/O threads, and the session
+        state is updated when the file is closed.
+        """
+
+        provider = InlineFileProvider()
+        provider.server = self.provider.server
+
+        session_id = provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        session = provider.sessions[session_id]
+
+        data, mimetype, size = provider.get_item(session_id, 1, 1)
+
+        self.assertIsInstance(data, StreamingFile)
+        self.assertEqual(session.state, State.streaming)
+        self.assertEqual(data.read(), "0123456789")
+
+        data.close()
+        data.close()
+
+        self.assertEqual(session.state, State.connected)
+
+        # Parts of a file are read in the event loop.
+        data, mimetype, size = provider.get_item(
+            session_id, 1, 1, byte_range=(2, 7))
+
+        self.assertEqual("".join(data), "23456")
+
+    def test_get_item(self):
+        """
+        Test files are read in blocks by the I/O threads, and the session
+        state is updated when done.
+        """
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        session = self.provider.sessions[session_id]
+
+        self.provider.block_size = 4
+
+        # Whole files are passed through. If the server cannot send them,
+        # they are read in blocks.
+        data, mimetype, size = self.provider.get_item(session_id, 1, 1)
+
+        self.assertIsInstance(data, StreamingFile)
+
+        data = self.provider.iter_file(data)
+
+        self.assertEqual(next(data), "0123")
+        self.assertEqual(session.state, State.streaming)
+        self.assertEqual(list(data), ["4567", "89"])
+        self.assertEqual(session.state, State.connected)
+
+        # Reading is stopped when the client disconnects.
+        data, mimetype, size = self.provider.get_item(session_id, 1, 1)
+        data = self.provider.iter_file(data)
+
+        self.assertEqual(next(data), "0123")
+
+        data.close()
+
+        self.assertEqual(session.state, State.connected)
+        self.assertEqual(len(self.provider.file_pool.references), 0)
+
+        # Parts of a file are read in blocks.
+        self.provider.block_size = 2
+
+        data, mimetype, size = self.provider.get_item(
+            session_id, 1, 1, byte_range=(2, 7))
+
+        self.assertEqual(list(data), ["23", "45", "6"])
+        self.assertEqual(session.state, State.connected)
+
+        data, mimetype, size = self.provider.get_item(
+            session_id, 1, 1, byte_range=(None, 3))
+
+        self.assertEqual("".join(data), "012")
+
+        data, mimetype, size = self.provider.get_item(
+            session_id, 1, 1, byte_range=(8, None))
+
+        self.assertEqual("".join(data), "89")
+
+        # Ranges share one descriptor, which is kept open.
+        self.assertEqual(len(self.provider.file_pool), 1)
+        self.assertEqual(len(self.provider.file_pool.references), 0)
+
+        self.provider.file_pool.close()
+
+    def test_get_item_ranges(self):
+        """
+        Test multiple byte ranges are returned in order, and the session state
+        is updated when done.
+        """
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        session = self.provider.sessions[session_id]
+
+        parts, mimetype, size = self.provider.get_item_ranges(
+            session_id, 1, 1, [(0, 2), (5, 7), (8, None)])
+
+        self.assertEqual(mimetype, "audio/mp3")
+        self.assertEqual(size, 10)
+        self.assertEqual(
+            [(byte_range, "".join(data)) for byte_range, data in parts],
+            [((0, 2), "01"), ((5, 7), "56"), ((8, 10), "89")])
+        self.assertEqual(session.state, State.connected)
+        self.assertEqual(len(self.provider.file_pool), 1)
+        self.assertEqual(len(self.provider.file_pool.references), 0)
+
+        self.provider.file_pool.close()
+
+    def test_validators(self):
+        """
+        Test validators are derived from the file, or from the content hash
+        of the artwork once it is known.
+        """
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        item = self.provider.server.databases[1].items[1]
+        item.album_art = self.file_name
+
+        etag, last_modified = self.provider.get_item_validators(
+            session_id, 1, 1)
+
+        self.assertEqual(last_modified, int(os.path.getmtime(self.file_name)))
+        self.assertEqual(
+            self.provider.get_item_validators(session_id, 1, 1),
+            (etag, last_modified))
+
+        self.assertEqual(
+            self.provider.get_artwork_validators(session_id, 1, 1, 10, 20),
+            (etag + "-10x20", last_modified))
+
+        self.provider.get_artwork(session_id, 1, 1)
+        etag, last_modified = self.provider.get_artwork_validators(
+            session_id, 1, 1)
+
+        self.assertEqual(etag, hashlib.sha1("0123456789").hexdigest() + "-0x0")
+        self.assertEqual(last_modified, None)
+
+        # The content hash is not used anymore when the artwork changes.
+        with open(self.file_name, "wb") as fp:
+            fp.write("9876543210")
+
+        mtime = os.path.getmtime(self.file_name) + 10
+        os.utime(self.file_name, (mtime, mtime))
+
+        etag, last_modified = self.provider.get_artwork_validators(
+            session_id, 1, 1)
+
+        self.assertEqual(last_modified, int(mtime))
+
+        data, _, _ = self.provider.get_artwork(session_id, 1, 1)
+        etag, last_modified = self.provider.get_artwork_validators(
+            session_id, 1, 1)
+
+        self.assertEqual(data, "9876543210")
+        self.assertEqual(etag, hashlib.sha1("9876543210").hexdigest() + "-0x0")
+
+        # Files that do not exist have no validators.
+        item.file_name = "/does/not/exist"
+
+        self.assertEqual(
+            self.provider.get_item_validators(session_id, 1, 1), None)
+
+    def test_prefetch_item_data(self):
+        """
+        Test the page cache is warmed using the descriptor pool.
+        """
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+        session = self.provider.sessions[session_id]
+        item = self.provider.server.databases[1].items[1]
+
+        self.provider.prefetch_item_data(session, item, 4)
+
+        self.assertEqual(len(self.provider.file_pool), 1)
+        self.assertEqual(len(self.provider.file_pool.references), 0)
+
+        self.provider.file_pool.close()
+
+    def test_get_item_mapped(self):
+        """
+        Test byte ranges of small files are served from memory mappings.
+        """
+
+        session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+
+        self.provider.block_size = 4
+        self.provider.max_mapped_file_size = 10
+
+        data, mimetype, size = self.provider.get_item(
+            session_id, 1, 1, byte_range=(1, None))
+
+        self.assertEqual(list(data), ["1234", "5678", "9"])
+        self.assertEqual(len(self.provider.mapped_files), 1)
+        self.assertEqual(len(self.provider.file_pool), 0)
+
+
+class TestFilePool(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Create three temporary files.
+        """
+
+        self.file_names = []
+
+        for i in xrange(3):
+            fd, file_name = tempfile.mkstemp()
+            os.write(fd, "%d123456789" % i)
+            os.close(fd)
+
+            self.file_names.append(file_name)
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+
+        for file_name in self.file_names:
+            os.remove(file_name)
+
+    def test_read(self):
+        """
+        Test concurrent reads of the same file do not interfere.
+        """
+
+        pool = FilePool()
+        file_name = self.file_names[0]
+
+        a = pool.read(file_name, 0, 10, block_size=3)
+        b = pool.read(file_name, 5, 5, block_size=3)
+
+        self.assertEqual(next(a), "012")
+        self.assertEqual(next(b), "567")
+        self.assertEqual(next(a), "345")
+        self.assertEqual(list(b), ["89"])
+        self.assertEqual(list(a), ["678", "9"])
+
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(len(pool.references), 0)
+
+        pool.close()
+
+        self.assertEqual(len(pool), 0)
+
+    def test_evict(self):
+        """
+        Test the least recently used descriptors are closed first, unless they
+        are in use.
+        """
+
+        pool = FilePool(max_open=2)
+
+        pool.acquire(self.file_names[0])
+        pool.release(self.file_names[0])
+        pool.acquire(self.file_names[1])
+        pool.acquire(self.file_names[2])
+
+        self.assertEqual(
+            list(pool.descriptors), [self.file_names[1], self.file_names[2]])
+
+        # Both are in use, so a third one is allowed until released.
+        pool.acquire(self.file_names[0])
+
+        self.assertEqual(len(pool), 3)
+
+        pool.release(self.file_names[1])
+
+        self.assertEqual(
+            list(pool.descriptors), [self.file_names[2], self.file_names[0]])
+
+        pool.release(self.file_names[2])
+        pool.release(self.file_names[0])
+        pool.close()
+
+    def test_invalidate(self):
+        """
+        Test a replaced file is opened again after it is invalidated, while
+        readers of the old file can continue.
+        """
+
+        pool = FilePool()
+        file_name = self.file_names[0]
+
+        data = pool.read(file_name, 0, 10, block_size=5)
+
+        self.assertEqual(next(data), "01234")
+
+        os.remove(file_name)
+
+        with open(file_name, "wb") as fp:
+            fp.write("abcdefghij")
+
+        # Without invalidating, the old file is read.
+        self.assertEqual("".join(pool.read(file_name, 0, 5)), "01234")
+
+        pool.invalidate(file_name)
+
+        self.assertEqual("".join(pool.read(file_name, 0, 5)), "abcde")
+        self.assertEqual(list(data), ["56789"])
+        self.assertEqual(pool.invalidated, {})
+        self.assertEqual(len(pool.references), 0)
+
+        pool.close()
+
+
+class TestRevisionTracker(unittest.TestCase):
+
+    def test_lowest(self):
+        """
+        Test the lowest revision follows added, moved and removed sessions.
+        """
+
+        tracker = RevisionTracker()
+
+        self.assertIsNone(tracker.lowest())
+
+        tracker.add(3)
+        tracker.add(1)
+        tracker.add(1)
+
+        self.assertEqual(tracker.lowest(), 1)
+        self.assertEqual(len(tracker), 3)
+
+        tracker.move(1, 4)
+
+        self.assertEqual(tracker.lowest(), 1)
+
+        tracker.move(1, 4)
+
+        self.assertEqual(tracker.lowest(), 3)
+
+        tracker.remove(3)
+        tracker.add(2)
+
+        self.assertEqual(tracker.lowest(), 2)
+
+        tracker.remove(2)
+        tracker.remove(4)
+        tracker.remove(4)
+
+        self.assertIsNone(tracker.lowest())
+        self.assertEqual(tracker.heap, [])
+
+
+class TestMappedFileCache(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Create three temporary files of ten bytes.
+        """
+
+        self.file_names = []
+
+        for i in xrange(3):
+            fd, file_name = tempfile.mkstemp()
+            os.write(fd, "%d123456789" % i)
+            os.close(fd)
+
+            self.file_names.append(file_name)
+
+    def tearDown(self):
+        """
+        Remove the temporary files.
+        """
+
+        for file_name in self.file_names:
+            os.remove(file_name)
+
+    def test_read(self):
+        """
+        Test reading parts of a mapped file.
+        """
+
+        cache = MappedFileCache()
+
+        self.assertEqual(
+            list(cache.read(self.file_names[0], 2, 5, block_size=2)),
+            ["23", "45", "6"])
+        self.assertEqual(
+            list(cache.read(self.file_names[0], 8, 100)), ["89"])
+        self.assertEqual(cache.size, 10)
+
+        cache.discard(self.file_names[0])
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_evict(self):
+        """
+        Test the least recently used mappings are dropped first, and readers
+        of a dropped mapping are not affected.
+        """
+
+        cache = MappedFileCache(max_size=20)
+
+        reader = cache.read(self.file_names[0], 0, 10, block_size=5)
+
+        self.assertEqual(next(reader), "01234")
+
+        cache.get(self.file_names[1])
+        cache.get(self.file_names[2])
+
+        self.assertEqual(
+            list(cache.mappings), [self.file_names[1], self.file_names[2]])
+        self.assertEqual(cache.size, 20)
+        self.assertEqual(list(reader), ["56789"])
+
+        # Files larger than the cache are not cached.
+        cache.max_size = 5
+        cache.evict()
+
+        self.assertEqual(cache.get(self.file_names[0])[:2], "01")
+        self.assertEqual(len(cache), 0)
+
+    def test_changed(self):
+        """
+        Test files that changed on disk are mapped again.
+        """
+
+        cache = MappedFileCache()
+
+        self.assertEqual(list(cache.read(self.file_names[0], 0, 5)), ["01234"])
+
+        with open(self.file_names[0], "wb") as fp:
+            fp.write("abcdefghijklmno")
+
+        mtime = os.path.getmtime(self.file_names[0]) + 10
+        os.utime(self.file_names[0], (mtime, mtime))
+
+        self.assertEqual(list(cache.read(self.file_names[0], 0, 5)), ["abcde"])
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, 15)
@@ -0,0 +1,315 @@
+from daapserver.remote import RemoteProvider
+from daapserver.models import Server, Database, Item
+from daapserver.utils import CacheDirectory
+
+from gevent.pywsgi import WSGIServer
+
+import os
+import shutil
+import tempfile
+import unittest
+
+# Contents of the remote file.
+DATA = "".join(chr(i) for i in xrange(256)) * 4
+
+
+class StandInServer(object):
+    """
+    Local HTTP server that serves `DATA', with support for byte ranges. The
+    ranges and remote ports of all requests are recorded.
+    """
+
+    def __init__(self, support_ranges=True):
+        """
+        """
+
+        self.support_ranges = support_ranges
+        self.requests = []
+        self.ports = set()
+
+        self.server = WSGIServer(("127.0.0.1", 0), self, log=None)
+        self.server.start()
+
+    def __call__(self, environ, start_response):
+        """
+        """
+
+        byte_range = environ.get("HTTP_RANGE")
+
+        self.requests.append(byte_range)
+        self.ports.add(environ["REMOTE_PORT"])
+
+        if environ["PATH_INFO"] == "/redirect":
+            start_response("302 Found", [
+                ("Location", "/file"), ("Content-Length", "0")])
+            return [""]
+
+        if not byte_range or not self.support_ranges:
+            start_response("200 OK", [
+                ("Content-Type", "audio/mp3"),
+                ("Content-Length", str(len(DATA)))])
+            return [DATA]
+
+        begin, end = byte_range[len("bytes="):].split("-")
+        begin, end = int(begin), int(end or len(DATA) - 1) + 1
+
+        start_response("206 Partial Content", [
+            ("Content-Type", "audio/mp3"),
+            ("Content-Length", str(end - begin)),
+            ("Content-Range", "bytes %d-%d/%d" % (begin, end - 1, len(DATA)))])
+        return [DATA[begin:end]]
+
+    @property
+    def url(self):
+        """
+        """
+
+        return "http://127.0.0.1:%d/redirect" % self.server.server_port
+
+    def stop(self):
+        """
+        """
+
+        self.server.stop()
+
+
+class StandInProvider(RemoteProvider):
+    """
+    Provider that streams every item from the stand-in server.
+    """
+
+    def __init__(self, url, cache_directory):
+        """
+        """
+
+        self.url = url
+        self.cache_directory = cache_directory
+
+        super(StandInProvider, self).__init__()
+
+        self.server = Server()
+
+        database = Database(id=1)
+        database.items.add(Item(id=1, file_type="audio/mp3"))
+        self.server.databases.add(database)
+
+        self.session_id = self.create_session("User-Agent", "127.0.0.1", "1")
+
+    def get_item_url(self, session, item):
+        """
+        """
+
+        return self.url
+
+    def read(self, byte_range=None):
+        """
+        Read a byte range of the item.
+        """
+
+        data, mimetype, size = self.get_item(
+            self.session_id, 1, 1, byte_range=byte_range)
+
+        return "".join(data)
+
+
+class TestRemoteProvider(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Start a stand-in server, and create a provider for it.
+        """
+
+        self.directory = tempfile.mkdtemp()
+        self.remote = StandInServer()
+        self.provider = StandInProvider(self.remote.url, self.directory)
+
+    def tearDown(self):
+        """
+        Stop the stand-in server, and remove the cache directory.
+        """
+
+        self.provider.connections.close()
+        self.provider.file_pool.close()
+        self.remote.stop()
+
+        shutil.rmtree(self.directory)
+
+    def test_cache(self):
+        """
+        Test a remote file is cached while it is streamed, and served from the
+        cache afterwards.
+        """
+
+        self.assertEqual(self.provider.read(), DATA)
+
+        entry = self.provider.cache.get("item-1")
+
+        self.assertTrue(entry.complete)
+        self.assertEqual(entry.size, len(DATA))
+        self.assertEqual(entry.mimetype, "audio/mp3")
+        self.assertEqual(
+            open(os.path.join(self.directory, "item-1")).read(), DATA)
+
+        count = len(self.remote.requests)
+
+        self.assertEqual(self.provider.read((10, 20)), DATA[10:20])
+        self.assertEqual(len(self.remote.requests), count)
+
+    def test_resume(self):
+        """
+        Test byte ranges continue the cached prefix, and byte ranges after the
+        cached prefix are not cached.
+        """
+
+        self.assertEqual(self.provider.read((0, 100)), DATA[:100])
+        self.assertEqual(self.provider.cache.get("item-1").length, 100)
+
+        self.assertEqual(self.provider.read((50, 200)), DATA[50:200])
+        self.assertEqual(self.provider.cache.get("item-1").length, 200)
+        self.assertEqual(self.remote.requests[-1], "bytes=100-199")
+
+        self.assertEqual(self.provider.read((500, None)), DATA[500:])
+        self.assertEqual(self.provider.cache.get("item-1").length, 200)
+        self.assertEqual(self.remote.requests[-1], "bytes=500-1023")
+
+        # Cached ranges are not requested.
+        count = len(self.remote.requests)
+
+        self.assertEqual(self.provider.read((20, 40)), DATA[20:40])
+        self.assertEqual(len(self.remote.requests), count)
+
+    def test_no_ranges(self):
+        """
+        Test remote servers without support for byte ranges.
+        """
+
+        self.remote.support_ranges = False
+
+        # The whole file is returned, so the skipped bytes are cached too.
+        self.assertEqual(self.provider.read((100, 200)), DATA[100:200])
+        self.assertEqual(self.provider.cache.get("item-1").length, 200)
+
+        count = len(self.remote.requests)
+
+        self.assertEqual(self.provider.read((0, 100)), DATA[:100])
+        self.assertEqual(len(self.remote.requests), count)
+
+    def test_prefetch(self):
+        """
+        Test the first bytes are downloaded into the cache, once.
+        """
+
+        session = self.provider.sessions[self.provider.session_id]
+        item = self.provider.server.databases[1].items[1]
+
+        self.provider.prefetch_item_data(session, item, 100)
+
+        self.assertEqual(self.provider.cache.get("item-1").length, 100)
+
+        count = len(self.remote.requests)
+
+        self.provider.prefetch_item_data(session, item, 100)
+        self.provider.read((0, 50))
+
+        self.assertEqual(len(self.remote.requests), count)
+
+    def test_keep_alive(self):
+        """
+        Test connections are reused for requests that were read completely.
+        """
+
+        self.provider.read((0, 10))
+        self.provider.read((10, 20))
+        self.provider.read((30, 40))
+
+        self.assertEqual(len(self.remote.ports), 1)
+
+    def test_discard(self):
+        """
+        Test descriptors of discarded files are not reused.
+        """
+
+        self.assertEqual(self.provider.read((0, 100)), DATA[:100])
+
+        entry = self.provider.cache.get("item-1")
+        self.provider.read((0, 10))
+
+        self.assertIn(entry.file_name, self.provider.file_pool.descriptors)
+
+        self.provider.cache.discard("item-1")
+
+        self.assertNotIn(
+            entry.file_name, self.provider.file_pool.descriptors)
+
+
+class TestCacheDirectory(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Create an empty cache directory.
+        """
+
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Remove the cache directory.
+        """
+
+        shutil.rmtree(self.directory)
+
+    def test_evict(self):
+        """
+        Test the least recently used entries are removed first, except for
+        entries that are being written.
+        """
+
+        cache = CacheDirectory(self.directory, max_size=10)
+
+        for key in ("a", "b", "c"):
+            entry = cache.get(key)
+            entry.writing = True
+
+            with open(entry.file_name, "wb") as fp:
+                fp.write("12345")
+
+            cache.grow(entry, 5)
+            entry.writing = False
+
+        self.assertEqual(list(cache.entries), ["b", "c"])
+        self.assertEqual(cache.size, 10)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)), ["b.part", "c.part"])
+
+        cache.finish(cache.get("b"))
+
+        # Complete files are indexed again, incomplete ones are removed.
+        cache = CacheDirectory(self.directory, max_size=10)
+
+        self.assertEqual(list(cache.entries), ["b"])
+        self.assertTrue(cache.get("b").complete)
+        self.assertEqual(os.listdir(self.directory), ["b"])
+
+    def test_on_remove(self):
+        """
+        Test the callback is invoked for files that are renamed or removed.
+        """
+
+        removed = []
+        cache = CacheDirectory(
+            self.directory, max_size=10, on_remove=removed.append)
+
+        entry = cache.get("a")
+        part_name = entry.file_name
+
+        with open(entry.file_name, "wb") as fp:
+            fp.write("12345")
+
+        cache.grow(entry, 5)
+        cache.finish(entry)
+
+        self.assertEqual(removed, [part_name])
+
+        cache.discard("a")
+
+        self.assertEqual(removed, [part_name, entry.file_name])
@@ -194,6 +194,141 @@ class TestRevisionStore(unittest.TestCase):
             for _ in self.store.iterate(revision=2):
                 pass
 
+    def test_dirty(self):
+        """
+        Test the store is only dirty if history has to be cleaned.
+        """
+
+        self.store.add("A", "A1")
+        self.store.add("B", "B1")
+
+        self.assertFalse(self.store.dirty)
+
+        self.store.commit()
+        self.store.add("A", "A2")
+        self.store.commit()
+        self.store.remove("B")
+
+        self.assertTrue(self.store.dirty)
+
+        self.store.clean(revision=2)
+
+        self.assertTrue(self.store.dirty)
+        self.assertIterEqual(self.store.iterate(revision=2), ["B1", "A2"])
+
+        self.store.clean(revision=3)
+
+        self.assertFalse(self.store.dirty)
+        self.assertIterEqual(self.store.iterate(revision=3), ["A2"])
+
+        # Cleaning a store that is not dirty only moves the minimal revision.
+        self.store.commit()
+        self.store.clean(revision=4)
+
+        self.assertEqual(self.store.min_revision, 4)
+
+        with self.assertRaises(ValueError):
+            for _ in self.store.iterate(revision=3):
+                pass
+
+    def test_index(self):
+        """
+        Test secondary indexes for all revisions that are kept.
+        """
+
+        self.store.add("A", "x1")
+        self.store.add("B", "y1")
+        self.store.create_index("letter", lambda value: value[0])
+
+        self.assertIterEqual(self.store.find("letter", "x"), ["A"])
+
+        self.store.commit()
+        self.store.add("B", "x2")
+        self.store.add("C", "z2")
+        self.store.commit()
+        self.store.remove("A")
+
+        self.assertIterEqual(self.store.find("letter", "x"), ["B"])
+        self.assertIterEqual(
+            sorted(self.store.find("letter", "x", revision=2)), ["A", "B"])
+        self.assertIterEqual(self.store.find("letter", "y", revision=1), ["B"])
+        self.assertIterEqual(self.store.find("letter", "y"), [])
+
+        # Cleaning removes keys for values that are not kept anymore.
+        self.store.clean(revision=3)
+
+        self.assertEqual(self.store.indexes["letter"].entries, {
+            "x": {"B"}, "z": {"C"}})
+
+        self.assertTrue(self.store.evict("C"))
+        self.assertIterEqual(self.store.find("letter", "z"), [])
+
+        with self.assertRaises(ValueError):
+            self.store.create_index("letter", lambda value: value[0])
+
+    def test_unique_index(self):
+        """
+        Test unique indexes reject duplicate values.
+        """
+
+        self.store.add("A", "x1")
+        self.store.create_index("letter", lambda value: value[0], unique=True)
+
+        with self.assertRaises(ValueError):
+            self.store.add("B", "x2")
+
+        self.assertFalse("B" in self.store)
+
+        # The value can be reused after removal.
+        self.store.remove("A")
+        self.store.add("B", "x2")
+
+        self.assertIterEqual(self.store.find("letter", "x"), ["B"])
+
+    def test_evict(self):
+        """
+        Test eviction of keys without required history.
+        """
+
+        self.store.add("A", "A1")
+        self.store.add("B", "B1")
+        self.store.add("C", "C1")
+
+        # Nothing is older than the minimal revision.
+        self.assertFalse(self.store.evict("A"))
+
+        self.store.commit()
+        self.store.add("B", "B2")
+        self.store.clean(revision=2)
+
+        self.assertTrue(self.store.evict("A"))
+        self.assertTrue(self.store.evict("C"))
+        self.assertFalse(self.store.evict("B"))
+        self.assertFalse(self.store.evict("D"))
+
+        self.assertIterEqual(self.store.iterate(), ["B2"])
+        self.assertFalse("A" in self.store)
+
+        with self.assertRaises(KeyError):
+            self.store.get("A")
+
+    def test_backdate(self):
+        """
+        Test backdated keys do not show up in diffs.
+        """
+
+        self.store.commit()
+        self.store.commit()
+        self.store.clean(revision=2)
+
+        self.store.add("A", "A3")
+        self.store.add("B", "B3")
+        self.store.backdate("A")
+
+        self.assertIterEqual(self.store.diff(3, 2), [("B", 1)])
+        self.assertIterEqual(self.store.iterate(revision=2), ["A3"])
+        self.assertTrue(self.store.evict("A"))
+
     def test_diff(self):
         """
         Test diff functionality (1).
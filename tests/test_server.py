@@ -0,0 +1,310 @@
+from daapserver.server import create_server_app
+from daapserver.provider import LocalFileProvider
+from daapserver.models import Server, Database, Item
+from daapserver import utils
+
+import os
+import hashlib
+import unittest
+import tempfile
+
+# Contents of the item file.
+DATA = "0123456789"
+
+
+class TestServer(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Initialize a server with one item, backed by a temporary file, and a
+        client with one session.
+        """
+
+        fd, self.file_name = tempfile.mkstemp()
+        os.write(fd, DATA)
+        os.close(fd)
+
+        self.provider = LocalFileProvider()
+        self.provider.server = Server(name="Test")
+
+        database = Database(id=1, name="Test")
+        database.items.add(Item(
+            id=1, file_name=self.file_name, file_type="audio/mp3",
+            file_size=len(DATA)))
+        self.provider.server.databases.add(database)
+
+        self.client = create_server_app(self.provider).test_client()
+        self.session_id = self.provider.create_session(
+            "User-Agent", "127.0.0.1", "1.0")
+
+    def tearDown(self):
+        """
+        Remove the temporary file.
+        """
+
+        self.provider.file_pool.close()
+
+        os.remove(self.file_name)
+
+    def get(self, path, headers=None, **kwargs):
+        """
+        Request a path with the session ID of the client.
+        """
+
+        kwargs.setdefault("session-id", self.session_id)
+
+        return self.client.get(
+            path, query_string=kwargs, headers=headers or {})
+
+    def test_expired_session(self):
+        """
+        Test requests of an expired session are answered with 403.
+        """
+
+        response = self.get("/databases/1/items/1.mp3")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, DATA)
+
+        self.provider.sessions[self.session_id].last_activity -= 3600
+        self.provider.expire_sessions()
+
+        response = self.get(
+            "/update", **{"revision-number": 1, "delta": 1})
+
+        self.assertEqual(response.status_code, 403)
+
+        response = self.get("/databases/1/items/1.mp3")
+
+        self.assertEqual(response.status_code, 403)
+
+        response = self.get(
+            "/databases", **{"revision-number": 1, "delta": 0})
+
+        self.assertEqual(response.status_code, 403)
+
+        # Requests without a session ID are refused as well.
+        response = self.client.get("/databases/1/items/1.mp3")
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_file_wrapper(self):
+        """
+        Test whole files are passed to `wsgi.file_wrapper' if the server
+        provides it, and read by the provider otherwise.
+        """
+
+        wrapped = []
+
+        def file_wrapper(fp, block_size=8192):
+            wrapped.append(fp)
+            return iter(lambda: fp.read(block_size), "")
+
+        response = self.client.get(
+            "/databases/1/items/1.mp3",
+            query_string={"session-id": self.session_id},
+            environ_overrides={"wsgi.file_wrapper": file_wrapper})
+
+        self.assertEqual(response.data, DATA)
+        self.assertEqual(len(wrapped), 1)
+        self.assertTrue(hasattr(wrapped[0], "fileno"))
+
+        response = self.get("/databases/1/items/1.mp3")
+
+        self.assertEqual(response.data, DATA)
+        self.assertEqual(len(wrapped), 1)
+
+    def test_range(self):
+        """
+        Test single byte ranges, including suffix and open-ended ranges.
+        """
+
+        for header, begin, end in [("bytes=2-4", 2, 5), ("bytes=-3", 7, 10),
+                                   ("bytes=-20", 0, 10), ("bytes=6-", 6, 10),
+                                   ("bytes=8-20", 8, 10)]:
+            response = self.get(
+                "/databases/1/items/1.mp3", headers={"Range": header})
+
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(response.data, DATA[begin:end])
+            self.assertEqual(
+                response.headers["Content-Range"],
+                "bytes %d-%d/10" % (begin, end - 1))
+            self.assertEqual(
+                response.headers["Content-Length"], str(end - begin))
+
+    def test_multipart_range(self):
+        """
+        Test multiple byte ranges are answered with a multipart body, with
+        suffix ranges resolved and unsatisfiable ranges dropped.
+        """
+
+        response = self.get(
+            "/databases/1/items/1.mp3",
+            headers={"Range": "bytes=0-2,20-30,-3"})
+
+        self.assertEqual(response.status_code, 206)
+
+        mimetype, boundary = response.headers["Content-Type"].split("; ")
+        boundary = boundary[len("boundary="):]
+
+        self.assertEqual(mimetype, "multipart/byteranges")
+        self.assertEqual(response.data, (
+            "--%(b)s\r\nContent-Type: audio/mp3\r\n"
+            "Content-Range: bytes 0-2/10\r\n\r\n012\r\n"
+            "--%(b)s\r\nContent-Type: audio/mp3\r\n"
+            "Content-Range: bytes 7-9/10\r\n\r\n789\r\n"
+            "--%(b)s--\r\n") % {"b": boundary})
+
+    def test_coalesced_range(self):
+        """
+        Test overlapping and adjacent byte ranges are coalesced, and too many
+        ranges are ignored.
+        """
+
+        response = self.get(
+            "/databases/1/items/1.mp3",
+            headers={"Range": "bytes=0-2,3-3,4-6"})
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.data, DATA[0:7])
+        self.assertEqual(response.headers["Content-Range"], "bytes 0-6/10")
+
+        self.assertEqual(
+            utils.resolve_byte_ranges(
+                [(0, 1), (2, 3), (4, 5)], 10, max_ranges=2), None)
+        self.assertEqual(
+            utils.resolve_byte_ranges(
+                [(0, 1), (1, 3), (4, 5)], 10, max_ranges=2),
+            [(0, 3), (4, 5)])
+
+    def test_unknown_size_range(self):
+        """
+        Test multiple byte ranges of an item of unknown size are ignored,
+        since the parts cannot be resolved, but a single range is served.
+        """
+
+        self.provider.server.databases[1].items[1].file_size = None
+
+        response = self.get(
+            "/databases/1/items/1.mp3", headers={"Range": "bytes=0-2,6-"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, DATA)
+
+        response = self.get(
+            "/databases/1/items/1.mp3", headers={"Range": "bytes=2-4"})
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.data, DATA[2:5])
+        self.assertEqual(response.headers["Content-Range"], "bytes 2-4/*")
+
+    def test_unsatisfiable_range(self):
+        """
+        Test byte ranges that start after the end of the file are answered
+        with 416, and invalid headers are ignored.
+        """
+
+        for header in ("bytes=10-", "bytes=20-30,40-"):
+            response = self.get(
+                "/databases/1/items/1.mp3", headers={"Range": header})
+
+            self.assertEqual(response.status_code, 416)
+            self.assertEqual(response.headers["Content-Range"], "bytes */10")
+
+        response = self.get(
+            "/databases/1/items/1.mp3", headers={"Range": "bytes=5-2"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, DATA)
+
+    def assertConditional(self, path, **kwargs):
+        """
+        Assert a path is answered with an entity tag, and with 304 if the
+        client has the representation already. Return the entity tag.
+        """
+
+        response = self.get(path, **kwargs)
+        etag, _ = response.get_etag()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(etag)
+
+        response = self.get(
+            path, headers={"If-None-Match": '"%s"' % etag}, **kwargs)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, "")
+        self.assertEqual(response.get_etag(), (etag, False))
+
+        return etag
+
+    def test_conditional_listing(self):
+        """
+        Test conditional requests for listings, until the provider publishes
+        a new revision.
+        """
+
+        for path in ("/databases", "/databases/1/items"):
+            etag = self.assertConditional(
+                path, type="music", **{"revision-number": 1, "delta": 0})
+
+            self.provider.update()
+
+            response = self.get(
+                path, headers={"If-None-Match": '"%s"' % etag},
+                type="music", **{"revision-number": 1, "delta": 0})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.get_etag()[0], etag)
+
+    def test_conditional_item(self):
+        """
+        Test conditional requests for items, until the file changes.
+        """
+
+        etag = self.assertConditional("/databases/1/items/1.mp3")
+
+        with open(self.file_name, "wb") as fp:
+            fp.write(DATA[::-1])
+
+        mtime = os.path.getmtime(self.file_name) + 10
+        os.utime(self.file_name, (mtime, mtime))
+
+        response = self.get(
+            "/databases/1/items/1.mp3",
+            headers={"If-None-Match": '"%s"' % etag})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, DATA[::-1])
+
+    def test_conditional_artwork(self):
+        """
+        Test conditional requests for artwork, until the file changes.
+        """
+
+        item = self.provider.server.databases[1].items[1]
+        item.album_art = self.file_name
+
+        path = "/databases/1/items/1/extra_data/artwork"
+        etag = self.assertConditional(path, mw=10, mh=10)
+
+        # The content hash of the artwork is known now.
+        self.assertEqual(
+            self.assertConditional(path, mw=10, mh=10),
+            hashlib.sha1(DATA).hexdigest() + "-10x10")
+
+        with open(self.file_name, "wb") as fp:
+            fp.write(DATA[::-1])
+
+        mtime = os.path.getmtime(self.file_name) + 10
+        os.utime(self.file_name, (mtime, mtime))
+
+        response = self.get(
+            path, headers={"If-None-Match": '"%s"' % etag}, mw=10, mh=10)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, DATA[::-1])
+        self.assertEqual(
+            response.get_etag()[0],
+            hashlib.sha1(DATA[::-1]).hexdigest() + "-10x10")
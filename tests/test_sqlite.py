@@ -0,0 +1,139 @@
+from daapserver.sqlite import SQLiteProvider
+from daapserver.models import Item, Container, ContainerItem
+
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class TestSQLiteProvider(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Initialize a provider with one database and a few items.
+        """
+
+        self.provider = SQLiteProvider()
+        self.provider.put_database(1, "Library")
+        self.provider.update()
+
+        self.database = self.provider.server.databases[1]
+
+        self.provider.put_items(1, [
+            Item(id=i, name="Item %d" % i, artist="Artist", duration=i)
+            for i in range(1, 6)])
+        self.provider.put_containers(1, [
+            Container(id=1, name="My Music", is_base=True)])
+        self.provider.put_container_items(1, 1, [
+            ContainerItem(id=i, item_id=i) for i in range(1, 6)])
+        self.provider.update()
+
+    def test_count_and_load(self):
+        """
+        Test counting and (point) loading items.
+        """
+
+        items = self.database.items
+
+        self.assertEqual(len(items), 5)
+
+        item = items[3]
+
+        self.assertEqual(item.name, "Item 3")
+        self.assertEqual(item.duration, 3)
+        self.assertEqual(item.database_id, 1)
+        self.assertIsNone(item.album)
+
+        self.assertTrue(5 in items)
+        self.assertFalse(6 in items)
+        self.assertListEqual(sorted(items.keys()), [1, 2, 3, 4, 5])
+
+        container = self.database.containers[1]
+
+        self.assertTrue(container.is_base)
+        self.assertEqual(len(container.container_items), 5)
+        self.assertEqual(container.container_items[2].item_id, 2)
+
+    def test_revisions(self):
+        """
+        Test that writes are recorded as changes.
+        """
+
+        items = self.database.items
+        revision = self.provider.revision
+
+        self.provider.put_items(1, [Item(id=2, name="Item 2, edited")])
+        self.provider.delete_items(1, [4])
+        self.provider.update()
+
+        self.assertListEqual(
+            list(items(self.provider.revision).updated(items(revision))),
+            [2])
+        self.assertListEqual(
+            list(items(self.provider.revision).removed(items(revision))),
+            [4])
+
+        self.assertEqual(items[2].name, "Item 2, edited")
+        self.assertEqual(len(items), 4)
+        self.assertFalse(4 in items)
+
+    def test_container_items_history(self):
+        """
+        Test that reloading a container keeps its container items.
+        """
+
+        container = self.database.containers[1]
+        container_items = container.container_items
+
+        self.provider.delete_container_items(1, 1, [5])
+        self.provider.update()
+
+        self.assertIs(
+            self.database.containers[1].container_items, container_items)
+        self.assertEqual(len(container_items), 4)
+
+    def test_reopen(self):
+        """
+        Test that databases are restored from a file.
+        """
+
+        directory = tempfile.mkdtemp()
+        file_name = os.path.join(directory, "library.db")
+
+        try:
+            provider = SQLiteProvider(file_name)
+            provider.put_database(1, "Library")
+            provider.put_items(1, [Item(id=1, name="Item 1")])
+
+            provider = SQLiteProvider(file_name)
+            database = provider.server.databases[1]
+
+            self.assertEqual(database.name, "Library")
+            self.assertEqual(database.items[1].name, "Item 1")
+        finally:
+            shutil.rmtree(directory)
+
+    def test_reopen_count(self):
+        """
+        Test that revisions count all items after reopening, when only some
+        items are loaded.
+        """
+
+        directory = tempfile.mkdtemp()
+        file_name = os.path.join(directory, "library.db")
+
+        try:
+            provider = SQLiteProvider(file_name)
+            provider.put_database(1, "Library")
+            provider.put_items(1, [
+                Item(id=i, name="Item %d" % i) for i in range(1, 101)])
+
+            provider = SQLiteProvider(file_name)
+            items = provider.server.databases[1].items
+
+            self.assertEqual(items[1].name, "Item 1")
+            self.assertEqual(len(items.store.lookup), 1)
+            self.assertEqual(len(items(provider.revision)), 100)
+        finally:
+            shutil.rmtree(directory)
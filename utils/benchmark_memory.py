@@ -0,0 +1,99 @@
+from daapserver.models import Server, Database, Item
+from daapserver.collection import MutableCollection
+
+import sys
+import time
+import resource
+import argparse
+import subprocess
+
+
+def parse_arguments():
+    """
+    Parse commandline arguments.
+    """
+
+    parser = argparse.ArgumentParser()
+
+    # Add options
+    parser.add_argument(
+        "-n", "--number", action="store", default=200000, type=int,
+        help="number of items")
+    parser.add_argument(
+        "-m", "--mode", action="store", default="all",
+        choices=["all", "interned", "plain"],
+        help="store items with or without interning their strings")
+
+    # Parse command line
+    return parser.parse_args(), parser
+
+
+def create_items(count):
+    """
+    Yield `count' items with realistic repetition: 1,000 artists with 10
+    albums each. Every string is a new instance, as if it was read from a
+    file or database.
+    """
+
+    for i in xrange(1, count + 1):
+        artist = i % 1000
+        album = i % 10000
+
+        yield Item(
+            id=i, name=u"Item %d" % i, artist=u"Artist %d" % artist,
+            album=u"Album %d" % album, album_artist=u"Artist %d" % artist,
+            genre=u"Genre %d" % (artist % 20), file_type=u"audio/mpeg",
+            file_suffix=u"mp3", track=i % 15, year=2000 + album % 20,
+            bitrate=320, duration=i, file_size=i * 1024)
+
+
+def benchmark(count, mode):
+    """
+    Add `count' items to a database and report the maximum resident set
+    size. Only one mode can be measured per process.
+    """
+
+    server = Server(name="Benchmark")
+    database = Database(id=1, name="Library")
+    server.databases.add(database)
+
+    # A plain collection does not intern the strings.
+    if mode == "plain":
+        database.items = MutableCollection(database)
+        database.attach(database.items)
+
+    start = time.time()
+
+    for item in create_items(count):
+        database.items.add(item)
+
+    server.commit(2)
+    server.clean(2)
+
+    end = time.time()
+    memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+    sys.stdout.write("%-10s %d items %10.4f seconds %10.2f MB\n" % (
+        mode, count, end - start, memory))
+
+
+def main():
+    """
+    Run the benchmark for each mode, in a separate process.
+    """
+
+    # Parse arguments and configure application instance.
+    arguments, parser = parse_arguments()
+
+    if arguments.mode != "all":
+        return benchmark(arguments.number, arguments.mode)
+
+    for mode in ("plain", "interned"):
+        subprocess.check_call([
+            sys.executable, __file__, "-n", str(arguments.number), "-m",
+            mode])
+
+
+# E.g. `python benchmark_memory.py [-n <items>] [-m <mode>]`
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+from daapserver.models import Server, Database, Item
+from daapserver.sqlite import SQLiteProvider, SQLiteItemCollection, \
+    SQLiteDatabase
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import contextlib
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+    sys.stderr.write("Memory usage info disabled. Install psutils first.\n")
+
+
+class BoundedItemCollection(SQLiteItemCollection):
+    """
+    Item collection that keeps at most 10,000 items in memory.
+    """
+
+    max_resident_items = 10000
+
+
+class BoundedDatabase(SQLiteDatabase):
+    """
+    Database that uses the bounded item collection.
+    """
+
+    __slots__ = SQLiteDatabase.__slots__
+
+    items_collection_class = BoundedItemCollection
+
+
+class BoundedProvider(SQLiteProvider):
+    """
+    Provider that uses the bounded database.
+    """
+
+    database_class = BoundedDatabase
+
+
+def parse_arguments():
+    """
+    Parse commandline arguments.
+    """
+
+    parser = argparse.ArgumentParser()
+
+    # Add options
+    parser.add_argument(
+        "-n", "--number", action="append", type=int,
+        help="number of items (can be repeated)")
+    parser.add_argument(
+        "-l", "--lookups", action="store", default=10000, type=int,
+        help="number of random lookups")
+    parser.add_argument(
+        "-b", "--backend", action="store", default="all",
+        choices=["all", "memory", "sqlite"], help="backend to benchmark")
+
+    # Parse command line
+    return parser.parse_args(), parser
+
+
+@contextlib.contextmanager
+def measure(test):
+    """
+    Measure the time and memory usage of a test.
+    """
+
+    start = time.time()
+
+    yield
+
+    end = time.time()
+
+    # Measure memory, if psutil is installed and loaded.
+    if psutil:
+        memory = psutil.Process().memory_info()[0] / 1024.0 / 1024.0
+    else:
+        memory = 0.0
+
+    sys.stdout.write("%-40s %10.4f seconds %10.2f MB\n" % (
+        test, end - start, memory))
+
+
+def create_items(count):
+    """
+    Yield `count' items.
+    """
+
+    for i in xrange(1, count + 1):
+        yield Item(
+            id=i, artist="SubDaap", album="Benchmark", name="Item %d" % i,
+            duration=i, bitrate=320, year=2014)
+
+
+def benchmark_memory(count, lookups):
+    """
+    Benchmark the in-memory `MutableCollection'.
+    """
+
+    server = Server(name="Benchmark")
+    database = Database(id=1, name="Library")
+    server.databases.add(database)
+
+    with measure("memory: add %d items" % count):
+        for item in create_items(count):
+            database.items.add(item)
+
+        server.commit(2)
+        server.clean(2)
+
+    with measure("memory: count"):
+        len(database.items)
+
+    with measure("memory: iterate"):
+        for _ in database.items.itervalues():
+            pass
+
+    with measure("memory: %d random lookups" % lookups):
+        for _ in xrange(lookups):
+            database.items[random.randint(1, count)]
+
+
+def benchmark_sqlite(count, lookups):
+    """
+    Benchmark the SQLite-backed collection, with bounded residency.
+    """
+
+    directory = tempfile.mkdtemp()
+    file_name = os.path.join(directory, "benchmark.db")
+
+    try:
+        provider = BoundedProvider(file_name, server_name="Benchmark")
+        provider.put_database(1, "Library")
+        provider.update()
+
+        with measure("sqlite: add %d items" % count):
+            provider.put_items(1, create_items(count))
+            provider.update()
+
+        # Re-open, so nothing is resident.
+        provider = BoundedProvider(file_name, server_name="Benchmark")
+        database = provider.server.databases[1]
+
+        with measure("sqlite: count"):
+            len(database.items)
+
+        with measure("sqlite: iterate"):
+            for _ in database.items.itervalues():
+                pass
+
+        with measure("sqlite: %d random lookups" % lookups):
+            for _ in xrange(lookups):
+                database.items[random.randint(1, count)]
+    finally:
+        os.remove(file_name)
+        os.rmdir(directory)
+
+
+def main():
+    """
+    Run a benchmark for each N items. If N is not specified, take 100,000 and
+    1,000,000 for N.
+    """
+
+    # Parse arguments and configure application instance.
+    arguments, parser = parse_arguments()
+
+    for count in arguments.number or [100000, 1000000]:
+        if arguments.backend in ("all", "memory"):
+            benchmark_memory(count, arguments.lookups)
+
+        if arguments.backend in ("all", "sqlite"):
+            benchmark_sqlite(count, arguments.lookups)
+
+
+# E.g. `python benchmark_sqlite.py [-n <items>] [-l <lookups>] [-b <backend>]`
+if __name__ == "__main__":
+    sys.exit(main())